@@ -62,7 +62,7 @@ fi
 # Install Python dependencies
 echo "Installing Python dependencies..."
 cd $APP_DIR
-uv sync
+uv sync --extra fastjson
 
 # Create data directory for eval runs
 sudo mkdir -p /var/lib/llm-eval
@@ -84,6 +84,23 @@ OPENAI_API_KEY=your-openai-api-key-here
 
 # Data directory for eval runs
 EVAL_RUNS_DIR=/var/lib/llm-eval
+# Live progress of running evaluations (shared by the CLI and the API)
+EVAL_LIVE_DIR=/var/lib/llm-eval/live
+
+# Job queue for runs started from the API (shared with llm-eval-worker)
+EVAL_QUEUE_PATH=/var/lib/llm-eval/queue.db
+
+# Or select the store by URL (takes precedence over EVAL_RUNS_DIR), e.g.
+# EVAL_STORE_URL=file:///var/lib/llm-eval?format=compact&compression=zstd
+# EVAL_STORE_URL=sqlite:////var/lib/llm-eval/runs.db
+
+# Commit recorded with each run when the app directory is not a git
+# checkout (otherwise detected once per process)
+# EVAL_GIT_COMMIT=abc1234
+# EVAL_GIT_DIRTY=0
+
+# LangSmith tracing of model calls: off, sample:P, errors or full
+# EVAL_TRACING=sample:0.05
 EOF
     echo "NOTE: Edit $ENV_FILE to add your API keys"
 fi
@@ -91,8 +108,9 @@ fi
 # Install systemd service
 echo "Installing systemd service..."
 sudo cp $APP_DIR/deploy/llm-eval.service /etc/systemd/system/
+sudo cp $APP_DIR/deploy/llm-eval-worker.service /etc/systemd/system/
 sudo systemctl daemon-reload
-sudo systemctl enable llm-eval
+sudo systemctl enable llm-eval llm-eval-worker
 
 echo ""
 echo "=========================================="
@@ -101,7 +119,7 @@ echo "=========================================="
 echo ""
 echo "Next steps:"
 echo "1. Edit /opt/llm-eval/.env and add your OPENAI_API_KEY"
-echo "2. Start the service: sudo systemctl start llm-eval"
+echo "2. Start the services: sudo systemctl start llm-eval llm-eval-worker"
 echo "3. Check status: sudo systemctl status llm-eval"
 echo "4. View logs: sudo journalctl -u llm-eval -f"
 echo ""
@@ -1,27 +1,32 @@
 import argparse
 import sys
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from src.clients import get_client
+from src.clients import get_client, get_client_registry
+from src.clients.tracing import set_default_tracing_policy
+from src.queue import get_job_queue
 from src.runner.compare import compare_runs
-from src.runner.loader import load_suite
-from src.runner.runner import Runner
-from src.store.local import LocalStore
+from src.runner.live import LiveRun, prune_live_runs
+from src.runner.loader import list_suite_paths, load_suite
+from src.runner.rescore import rescore_runs
+from src.runner.runner import RunAborted, Runner
+from src.runner.shard import ShardFailed, run_sharded
+from src.store.buffered import BufferedStore
+from src.store.factory import get_store
 
 load_dotenv()
 
 
 def get_all_suite_paths(suites_dir: Path | None = None) -> list[Path]:
-    """Discover all YAML suite files in the given directory."""
+    """Discover all suite files (YAML and JSONL) in the given directory."""
     if suites_dir is None:
         suites_dir = Path(__file__).parent / "datasets" / "examples"
-    
-    if not suites_dir.exists():
-        return []
-    
-    return sorted(suites_dir.glob("*.yaml"))
+
+    return list_suite_paths(suites_dir)
 
 
 def print_run(run):
@@ -40,6 +45,26 @@ def print_run(run):
         if result.reasons:
             print(f"  Reasons: {result.reasons}")
 
+    print()
+    print(format_stats(run.stats))
+
+
+def format_stats(stats):
+    parts = [f"Tokens: {stats.prompt_tokens} in / {stats.completion_tokens} out"]
+    if stats.judge_tokens:
+        parts.append(f"Judge tokens: {stats.judge_tokens}")
+    if stats.mean_latency_ms is not None:
+        parts.append(
+            f"Latency: {stats.mean_latency_ms:.0f} ms mean / {stats.p95_latency_ms:.0f} ms p95"
+        )
+    if stats.mean_ttft_ms is not None:
+        parts.append(f"TTFT: {stats.mean_ttft_ms:.0f} ms")
+    if stats.mean_tokens_per_second is not None:
+        parts.append(f"{stats.mean_tokens_per_second:.1f} tok/s")
+    if stats.cost_usd is not None:
+        parts.append(f"Cost: ${stats.cost_usd:.4f}")
+    return " | ".join(parts)
+
 
 def print_comparison(comparison, baseline, current):
     print("Comparing runs:")
@@ -75,14 +100,89 @@ def list_runs(store):
     print(f"Stored runs ({len(runs)}):")
     print()
     for run in runs:
-        passed = sum(1 for r in run.results if r.passed)
-        total = len(run.results)
+        stats = run.stats
         print(f"  {run.id}")
         print(f"    Suite: {run.suite_id} | Model: {run.model}")
-        print(f"    Results: {passed}/{total} passed | {run.timestamp.strftime('%Y-%m-%d %H:%M')}")
+        print(f"    Results: {stats.passed}/{stats.total} passed | {run.timestamp.strftime('%Y-%m-%d %H:%M')}")
+        print(f"    {format_stats(stats)}")
         print()
 
 
+def rescore(store, suite_paths, models, workers, fail_fast):
+    suites = {}
+    for suite_path in suite_paths:
+        suite = load_suite(str(suite_path))
+        suites[suite["id"]] = suite
+
+    # Only original runs are re-scored; earlier re-scorings are superseded
+    runs = (
+        run
+        # Every selected run's results are used, so read each file only once
+        for run in store.iter_runs(load_results=True)
+        if run.suite_id in suites
+        and run.rescored_from is None
+        and (not models or run.model in models)
+    )
+
+    # Judge calls from every scoring thread share one connection pool
+    get_client_registry().resize(workers)
+
+    batch_revision = store.reserve_revision()
+    count = 0
+    for original, rescored in rescore_runs(runs, suites, workers=workers, fail_fast=fail_fast):
+        rescored.revision = batch_revision
+        store.save_run(rescored)
+        count += 1
+
+        before = original.stats
+        after = rescored.stats
+        print(f"  {original.id} → {rescored.id}")
+        print(f"    Suite: {original.suite_id} | Model: {original.model}")
+        print(f"    Results: {before.passed}/{before.total} → {after.passed}/{after.total} passed")
+
+    print()
+    print(f"Re-scored {count} run(s) at revision {batch_revision}.")
+
+
+def run_live(suite, model, system_prompt_name, stream):
+    """Run a suite in this process, publishing progress (see GET /api/live)."""
+    runner = Runner(client=get_client(model), stream=stream)  # Scorer auto-selected from suite config
+    run_id = str(uuid.uuid4())
+    live = LiveRun(run_id, suite["id"], model, len(suite.get("cases", [])))
+    print(f"Run {run_id} started")
+    try:
+        run = runner.run(
+            suite,
+            system_prompt_name=system_prompt_name,
+            run_id=run_id,
+            on_result=live.on_result,
+            should_abort=live.should_abort,
+        )
+    except RunAborted as e:
+        live.finish("aborted")
+        print(f"Run {run_id} aborted after {len(e.run.results)} case(s); not saved.")
+        return None
+    except BaseException:
+        live.finish("failed")
+        raise
+    live.finish()
+    return run
+
+
+def export_results(store, out_dir, suite_paths):
+    from src.store.parquet import export_parquet
+
+    categories = {}
+    for suite_path in suite_paths:
+        suite = load_suite(str(suite_path))
+        for case in suite.get("cases", []):
+            if "category" in case:
+                categories[(suite["id"], case["id"])] = case["category"]
+
+    written = export_parquet(store.iter_runs(), out_dir, categories)
+    print(f"Exported {written} new run(s) to {out_dir}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run LLM evaluation suites")
     parser.add_argument(
@@ -114,15 +214,88 @@ def main():
         "--system-prompt",
         help="System prompt name to use (e.g., 'assistant-prompt-v2')"
     )
+    parser.add_argument(
+        "--rescore", action="store_true",
+        help="Re-score stored runs of the selected suites with the current "
+             "suite rules, without calling any models"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8,
+        help="Parallel scoring processes for --rescore (threads for suites "
+             "with an LLM judge; default: 8)"
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true",
+        help="With --rescore, stop rule checks at the first failure per case"
+    )
+    parser.add_argument(
+        "--export-parquet", metavar="DIR",
+        help="Export all stored results to a partitioned Parquet dataset "
+             "(incremental; requires the 'analytics' extra)"
+    )
+    parser.add_argument(
+        "--store", metavar="URL",
+        help="Run store, e.g. a directory, file:///var/lib/llm-eval or "
+             "sqlite:///runs.db (default: $EVAL_STORE_URL, $EVAL_RUNS_DIR "
+             "or .eval_runs)"
+    )
+    parser.add_argument(
+        "--compact-older-than", type=int, metavar="DAYS",
+        help="Archive stored runs older than DAYS days into compressed "
+             "monthly segments (they stay listed and loadable)"
+    )
+    parser.add_argument(
+        "--migrate-store", action="store_true",
+        help="Move runs from the legacy flat layout into suite/month shards"
+    )
+    parser.add_argument(
+        "--shard-size", type=int, metavar="CASES",
+        help="Split each suite into shards of CASES cases run by queue "
+             "workers (python -m src.runner.worker), then merge them"
+    )
+    parser.add_argument(
+        "--tracing", metavar="POLICY",
+        help="LangSmith tracing of model and judge calls: off, sample:P "
+             "(trace a fraction P of calls), errors or full "
+             "(default: $EVAL_TRACING or full)"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream generations to measure time-to-first-token and stop "
+             "early once a length rule has already failed"
+    )
     args = parser.parse_args()
 
-    store = LocalStore()
+    if args.tracing:
+        try:
+            set_default_tracing_policy(args.tracing)
+        except ValueError as e:
+            parser.error(str(e))
+
+    store = get_store(args.store)
 
     # List runs
     if args.list:
         list_runs(store)
         return
 
+    # Store maintenance
+    if args.migrate_store or args.compact_older_than is not None:
+        if not hasattr(store, "compact"):
+            parser.error("--migrate-store and --compact-older-than need a file store")
+        if args.migrate_store:
+            print(f"Migrated {store.migrate()} run(s).")
+        if args.compact_older_than is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=args.compact_older_than)
+            print(f"Archived {store.compact(cutoff)} run(s) older than {cutoff:%Y-%m-%d}.")
+        return
+
+    # Export results for analysis
+    if args.export_parquet:
+        suites_dir = Path(args.suites_dir) if args.suites_dir else None
+        export_results(store, args.export_parquet, get_all_suite_paths(suites_dir))
+        return
+
     # Compare runs
     if args.compare:
         baseline_id, current_id = args.compare
@@ -156,10 +329,20 @@ def main():
     else:
         parser.error("--suite or --all-suites is required when running evaluations")
 
+    # Runs are saved on a background thread while the next ones execute
+    store = BufferedStore(store)
+
+    if args.rescore:
+        rescore(store, suite_paths, args.model, args.workers, args.fail_fast)
+        store.close()
+        return
+
     models = args.model if args.model else ["gpt-4o-mini"]
 
-    # Calculate revision once for entire batch - all runs share the same revision
-    batch_revision = store.get_next_revision()
+    prune_live_runs()
+
+    # Reserve revision once for entire batch - all runs share the same revision
+    batch_revision = store.reserve_revision()
 
     for suite_path in suite_paths:
         suite = load_suite(str(suite_path))
@@ -168,12 +351,27 @@ def main():
         print()
 
         for model in models:
-            client = get_client(model)
-            runner = Runner(client=client)  # Scorer auto-selected from suite config
-            run = runner.run(
-                suite,
-                system_prompt_name=args.system_prompt,
-            )
+            if args.shard_size:
+                print(f"Running {model} on queue workers in shards of {args.shard_size} case(s)")
+                try:
+                    run = run_sharded(
+                        get_job_queue(),
+                        suite_path,
+                        model,
+                        args.shard_size,
+                        system_prompt_name=args.system_prompt,
+                        stream=args.stream,
+                        tracing=args.tracing,
+                    )
+                except ShardFailed as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    print("-" * 40)
+                    continue
+            else:
+                run = run_live(suite, model, args.system_prompt, args.stream)
+                if run is None:
+                    print("-" * 40)
+                    continue
             run.revision = batch_revision  # Assign shared revision
             store.save_run(run)
             print_run(run)
@@ -181,6 +379,8 @@ def main():
 
         print()
 
+    store.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,41 @@
+"""JSON responses with a fast encoder and pre-serialized bodies."""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # Optional: `uv sync --extra fastjson`
+    orjson = None
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Serialize plain JSON data (dicts, lists, str, numbers, bool, None).
+
+    Uses orjson when installed, else the standard library without the
+    indentation and separator padding of ``json.dumps`` defaults.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with ``render_json``.
+
+    Bytes are passed through unchanged, so a body serialized once (and
+    cached) can be served again without re-encoding. Handlers should return
+    this response directly: returning a dict from a route makes FastAPI run
+    ``jsonable_encoder`` over it first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return render_json(content)
@@ -1,14 +1,32 @@
+import asyncio
+from dataclasses import asdict
+from functools import cache, partial
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.prompts import list_prompts
+from src.api.responses import FastJSONResponse, render_json
+from src.clients.tracing import parse_tracing_policy
+from src.prompts import list_prompts, prompt_exists
+from src.queue import get_job_queue
 from src.runner.compare import compare_runs
-from src.runner.loader import load_suite
-from src.store.local import LocalStore
+from src.runner.live import (
+    get_live_dir,
+    is_stale,
+    is_valid_run_id,
+    list_live_runs,
+    read_events,
+    request_abort,
+)
+from src.runner.loader import find_suite_path, list_suites, load_suite
+from src.runner.worker import RUN_JOB
+from src.store.aio import AsyncStore
+from src.store.factory import get_store
 
-app = FastAPI(title="LLM Eval API")
+app = FastAPI(title="LLM Eval API", default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,34 +39,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-store = LocalStore()
-
+# Store reads run off the event loop; see AsyncStore for the caching
+store = AsyncStore(get_store())
 
-@app.get("/api/runs")
-def list_runs():
-    runs = store.list_runs()
-    return [
-        {
-            "id": run.id,
-            "suite_id": run.suite_id,
-            "model": run.model,
-            "timestamp": run.timestamp.isoformat(),
-            "passed": sum(1 for r in run.results if r.passed),
-            "total": len(run.results),
-            "system_prompt_name": run.system_prompt_name,
-            "revision": run.revision,
-            "git_commit_hash": run.git_commit_hash,
-        }
-        for run in runs
-    ]
 
+def _run_summary(run) -> dict:
+    stats = run.stats
+    return {
+        "id": run.id,
+        "suite_id": run.suite_id,
+        "model": run.model,
+        "timestamp": run.timestamp.isoformat(),
+        "passed": stats.passed,
+        "total": stats.total,
+        "system_prompt_name": run.system_prompt_name,
+        "revision": run.revision,
+        "git_commit_hash": run.git_commit_hash,
+        "rescored_from": run.rescored_from,
+        "prompt_tokens": stats.prompt_tokens,
+        "completion_tokens": stats.completion_tokens,
+        "judge_tokens": stats.judge_tokens,
+        "cost_usd": stats.cost_usd,
+        "mean_latency_ms": stats.mean_latency_ms,
+        "p95_latency_ms": stats.p95_latency_ms,
+        "mean_ttft_ms": stats.mean_ttft_ms,
+        "mean_tokens_per_second": stats.mean_tokens_per_second,
+    }
 
-@app.get("/api/runs/{run_id}")
-def get_run(run_id: str):
-    run = store.get_run(run_id)
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
 
+def _run_detail(run) -> dict:
     return {
         "id": run.id,
         "suite_id": run.suite_id,
@@ -57,6 +76,8 @@ def get_run(run_id: str):
         "system_prompt_name": run.system_prompt_name,
         "revision": run.revision,
         "git_commit_hash": run.git_commit_hash,
+        "rescored_from": run.rescored_from,
+        "environment": run.environment,
         "results": [
             {
                 "id": r.id,
@@ -67,16 +88,170 @@ def get_run(run_id: str):
                 "score": r.score,
                 "reasons": r.reasons,
                 "system_prompt_name": r.system_prompt_name,
+                "latency_ms": r.latency_ms,
+                "ttft_ms": r.ttft_ms,
+                "tokens_per_second": r.tokens_per_second,
+                "finish_reason": r.finish_reason,
+                "prompt_tokens": r.prompt_tokens,
+                "completion_tokens": r.completion_tokens,
+                "judge_tokens": r.judge_tokens,
+                "cost_usd": r.cost_usd,
             }
             for r in run.results
         ],
     }
 
 
+def _render_runs(sync_store) -> bytes:
+    return render_json([_run_summary(run) for run in sync_store.list_runs()])
+
+
+def _render_run(run_id: str, sync_store) -> bytes | None:
+    run = sync_store.get_run(run_id)
+    return render_json(_run_detail(run)) if run else None
+
+
+# Response bodies are serialized once and served from the store cache until
+# the store changes, so repeat requests skip building and encoding them.
+
+
+@app.get("/api/runs")
+async def list_runs():
+    return FastJSONResponse(await store.cached(("runs",), _render_runs))
+
+
+@app.get("/api/runs/{run_id}")
+async def get_run(run_id: str):
+    body = await store.cached(("run", run_id), partial(_render_run, run_id))
+    if body is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return FastJSONResponse(body)
+
+
+@cache
+def _job_queue():
+    """Open the job queue on first use, so importing the app creates no files."""
+    return get_job_queue()
+
+
+class RunRequest(BaseModel):
+    suite_id: str
+    models: list[str] = Field(default_factory=lambda: ["gpt-4o-mini"], min_length=1)
+    system_prompt: str | None = None
+    stream: bool = False
+    tracing: str | None = None  # Tracing policy, e.g. "off" or "sample:0.1"
+
+
+@app.post("/api/runs", status_code=202)
+async def create_run(request: RunRequest):
+    """Queue a suite for evaluation by the worker pool."""
+    if find_suite_path(request.suite_id) is None:
+        raise HTTPException(status_code=404, detail="Suite not found")
+    if request.system_prompt and not prompt_exists(request.system_prompt):
+        raise HTTPException(status_code=400, detail="System prompt not found")
+    if request.tracing is not None:
+        try:
+            parse_tracing_policy(request.tracing)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    job_id = await asyncio.to_thread(_job_queue().put, RUN_JOB, request.model_dump())
+    return FastJSONResponse({"job_id": job_id, "status": "queued"}, status_code=202)
+
+
+@app.get("/api/jobs")
+async def list_jobs(limit: int = 100):
+    jobs = await asyncio.to_thread(_job_queue().list, RUN_JOB, limit)
+    return FastJSONResponse([asdict(job) for job in jobs])
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = await asyncio.to_thread(_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return FastJSONResponse(asdict(job))
+
+
+@app.post("/api/jobs/{job_id}/cancel", status_code=202)
+async def cancel_job(job_id: str):
+    """Cancel a queued job, or ask a running one to stop after its current case."""
+    if not await asyncio.to_thread(_job_queue().cancel, job_id):
+        raise HTTPException(status_code=404, detail="Job not found or already finished")
+    job = await asyncio.to_thread(_job_queue().get, job_id)
+    return FastJSONResponse(asdict(job), status_code=202)
+
+
+LIVE_POLL_SECONDS = 0.5
+LIVE_HEARTBEAT_SECONDS = 15.0
+
+
+def _sse(event: dict) -> bytes:
+    return b"event: " + event["type"].encode() + b"\ndata: " + render_json(event) + b"\n\n"
+
+
+@app.get("/api/live")
+async def list_live():
+    """List in-flight runs with their latest progress counters."""
+    return FastJSONResponse(await asyncio.to_thread(list_live_runs))
+
+
+@app.get("/api/live/{run_id}/events")
+async def live_events(run_id: str):
+    """
+    Stream a run's progress as Server-Sent Events.
+
+    Events already published are replayed first, then new ones are sent as
+    the runner produces them; the stream closes after the ``end`` event.
+    """
+    if not is_valid_run_id(run_id):
+        raise HTTPException(status_code=400, detail="Invalid run_id")
+    path = get_live_dir() / f"{run_id}.jsonl"
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Live run not found")
+
+    async def stream():
+        offset = 0
+        idle = 0.0
+        while True:
+            events, offset = await asyncio.to_thread(read_events, path, offset)
+            for event in events:
+                yield _sse(event)
+                if event["type"] == "end":
+                    return
+            if events:
+                idle = 0.0
+                continue
+            if is_stale(path):
+                # The runner died without reporting the end of the run
+                yield _sse({"type": "end", "status": "stale"})
+                return
+            await asyncio.sleep(LIVE_POLL_SECONDS)
+            idle += LIVE_POLL_SECONDS
+            if idle >= LIVE_HEARTBEAT_SECONDS:
+                yield b": keep-alive\n\n"
+                idle = 0.0
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/live/{run_id}/abort", status_code=202)
+async def abort_live_run(run_id: str):
+    """Ask an in-flight run to stop after its current case."""
+    if not await asyncio.to_thread(request_abort, run_id):
+        raise HTTPException(status_code=404, detail="Live run not found")
+    return FastJSONResponse({"run_id": run_id, "abort_requested": True}, status_code=202)
+
+
 @app.get("/api/compare")
-def compare(baseline: str, current: str):
-    baseline_run = store.get_run(baseline)
-    current_run = store.get_run(current)
+async def compare(baseline: str, current: str):
+    baseline_run, current_run = await asyncio.gather(
+        store.get_run(baseline), store.get_run(current)
+    )
 
     if not baseline_run:
         raise HTTPException(status_code=404, detail=f"Baseline run '{baseline}' not found")
@@ -88,7 +263,7 @@ def compare(baseline: str, current: str):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    return {
+    return FastJSONResponse({
         "baseline_run_id": comparison.baseline_run_id,
         "current_run_id": comparison.current_run_id,
         "regressions": comparison.regressions,
@@ -106,13 +281,13 @@ def compare(baseline: str, current: str):
             }
             for c in comparison.cases
         ],
-    }
+    })
 
 
 @app.get("/api/system-prompts")
-def get_system_prompts():
+async def get_system_prompts():
     """List all available system prompts."""
-    return list_prompts()
+    return FastJSONResponse(await asyncio.to_thread(list_prompts))
 
 
 def _get_suites_dir() -> Path:
@@ -120,20 +295,25 @@ def _get_suites_dir() -> Path:
     return Path(__file__).resolve().parent.parent.parent / "datasets" / "examples"
 
 
+@app.get("/api/suites")
+async def get_suites():
+    """List every suite's metadata (no cases), from the cached suite index."""
+    return FastJSONResponse(await asyncio.to_thread(list_suites, _get_suites_dir()))
+
+
 @app.get("/api/suites/{suite_id}")
-def get_suite(suite_id: str):
-    """Return suite metadata including test cases from the suite YAML file."""
+async def get_suite(suite_id: str):
+    """Return suite metadata including test cases from the suite file."""
     if ".." in suite_id or "/" in suite_id or "\\" in suite_id:
         raise HTTPException(status_code=400, detail="Invalid suite_id")
-    suites_dir = _get_suites_dir()
-    suite_path = suites_dir / f"{suite_id}.yaml"
-    if not suite_path.exists():
+    suite_path = find_suite_path(suite_id, _get_suites_dir())
+    if suite_path is None:
         raise HTTPException(status_code=404, detail="Suite not found")
     try:
-        suite = load_suite(str(suite_path))
+        suite = await asyncio.to_thread(load_suite, str(suite_path))
     except Exception:
         raise HTTPException(status_code=500, detail="Failed to load suite")
-    return {
+    return FastJSONResponse({
         "id": suite.get("id", suite_id),
         "title": suite.get("title") or suite.get("id", suite_id),
         "description": suite.get("description"),
@@ -147,4 +327,4 @@ def get_suite(suite_id: str):
             }
             for case in suite.get("cases", [])
         ],
-    }
+    })
@@ -1,7 +1,14 @@
 """Model clients for LLM providers."""
 
-from src.clients.base import ModelClient, ModelRequest, ModelResponse
-from src.clients.factory import get_client
+from src.clients.base import (
+    ModelClient,
+    ModelRequest,
+    ModelResponse,
+    StreamChunk,
+    StreamingModelClient,
+    consume_stream,
+)
+from src.clients.factory import ClientRegistry, get_client, get_client_registry
 from src.clients.gemini import GeminiClient
 from src.clients.openai import OpenAIClient
 
@@ -9,7 +16,12 @@ __all__ = [
     "ModelClient",
     "ModelRequest",
     "ModelResponse",
+    "StreamChunk",
+    "StreamingModelClient",
+    "consume_stream",
     "OpenAIClient",
     "GeminiClient",
     "get_client",
+    "ClientRegistry",
+    "get_client_registry",
 ]
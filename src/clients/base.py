@@ -1,3 +1,5 @@
+import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -15,7 +17,97 @@ class ModelResponse:
     model: str
     usage: dict
     finish_reason: str
+    ttft_ms: float | None = None  # Time to first token, when streamed
+    tokens_per_second: float | None = None  # Output throughput, when streamed
+
+
+@dataclass
+class StreamChunk:
+    content: str
+    model: str | None = None
+    usage: dict | None = None  # Usually only present on the final chunk
+    finish_reason: str | None = None
 
 
 class ModelClient(Protocol):
     def generate(self, request: ModelRequest) -> ModelResponse: ...
+
+
+class StreamingModelClient(ModelClient, Protocol):
+    def stream(self, request: ModelRequest) -> Iterator[StreamChunk]: ...
+
+
+def consume_stream(
+    chunks: Iterator[StreamChunk],
+    stop_when: Callable[[str], bool] | None = None,
+) -> ModelResponse:
+    """
+    Drain a chunk stream into a ModelResponse, timing it along the way.
+
+    Args:
+        chunks: Iterator returned by a client's ``stream`` method
+        stop_when: Optional predicate over the text received so far; when it
+            returns True the stream is closed and generation is abandoned
+
+    Returns:
+        ModelResponse with ``ttft_ms`` and ``tokens_per_second`` filled in.
+        A stopped stream has ``finish_reason == "cancelled"``. Providers only
+        report usage at the end of a stream, so a cancelled response without
+        it reports its token counts as unknown (None) and falls back to
+        counting content chunks for its throughput.
+    """
+    started = time.perf_counter()
+    first_token_at: float | None = None
+    text = ""
+    content_chunks = 0
+    model = "unknown"
+    usage: dict = {}
+    finish_reason = "stop"
+
+    try:
+        for chunk in chunks:
+            if chunk.model:
+                model = chunk.model
+            if chunk.usage:
+                usage = chunk.usage
+            if chunk.finish_reason:
+                finish_reason = chunk.finish_reason
+            if not chunk.content:
+                continue
+
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            text += chunk.content
+            content_chunks += 1
+
+            if stop_when is not None and stop_when(text):
+                finish_reason = "cancelled"
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+    finished = time.perf_counter()
+
+    if finish_reason == "cancelled" and not usage:
+        # Tokens were generated and billed, but the count never arrived
+        usage = {"prompt_tokens": None, "completion_tokens": None, "total_tokens": None}
+
+    ttft_ms = None
+    tokens_per_second = None
+    if first_token_at is not None:
+        ttft_ms = (first_token_at - started) * 1000
+        generation_seconds = finished - first_token_at
+        output_tokens = usage.get("completion_tokens") or content_chunks
+        if generation_seconds > 0:
+            tokens_per_second = output_tokens / generation_seconds
+
+    return ModelResponse(
+        content=text,
+        model=model,
+        usage=usage,
+        finish_reason=finish_reason,
+        ttft_ms=ttft_ms,
+        tokens_per_second=tokens_per_second,
+    )
@@ -1,26 +1,138 @@
 """Client factory for automatic provider detection."""
 
+import os
+import threading
+
+from src.clients import gemini as gemini_provider
+from src.clients import openai as openai_provider
 from src.clients.base import ModelClient
 from src.clients.gemini import GeminiClient
 from src.clients.openai import OpenAIClient
 
+# Connections kept per provider when EVAL_HTTP_POOL_SIZE is not set; enough
+# for the default number of rescoring threads
+DEFAULT_POOL_SIZE = 8
+
+# Idle connections are kept open this long, so sequential runs reuse them
+# instead of repeating the TLS handshake
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def get_provider(model: str) -> str:
+    """
+    Get the provider serving a model, from its name.
+
+    Model prefix detection:
+        - gemini-* → "gemini"
+        - gpt-*, o1-*, text-*, others → "openai"
+    """
+    return "gemini" if model.startswith("gemini-") else "openai"
+
+
+def create_client(model: str, sdk_client=None) -> ModelClient:
+    """
+    Create a new client for a model.
+
+    Args:
+        model: Model name (e.g., "gpt-4o", "gemini-1.5-flash")
+        sdk_client: Provider SDK client to share (default: a new one)
+    """
+    if get_provider(model) == "gemini":
+        return GeminiClient(model=model, sdk_client=sdk_client)
+    # Default to OpenAI for gpt-*, o1-*, and any other models
+    return OpenAIClient(model=model, sdk_client=sdk_client)
+
+
+class ClientRegistry:
+    """
+    Reuses model clients across runs.
+
+    Holds one client per model and, behind them, one SDK client (and so one
+    keep-alive HTTP connection pool) per provider. Safe to use from several
+    threads.
+    """
+
+    def __init__(self, pool_size: int | None = None):
+        """
+        Args:
+            pool_size: Maximum connections per provider; match it to the
+                number of threads calling models concurrently (default:
+                ``EVAL_HTTP_POOL_SIZE`` or DEFAULT_POOL_SIZE)
+        """
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+        self._sdk_clients: dict[str, object] = {}
+        self._clients: dict[str, ModelClient] = {}
+
+    @property
+    def pool_size(self) -> int:
+        # Read when an SDK client is built, so a value loaded from .env
+        # after import still applies to the process-wide registry
+        return self._pool_size or int(os.environ.get("EVAL_HTTP_POOL_SIZE") or DEFAULT_POOL_SIZE)
+
+    def _http_limits(self):
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        )
+
+    def get(self, model: str) -> ModelClient:
+        """Get the shared client for a model, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(model)
+            if client is None:
+                provider = get_provider(model)
+                sdk_client = self._sdk_clients.get(provider)
+                if sdk_client is None:
+                    module = gemini_provider if provider == "gemini" else openai_provider
+                    sdk_client = module.create_sdk_client(self._http_limits())
+                    self._sdk_clients[provider] = sdk_client
+                client = self._clients[model] = create_client(model, sdk_client)
+            return client
+
+    def resize(self, pool_size: int) -> None:
+        """
+        Change the connection pool size.
+
+        Clients already created keep their pools until ``clear``.
+        """
+        self._pool_size = pool_size
+
+    def clear(self) -> None:
+        """Drop every client, closing their connection pools."""
+        with self._lock:
+            sdk_clients = list(self._sdk_clients.values())
+            self._sdk_clients.clear()
+            self._clients.clear()
+        for sdk_client in sdk_clients:
+            close = getattr(sdk_client, "close", None)
+            if close is not None:
+                close()
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry."""
+    return _registry
+
 
 def get_client(model: str) -> ModelClient:
     """
     Get the appropriate client for a model based on its name.
-    
+
+    Clients come from the process-wide ClientRegistry, so repeated calls for
+    a model return the same client, and models of one provider share an
+    HTTP connection pool.
+
     Args:
         model: Model name (e.g., "gpt-4o", "gemini-1.5-flash")
-        
+
     Returns:
         ModelClient instance configured for the model
-        
-    Model prefix detection:
-        - gemini-* → GeminiClient
-        - gpt-*, o1-*, text-*, others → OpenAIClient
-    """
-    if model.startswith("gemini-"):
-        return GeminiClient(model=model)
-    else:
-        # Default to OpenAI for gpt-*, o1-*, and any other models
-        return OpenAIClient(model=model)
+    """
+    return _registry.get(model)
@@ -1,59 +1,117 @@
 """Google Gemini client implementation using google-genai SDK."""
 
 import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
-from langsmith import traceable
+from src.clients.base import ModelRequest, ModelResponse, StreamChunk
+from src.clients.tracing import traceable
 
-from src.clients.base import ModelRequest, ModelResponse
+if TYPE_CHECKING:
+    from google.genai import types
+
+
+def _usage_to_dict(response) -> dict:
+    """Extract usage metadata from a Gemini response, if available."""
+    if hasattr(response, "usage_metadata") and response.usage_metadata:
+        return {
+            "prompt_tokens": response.usage_metadata.prompt_token_count,
+            "completion_tokens": response.usage_metadata.candidates_token_count,
+            "total_tokens": response.usage_metadata.total_token_count,
+        }
+    return {}
+
+
+def _finish_reason(response) -> str | None:
+    if response.candidates and response.candidates[0].finish_reason:
+        return str(response.candidates[0].finish_reason).lower()
+    return None
+
+
+def create_sdk_client(http_limits=None):
+    """
+    Build a ``google.genai.Client`` from ``GOOGLE_API_KEY``.
+
+    Args:
+        http_limits: ``httpx.Limits`` for the client's connection pool
+            (default: the SDK's)
+    """
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is required")
+    # Imported here so commands that never call a model skip the SDK
+    from google import genai
+    from google.genai import types
+
+    http_options = (
+        types.HttpOptions(client_args={"limits": http_limits}) if http_limits else None
+    )
+    return genai.Client(api_key=api_key, http_options=http_options)
 
 
 class GeminiClient:
     """Client for Google Gemini models."""
 
-    def __init__(self, model: str = "gemini-1.5-flash"):
-        self.default_model = model
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY environment variable is required")
-        self.client = genai.Client(api_key=api_key)
+    def __init__(self, model: str = "gemini-1.5-flash", sdk_client=None):
+        """
+        Args:
+            model: Default model for requests that do not name one
+            sdk_client: Client from ``create_sdk_client`` to share with other
+                GeminiClients (default: a new one)
+        """
+        from google.genai import types
 
-    @traceable
-    def generate(self, request: ModelRequest) -> ModelResponse:
-        model_name = request.model or self.default_model
+        self.default_model = model
+        self.client = sdk_client or create_sdk_client()
+        self._types = types
 
-        # Build the config with optional system instruction
-        config = types.GenerateContentConfig()
+    def _build_config(self, request: ModelRequest) -> "types.GenerateContentConfig":
+        """Build the config with optional system instruction."""
+        types = self._types
         if request.system_prompt:
-            config = types.GenerateContentConfig(
+            return types.GenerateContentConfig(
                 system_instruction=request.system_prompt
             )
+        return types.GenerateContentConfig()
+
+    @traceable
+    def generate(self, request: ModelRequest) -> ModelResponse:
+        model_name = request.model or self.default_model
 
         # Generate response
         response = self.client.models.generate_content(
             model=model_name,
             contents=request.prompt,
-            config=config,
+            config=self._build_config(request),
         )
 
-        # Extract usage metadata if available
-        usage = {}
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = {
-                "prompt_tokens": response.usage_metadata.prompt_token_count,
-                "completion_tokens": response.usage_metadata.candidates_token_count,
-                "total_tokens": response.usage_metadata.total_token_count,
-            }
-
-        # Get finish reason
-        finish_reason = "stop"
-        if response.candidates and response.candidates[0].finish_reason:
-            finish_reason = str(response.candidates[0].finish_reason).lower()
-
         return ModelResponse(
             content=response.text,
             model=model_name,
-            usage=usage,
-            finish_reason=finish_reason,
+            usage=_usage_to_dict(response),
+            finish_reason=_finish_reason(response) or "stop",
         )
+
+    @traceable
+    def stream(self, request: ModelRequest) -> Iterator[StreamChunk]:
+        model_name = request.model or self.default_model
+
+        responses = self.client.models.generate_content_stream(
+            model=model_name,
+            contents=request.prompt,
+            config=self._build_config(request),
+        )
+
+        try:
+            for response in responses:
+                # Usage metadata is cumulative, so the last chunk's wins
+                yield StreamChunk(
+                    content=response.text or "",
+                    model=model_name,
+                    usage=_usage_to_dict(response) or None,
+                    finish_reason=_finish_reason(response),
+                )
+        finally:
+            close = getattr(responses, "close", None)
+            if close is not None:
+                close()
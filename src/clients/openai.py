@@ -1,35 +1,97 @@
-from langsmith import traceable, wrappers
-from openai import OpenAI
+from collections.abc import Iterator
 
-from src.clients.base import ModelRequest, ModelResponse
+from src.clients.base import ModelRequest, ModelResponse, StreamChunk
+from src.clients.tracing import traceable, wrap_openai
+
+
+def _build_messages(request: ModelRequest) -> list[dict]:
+    messages = []
+    if request.system_prompt:
+        messages.append({"role": "system", "content": request.system_prompt})
+    messages.append({"role": "user", "content": request.prompt})
+    return messages
+
+
+def _usage_to_dict(usage) -> dict:
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+
+
+def create_sdk_client(http_limits=None):
+    """
+    Build an ``openai.OpenAI`` client, wrapped for LangSmith tracing.
+
+    OpenAIClient's methods decide per call, from the tracing policy, whether
+    the wrapped client records its LLM run.
+
+    Args:
+        http_limits: ``httpx.Limits`` for the client's connection pool
+            (default: the SDK's)
+    """
+    # Imported here so commands that never call a model skip the SDK
+    from openai import DefaultHttpxClient, OpenAI
+
+    http_client = DefaultHttpxClient(limits=http_limits) if http_limits else None
+    return wrap_openai(OpenAI(http_client=http_client))
 
 
 class OpenAIClient:
-    def __init__(self, model: str = "gpt-4o-mini"):
+    def __init__(self, model: str = "gpt-4o-mini", sdk_client=None):
+        """
+        Args:
+            model: Default model for requests that do not name one
+            sdk_client: Client from ``create_sdk_client`` to share with other
+                OpenAIClients (default: a new one)
+        """
         self.default_model = model
-        self._client = wrappers.wrap_openai(OpenAI())
+        self._client = sdk_client or create_sdk_client()
 
     @traceable
     def generate(self, request: ModelRequest) -> ModelResponse:
         model = request.model or self.default_model
 
-        messages = []
-        if request.system_prompt:
-            messages.append({"role": "system", "content": request.system_prompt})
-        messages.append({"role": "user", "content": request.prompt})
-
         completion = self._client.chat.completions.create(
             model=model,
-            messages=messages,
+            messages=_build_messages(request),
         )
 
         return ModelResponse(
             content=completion.choices[0].message.content or "",
             model=model,
-            usage={
-                "prompt_tokens": completion.usage.prompt_tokens,
-                "completion_tokens": completion.usage.completion_tokens,
-                "total_tokens": completion.usage.total_tokens,
-            },
+            usage=_usage_to_dict(completion.usage),
             finish_reason=completion.choices[0].finish_reason,
         )
+
+    @traceable
+    def stream(self, request: ModelRequest) -> Iterator[StreamChunk]:
+        model = request.model or self.default_model
+
+        stream = self._client.chat.completions.create(
+            model=model,
+            messages=_build_messages(request),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        # Usage arrives only in the final chunk; a stream closed early has
+        # none, and consume_stream records its token counts as unknown
+        try:
+            for chunk in stream:
+                # With include_usage the final chunk has no choices, only usage
+                usage = _usage_to_dict(chunk.usage) if chunk.usage else None
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    yield StreamChunk(
+                        content=choice.delta.content or "",
+                        model=model,
+                        usage=usage,
+                        finish_reason=choice.finish_reason,
+                    )
+                elif usage:
+                    yield StreamChunk(content="", model=model, usage=usage)
+        finally:
+            # Closing the response aborts generation when the caller stops early
+            stream.close()
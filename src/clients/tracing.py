@@ -0,0 +1,209 @@
+"""LangSmith tracing of model calls, governed by a tracing policy.
+
+``langsmith`` (and the provider SDK modules it instruments) take a large
+share of a cold start, so clients decorate their methods with ``traceable``
+from here and wrap SDK clients with ``wrap_openai``: langsmith is only
+imported once a client is built or a decorated method is called.
+
+Which calls are traced is decided per call by the active TracingPolicy:
+
+- ``off``: nothing is traced
+- ``sample:P``: each call is traced with probability P (e.g. ``sample:0.05``)
+- ``errors``: only calls that raise are recorded, after the fact
+- ``full``: every call is traced, with the wrapped SDK's nested LLM run
+
+The process-wide default comes from ``EVAL_TRACING`` (default ``full``)
+or ``set_default_tracing_policy``; ``tracing_policy`` overrides it within a
+context, e.g. for one run. LangSmith's own switch (``LANGSMITH_TRACING``)
+still applies on top of the policy.
+"""
+
+import functools
+import inspect
+import os
+import random
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+TRACING_MODES = ("off", "sample", "errors", "full")
+
+
+@dataclass(frozen=True)
+class TracingPolicy:
+    mode: str = "full"
+    rate: float = 1.0  # Fraction of calls traced in "sample" mode
+
+    def __str__(self) -> str:
+        return f"sample:{self.rate:g}" if self.mode == "sample" else self.mode
+
+
+def parse_tracing_policy(spec: str) -> TracingPolicy:
+    """
+    Parse a policy spec: "off", "errors", "full" or "sample:P" (0 <= P <= 1).
+
+    Raises:
+        ValueError: If the spec is not one of these
+    """
+    mode, _, rate = spec.strip().lower().partition(":")
+    if mode == "sample":
+        try:
+            value = float(rate)
+        except ValueError:
+            raise ValueError(f"Invalid sampling rate in tracing policy '{spec}'") from None
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"Sampling rate must be between 0 and 1, got {value}")
+        return TracingPolicy("sample", value)
+    if mode not in TRACING_MODES or rate:
+        raise ValueError(
+            f"Unknown tracing policy '{spec}'; use off, sample:P, errors or full"
+        )
+    return TracingPolicy(mode)
+
+
+# Set by set_default_tracing_policy; until then EVAL_TRACING is read on use,
+# so a value loaded from .env after import still applies
+_default_policy: TracingPolicy | None = None
+
+# Override of the default for the current context (thread, task or run)
+_policy: ContextVar[TracingPolicy | None] = ContextVar("tracing_policy", default=None)
+
+
+@functools.lru_cache(maxsize=8)
+def _env_policy(spec: str) -> TracingPolicy:
+    try:
+        return parse_tracing_policy(spec)
+    except ValueError as e:
+        raise ValueError(f"Invalid EVAL_TRACING: {e}") from None
+
+
+def get_tracing_policy() -> TracingPolicy:
+    """Get the policy applying to calls made from the current context."""
+    return (
+        _policy.get()
+        or _default_policy
+        or _env_policy(os.environ.get("EVAL_TRACING") or "full")
+    )
+
+
+def set_default_tracing_policy(policy: TracingPolicy | str | None) -> None:
+    """
+    Set the process-wide policy (None: go back to ``EVAL_TRACING``).
+
+    Unlike ``tracing_policy``, this also reaches threads started without a
+    copy of the current context (such as ThreadPoolExecutor workers).
+    """
+    global _default_policy
+    _default_policy = parse_tracing_policy(policy) if isinstance(policy, str) else policy
+
+
+@contextmanager
+def tracing_policy(policy: TracingPolicy | str | None) -> Iterator[None]:
+    """Apply a policy to calls made within the block (None: keep the current one)."""
+    if policy is None:
+        yield
+        return
+    if isinstance(policy, str):
+        policy = parse_tracing_policy(policy)
+    token = _policy.set(policy)
+    try:
+        yield
+    finally:
+        _policy.reset(token)
+
+
+def _record_error(
+    func: Callable, args: tuple, kwargs: dict, start: datetime, error: Exception
+) -> None:
+    """Post a trace for a failed call that was run untraced."""
+    try:
+        from langsmith import utils
+        from langsmith.run_trees import RunTree
+
+        if not utils.tracing_is_enabled():
+            return
+        inputs = inspect.signature(func).bind(*args, **kwargs).arguments
+        inputs.pop("self", None)
+        run = RunTree(name=func.__name__, run_type="chain", inputs=inputs, start_time=start)
+        run.end(error=f"{type(error).__name__}: {error}")
+        run.post()
+    except Exception:
+        pass  # Never let tracing mask the call's own error
+
+
+def wrap_openai(client):
+    """
+    Trace an ``openai.OpenAI`` client's calls as LangSmith LLM runs.
+
+    The wrapped client records model and token usage for calls traced under
+    the active policy; ``traceable`` disables it for the others.
+    """
+    from langsmith import wrappers
+
+    return wrappers.wrap_openai(client)
+
+
+@contextmanager
+def _untraced() -> Iterator[None]:
+    """Disable LangSmith tracing, including wrapped SDK clients, in the block."""
+    from langsmith.run_helpers import tracing_context
+
+    with tracing_context(enabled=False):
+        yield
+
+
+def traceable(func: Callable) -> Callable:
+    """Trace calls to ``func`` with ``langsmith.traceable``, as the active policy allows."""
+    traced: Callable | None = None
+    is_generator = inspect.isgeneratorfunction(func)
+
+    def get_traced() -> Callable:
+        nonlocal traced
+        if traced is None:
+            from langsmith import traceable as langsmith_traceable
+
+            traced = langsmith_traceable(func)
+        return traced
+
+    def call_untraced(*args, **kwargs):
+        with _untraced():
+            return func(*args, **kwargs)
+
+    def iterate_untraced(*args, **kwargs):
+        # Streams call the SDK while being consumed, not when the call returns
+        with _untraced():
+            yield from func(*args, **kwargs)
+
+    def call_recording_errors(*args, **kwargs):
+        start = datetime.now(timezone.utc)
+        try:
+            return call_untraced(*args, **kwargs)
+        except Exception as e:
+            _record_error(func, args, kwargs, start, e)
+            raise
+
+    def iterate_recording_errors(*args, **kwargs):
+        # Streams fail while being consumed, not when the call returns
+        start = datetime.now(timezone.utc)
+        try:
+            yield from iterate_untraced(*args, **kwargs)
+        except Exception as e:
+            _record_error(func, args, kwargs, start, e)
+            raise
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        policy = get_tracing_policy()
+        if policy.mode == "full" or (policy.mode == "sample" and random.random() < policy.rate):
+            return get_traced()(*args, **kwargs)
+        if policy.mode == "errors":
+            if is_generator:
+                return iterate_recording_errors(*args, **kwargs)
+            return call_recording_errors(*args, **kwargs)
+        if is_generator:
+            return iterate_untraced(*args, **kwargs)
+        return call_untraced(*args, **kwargs)
+
+    return wrapper
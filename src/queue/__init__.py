@@ -0,0 +1,36 @@
+"""Persistent job queue shared by the API and worker processes."""
+
+import os
+
+from src.queue.base import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    FINISHED_STATUSES,
+    QUEUED,
+    RUNNING,
+    Job,
+    JobQueue,
+)
+from src.queue.sqlite import SQLiteQueue
+
+DEFAULT_QUEUE_PATH = ".eval_queue.db"
+
+
+def get_job_queue() -> SQLiteQueue:
+    """Open the queue at ``EVAL_QUEUE_PATH`` (default ``.eval_queue.db``)."""
+    return SQLiteQueue(os.environ.get("EVAL_QUEUE_PATH") or DEFAULT_QUEUE_PATH)
+
+
+__all__ = [
+    "CANCELLED",
+    "DONE",
+    "FAILED",
+    "FINISHED_STATUSES",
+    "QUEUED",
+    "RUNNING",
+    "Job",
+    "JobQueue",
+    "SQLiteQueue",
+    "get_job_queue",
+]
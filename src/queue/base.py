@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from typing import Protocol
+
+# Job lifecycle: queued -> running -> done | failed | cancelled
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (DONE, FAILED, CANCELLED)
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str  # Which handler runs the job, e.g. "run"
+    payload: dict
+    status: str = QUEUED
+    result: dict = field(default_factory=dict)  # Progress while running, output when done
+    error: str | None = None
+    created_at: float | None = None  # Unix timestamps
+    started_at: float | None = None
+    finished_at: float | None = None
+    worker: str | None = None
+    attempts: int = 0
+    cancel_requested: bool = False
+
+
+class JobQueue(Protocol):
+    def put(self, kind: str, payload: dict) -> str: ...
+
+    def claim(self, kinds: list[str], worker: str) -> Job | None: ...
+
+    def heartbeat(self, job_id: str, result: dict | None = None) -> None: ...
+
+    def complete(self, job_id: str, result: dict) -> None: ...
+
+    def fail(self, job_id: str, error: str) -> None: ...
+
+    def release(self, job_id: str, result: dict | None = None) -> None: ...
+
+    def mark_cancelled(self, job_id: str, result: dict | None = None) -> None: ...
+
+    def clear_result(self, job_id: str) -> None: ...
+
+    def cancel(self, job_id: str) -> bool: ...
+
+    def is_cancel_requested(self, job_id: str) -> bool: ...
+
+    def get(self, job_id: str) -> Job | None: ...
+
+    def list(self, kind: str | None = None, limit: int = 100) -> list[Job]: ...
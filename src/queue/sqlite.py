@@ -0,0 +1,273 @@
+"""Persistent job queue in a SQLite database."""
+
+import json
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.queue.base import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    FINISHED_STATUSES,
+    QUEUED,
+    RUNNING,
+    Job,
+)
+from src.store.sqlite import ConnectionPool
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT NOT NULL DEFAULT '{}',
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+"""
+
+_COLUMNS = (
+    "id, kind, payload, status, result, error, created_at, started_at, "
+    "finished_at, worker, attempts, cancel_requested"
+)
+
+
+def _row_to_job(row: tuple) -> Job:
+    return Job(
+        id=row[0],
+        kind=row[1],
+        payload=json.loads(row[2]),
+        status=row[3],
+        result=json.loads(row[4]),
+        error=row[5],
+        created_at=row[6],
+        started_at=row[7],
+        finished_at=row[8],
+        worker=row[9],
+        attempts=row[10],
+        cancel_requested=bool(row[11]),
+    )
+
+
+class SQLiteQueue:
+    """
+    A durable FIFO of jobs that any number of worker processes can consume.
+
+    A worker claims the oldest queued job, which leases it for
+    ``lease_seconds``; ``heartbeat`` renews the lease while the job runs. If
+    the worker dies the lease runs out and the job is handed to another
+    worker, up to ``max_attempts`` claims in total, after which it fails.
+
+    Cancelling a queued job removes it from the queue at once; a running job
+    is only flagged (``cancel_requested``), and its worker is expected to
+    check the flag and stop.
+    """
+
+    def __init__(
+        self,
+        path: str = ".eval_queue.db",
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        pool_size: int = 4,
+    ):
+        """
+        Args:
+            path: Database file (created if missing)
+            lease_seconds: How long a claim lasts without a heartbeat
+            max_attempts: Claims allowed per job before it is failed
+            pool_size: Maximum number of open connections
+        """
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(str(self.path), size=pool_size)
+        with self._pool.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def put(self, kind: str, payload: dict) -> str:
+        job_id = str(uuid.uuid4())
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), QUEUED, time.time()),
+            )
+        return job_id
+
+    def claim(self, kinds: list[str], worker: str) -> Job | None:
+        """
+        Take the oldest available job of the given kinds.
+
+        Jobs whose lease expired (their worker died) are available again.
+
+        Returns:
+            The claimed job, or None if there is nothing to do
+        """
+        now = time.time()
+        placeholders = ", ".join("?" for _ in kinds)
+        with self._transaction() as conn:
+            # Jobs abandoned too often are failed rather than retried
+            conn.execute(
+                f"UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                f"WHERE status = ? AND lease_until < ? AND attempts >= ? "
+                f"AND kind IN ({placeholders})",
+                (FAILED, "Worker lost", now, RUNNING, now, self.max_attempts, *kinds),
+            )
+            row = conn.execute(
+                f"SELECT id FROM jobs WHERE kind IN ({placeholders}) AND "
+                f"(status = ? OR (status = ? AND lease_until < ?)) "
+                f"ORDER BY created_at LIMIT 1",
+                (*kinds, QUEUED, RUNNING, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                "started_at = COALESCE(started_at, ?), lease_until = ? WHERE id = ?",
+                (RUNNING, worker, now, now + self.lease_seconds, row[0]),
+            )
+            job = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (row[0],)
+            ).fetchone()
+        return _row_to_job(job)
+
+    def heartbeat(self, job_id: str, result: dict | None = None) -> None:
+        """Renew a running job's lease, optionally publishing progress."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET lease_until = ?, result = COALESCE(?, result) "
+                "WHERE id = ? AND status = ?",
+                (
+                    time.time() + self.lease_seconds,
+                    json.dumps(result) if result is not None else None,
+                    job_id,
+                    RUNNING,
+                ),
+            )
+
+    def _finish(self, job_id: str, status: str, result: dict | None, error: str | None) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = COALESCE(?, result), error = ?, "
+                "finished_at = ?, lease_until = NULL WHERE id = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def complete(self, job_id: str, result: dict) -> None:
+        self._finish(job_id, DONE, result, None)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._finish(job_id, FAILED, None, error)
+
+    def release(self, job_id: str, result: dict | None = None) -> None:
+        """
+        Put a running job back in the queue, e.g. because its worker is
+        shutting down.
+
+        The job keeps its place and its published progress, and the claim
+        does not count towards ``max_attempts``.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = COALESCE(?, result), worker = NULL, "
+                "attempts = attempts - 1, lease_until = NULL WHERE id = ? AND status = ?",
+                (
+                    QUEUED,
+                    json.dumps(result) if result is not None else None,
+                    job_id,
+                    RUNNING,
+                ),
+            )
+
+    def mark_cancelled(self, job_id: str, result: dict | None = None) -> None:
+        """Record that a worker stopped a job because it was cancelled."""
+        self._finish(job_id, CANCELLED, result, None)
+
+    def clear_result(self, job_id: str) -> None:
+        """Drop a finished job's result, once its output has been collected."""
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE jobs SET result = '{{}}' WHERE id = ? AND status IN ({placeholders})",
+                (job_id, *FINISHED_STATUSES),
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job.
+
+        Returns:
+            False if the job does not exist or has already finished
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+            if row[0] == QUEUED:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?",
+                    (CANCELLED, time.time(), job_id),
+                )
+                return True
+            if row[0] == RUNNING:
+                conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+                return True
+        return False
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def get(self, job_id: str) -> Job | None:
+        with self._pool.connection() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list(self, kind: str | None = None, limit: int = 100) -> list[Job]:
+        """List jobs, newest first."""
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        params: tuple = ()
+        if kind is not None:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                query + " ORDER BY created_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def close(self) -> None:
+        self._pool.close()
@@ -0,0 +1,247 @@
+"""Live progress of in-flight runs, shared through append-only event files.
+
+A runner process writes one JSON event per line to ``<live dir>/<run_id>.jsonl``:
+
+- ``start``: run id, suite, model and number of cases
+- ``result``: one per scored case, with running progress counters
+- ``end``: final status ("completed", "aborted" or "failed")
+
+Any process (such as the API server) can tail the file to follow the run,
+and request an abort by creating ``<run_id>.abort`` next to it; the runner
+checks for the marker between cases.
+
+While a run is in flight its runner also touches the file every
+``HEARTBEAT_SECONDS``, even when a case takes long, so a file that stops
+changing means the runner is gone rather than busy.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.store.base import EvalResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIVE_DIR = ".eval_live"
+
+# How often a runner touches the event file of a run in flight
+HEARTBEAT_SECONDS = 15
+
+# Runs whose event file missed this many heartbeats are presumed dead (e.g.
+# the runner was killed) and no longer reported as in flight.
+STALE_AFTER_SECONDS = 4 * HEARTBEAT_SECONDS
+
+
+def get_live_dir() -> Path:
+    """Get the live progress directory (``EVAL_LIVE_DIR`` or ``.eval_live``)."""
+    return Path(os.environ.get("EVAL_LIVE_DIR") or DEFAULT_LIVE_DIR)
+
+
+def is_valid_run_id(run_id: str) -> bool:
+    return bool(run_id) and not any(c in run_id for c in "/\\") and run_id not in (".", "..")
+
+
+class LiveRun:
+    """
+    Publishes a run's progress while it executes.
+
+    Pass ``on_result`` and ``should_abort`` to ``Runner.run`` and call
+    ``finish`` when the run ends, whatever the outcome. Until then a
+    background thread keeps the run's heartbeat.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        suite_id: str,
+        model: str,
+        total: int,
+        root: Path | None = None,
+        on_heartbeat: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            run_id: Id of the run being published
+            suite_id: The run's suite
+            model: The model being evaluated
+            total: Number of cases in the run
+            root: Live progress directory (default: ``get_live_dir()``)
+            on_heartbeat: Called with each heartbeat, e.g. to renew a job
+                lease while a slow case runs
+        """
+        self.root = root or get_live_dir()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.run_id = run_id
+        self.path = self.root / f"{run_id}.jsonl"
+        self.abort_path = self.root / f"{run_id}.abort"
+        self.total = total
+        self._started = time.monotonic()
+        self._done = 0
+        self._passed = 0
+        self._latency_total = 0.0
+        self._latency_count = 0
+        self._cost = 0.0
+        self._emit(
+            {
+                "type": "start",
+                "run_id": run_id,
+                "suite_id": suite_id,
+                "model": model,
+                "total": total,
+                "started_at": time.time(),
+            }
+        )
+        self._on_heartbeat = on_heartbeat
+        self._finished = threading.Event()
+        threading.Thread(
+            target=self._beat, name=f"live-heartbeat-{run_id}", daemon=True
+        ).start()
+
+    def _beat(self) -> None:
+        while not self._finished.wait(HEARTBEAT_SECONDS):
+            try:
+                os.utime(self.path)
+                if self._on_heartbeat is not None:
+                    self._on_heartbeat()
+            except Exception:
+                logger.warning("Heartbeat of live run %s failed", self.run_id, exc_info=True)
+
+    def _emit(self, event: dict) -> None:
+        # One small append per event; readers only consume complete lines
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def progress(self) -> dict:
+        elapsed = time.monotonic() - self._started
+        return {
+            "done": self._done,
+            "total": self.total,
+            "passed": self._passed,
+            "failed": self._done - self._passed,
+            "elapsed_s": elapsed,
+            "cases_per_second": self._done / elapsed if elapsed > 0 else None,
+            "mean_latency_ms": (
+                self._latency_total / self._latency_count if self._latency_count else None
+            ),
+            "cost_usd": self._cost,
+        }
+
+    def on_result(self, result: EvalResult) -> None:
+        self._done += 1
+        self._passed += result.passed
+        if result.latency_ms is not None:
+            self._latency_total += result.latency_ms
+            self._latency_count += 1
+        self._cost += result.cost_usd or 0.0
+        self._emit(
+            {
+                "type": "result",
+                "case_id": result.case_id,
+                "passed": result.passed,
+                "score": result.score,
+                "reasons": result.reasons,
+                "latency_ms": result.latency_ms,
+                "ttft_ms": result.ttft_ms,
+                "finish_reason": result.finish_reason,
+                "cost_usd": result.cost_usd,
+                "progress": self.progress(),
+            }
+        )
+
+    def should_abort(self) -> bool:
+        return self.abort_path.exists()
+
+    def finish(self, status: str = "completed") -> None:
+        self._finished.set()
+        self._emit({"type": "end", "status": status, "progress": self.progress()})
+        self.abort_path.unlink(missing_ok=True)
+
+
+def read_events(path: Path, offset: int = 0) -> tuple[list[dict], int]:
+    """
+    Read the complete events appended to a live file since ``offset``.
+
+    Returns:
+        The events and the offset to resume from
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+    end = data.rfind(b"\n") + 1
+    events = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+    return events, offset + end
+
+
+def is_stale(path: Path) -> bool:
+    """Whether the runner of a live run stopped beating without ending it."""
+    try:
+        return time.time() - path.stat().st_mtime > STALE_AFTER_SECONDS
+    except FileNotFoundError:
+        return True
+
+
+def list_live_runs(root: Path | None = None) -> list[dict]:
+    """
+    Summarize the runs currently in flight.
+
+    Returns:
+        One dict per run: its ``start`` event fields plus the latest
+        ``progress`` counters
+    """
+    root = root or get_live_dir()
+    if not root.exists():
+        return []
+
+    runs = []
+    for path in root.glob("*.jsonl"):
+        if is_stale(path):
+            continue
+        events, _ = read_events(path)
+        if not events or events[0]["type"] != "start" or events[-1]["type"] == "end":
+            continue
+        summary = {k: v for k, v in events[0].items() if k != "type"}
+        summary["progress"] = next(
+            (e["progress"] for e in reversed(events) if "progress" in e), None
+        )
+        runs.append(summary)
+    runs.sort(key=lambda r: r["started_at"])
+    return runs
+
+
+def request_abort(run_id: str, root: Path | None = None) -> bool:
+    """
+    Ask the runner of an in-flight run to stop after its current case.
+
+    Returns:
+        False if no such run is being published
+    """
+    root = root or get_live_dir()
+    if not is_valid_run_id(run_id) or not (root / f"{run_id}.jsonl").exists():
+        return False
+    (root / f"{run_id}.abort").touch()
+    return True
+
+
+def prune_live_runs(older_than_seconds: float = 86400, root: Path | None = None) -> int:
+    """Delete event files (and abort markers) untouched for a while."""
+    root = root or get_live_dir()
+    if not root.exists():
+        return 0
+    removed = 0
+    cutoff = time.time() - older_than_seconds
+    for path in list(root.glob("*.jsonl")) + list(root.glob("*.abort")):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += path.suffix == ".jsonl"
+        except FileNotFoundError:
+            pass
+    return removed
@@ -1,9 +1,319 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 
 import yaml
 
+from src.scorers.rules import CompiledExpected
+
+# Suites bundled with the repository
+DEFAULT_SUITES_DIR = Path(__file__).resolve().parent.parent.parent / "datasets" / "examples"
+
+SUITE_SUFFIXES = (".yaml", ".jsonl")
+
+# Case files referenced by a YAML suite's ``cases_file``; not suites themselves
+CASES_FILE_SUFFIX = ".cases.jsonl"
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed suites kept in memory, keyed by resolved path
+SUITE_CACHE_SIZE = 32
+
+# Suites at least this large get a JSON sidecar (``.<name>.json`` next to
+# the file) written after parsing, which later processes load instead of
+# re-parsing the YAML
+SIDECAR_MIN_BYTES = 256 * 1024
+
+_cache: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Suite listings keyed by directory, valid while the directory's mtime is
+# unchanged (adding, removing or renaming a file updates it)
+_listing_cache: dict[Path, tuple[int, list[Path]]] = {}
+
+# Suite metadata keyed by suite file, valid while the stats of the suite and
+# its case file are unchanged
+_metadata_cache: dict[Path, tuple[tuple, dict]] = {}
+
+
+class LazyCases:
+    """
+    A suite's cases, read from a JSON-lines file one at a time.
+
+    Each iteration re-reads the file and yields each case with its
+    ``expected`` block compiled, so memory use does not grow with the number
+    of cases and the first case is available as soon as its line is read.
+    ``len()`` counts lines without parsing them; slicing reads only up to
+    the end of the slice.
+    """
+
+    def __init__(self, path: Path, has_header: bool = False):
+        """
+        Args:
+            path: JSONL file, one case object per line
+            has_header: Whether the first line is the suite header
+        """
+        self.path = path
+        self.has_header = has_header
+        self._len: tuple[tuple[int, int], int] | None = None
+
+    def _lines(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            lines = (line for line in f if line.strip())
+            if self.has_header:
+                next(lines, None)
+            yield from lines
+
+    @staticmethod
+    def _decode(line: bytes) -> dict:
+        case = json.loads(line)
+        case["expected"] = CompiledExpected(case.get("expected") or {})
+        return case
+
+    def __iter__(self) -> Iterator[dict]:
+        for line in self._lines():
+            yield self._decode(line)
+
+    def __len__(self) -> int:
+        stat = self.path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._len is None or self._len[0] != signature:
+            self._len = (signature, sum(1 for _ in self._lines()))
+        return self._len[1]
+
+    def __getitem__(self, index: slice) -> list[dict]:
+        if not isinstance(index, slice) or (index.step or 1) != 1:
+            raise TypeError("LazyCases supports only contiguous slices")
+        # Lines before the slice are skipped without being parsed
+        lines = islice(self._lines(), index.start or 0, index.stop)
+        return [self._decode(line) for line in lines]
+
+    def __repr__(self) -> str:
+        return f"LazyCases({str(self.path)!r})"
+
+
+def compile_suite(suite: dict) -> dict:
+    """Replace each case's ``expected`` block with its compiled form."""
+    if isinstance(suite.get("cases"), LazyCases):
+        return suite  # Compiled as they are read
+    for case in suite.get("cases") or []:
+        case["expected"] = CompiledExpected(case.get("expected") or {})
+    return suite
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.json")
+
+
+def _read_sidecar(path: Path, signature: tuple[int, int]) -> dict | None:
+    try:
+        data = json.loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if data.get("source") != list(signature):
+        return None
+    return data["suite"]
+
+
+def _write_sidecar(path: Path, signature: tuple[int, int], suite: dict) -> None:
+    try:
+        payload = json.dumps({"source": list(signature), "suite": suite})
+    except (TypeError, ValueError):
+        return  # YAML types JSON cannot represent (e.g. dates); keep parsing
+    try:
+        _sidecar_path(path).write_text(payload)
+    except OSError:
+        pass  # Read-only suite directory
+
+
+def _read_jsonl_header(path: Path) -> dict:
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                header = json.loads(line)
+                break
+        else:
+            raise ValueError(f"Empty suite file: {path}")
+    if not isinstance(header, dict) or "id" not in header or "prompt" in header:
+        raise ValueError(f"First line of {path} must be the suite header (with an 'id')")
+    return header
+
+
+def parse_suite(path: Path, signature: tuple[int, int]) -> dict:
+    """
+    Parse a suite file.
+
+    YAML suites are read via their JSON sidecar when it is up to date; a
+    YAML suite may name a JSONL ``cases_file`` (relative to itself) instead
+    of listing ``cases``. A ``.jsonl`` suite holds the header (id, title,
+    scorer, ...) on its first line and one case per following line. JSONL
+    cases are not read here: ``cases`` is a LazyCases over the file.
+    """
+    if path.suffix == ".jsonl":
+        header = _read_jsonl_header(path)
+        return {**header, "cases": LazyCases(path, has_header=True)}
+
+    suite = _read_sidecar(path, signature)
+    if suite is None:
+        suite = yaml.load(path.read_text(), Loader=_YAML_LOADER)
+        if signature[1] >= SIDECAR_MIN_BYTES:
+            _write_sidecar(path, signature, suite)
+
+    if "cases_file" in suite:
+        suite = {**suite, "cases": LazyCases(path.parent / suite["cases_file"])}
+    return suite
+
 
 def load_suite(path: str) -> dict:
-    """Load a YAML eval suite from disk."""
-    content = Path(path).read_text()
-    return yaml.safe_load(content)
+    """
+    Load an eval suite (YAML or JSONL) from disk and precompile its rules.
+
+    Suites are cached in memory until the file's modification time or size
+    changes, so repeated loads (by the API, or per model in the CLI) cost a
+    ``stat``. The returned dict is a fresh top-level copy, but its cases are
+    shared with the cache and must not be modified.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(resolved)
+        if cached is not None and cached[0] == signature:
+            _cache.move_to_end(resolved)
+            return dict(cached[1])
+
+    suite = compile_suite(parse_suite(resolved, signature))
+
+    with _cache_lock:
+        _cache[resolved] = (signature, suite)
+        while len(_cache) > SUITE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return dict(suite)
+
+
+def find_suite_path(suite_id: str, suites_dir: Path | None = None) -> Path | None:
+    """
+    Locate a suite file by id.
+
+    Args:
+        suite_id: Suite file name without extension
+        suites_dir: Directory to look in (default: the bundled suites)
+
+    Returns:
+        The path, or None if there is no such suite or the id is not a
+        plain file name
+    """
+    if not suite_id or any(c in suite_id for c in "/\\") or suite_id in (".", ".."):
+        return None
+    for suffix in SUITE_SUFFIXES:
+        path = (suites_dir or DEFAULT_SUITES_DIR) / f"{suite_id}{suffix}"
+        if path.exists() and not path.name.endswith(CASES_FILE_SUFFIX):
+            return path
+    return None
+
+
+def list_suite_paths(suites_dir: Path | None = None) -> list[Path]:
+    """
+    Find the suite files (YAML and JSONL) in a directory, sorted by name.
+
+    The listing is cached until the directory's modification time changes.
+    """
+    suites_dir = (suites_dir or DEFAULT_SUITES_DIR).resolve()
+    try:
+        dir_mtime = suites_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    cached = _listing_cache.get(suites_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        return list(cached[1])
+
+    paths = sorted(
+        path
+        for suffix in SUITE_SUFFIXES
+        for path in suites_dir.glob(f"*{suffix}")
+        if not path.name.endswith(CASES_FILE_SUFFIX) and not path.name.startswith(".")
+    )
+    _listing_cache[suites_dir] = (dir_mtime, paths)
+    return list(paths)
+
+
+def _file_signature(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _hash_files(paths: list[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def suite_metadata(path: Path) -> dict:
+    """
+    Summarize a suite without returning its cases.
+
+    Cached until the suite file (or its ``cases_file``) changes.
+
+    Returns:
+        The suite's id, title, description, scorer, case count, sorted case
+        categories and a SHA-256 of its contents (suite and case file)
+    """
+    path = Path(path).resolve()
+    cached = _metadata_cache.get(path)
+    if cached is not None:
+        signature, metadata = cached
+        if tuple(_file_signature(Path(s[0])) for s in signature) == signature:
+            return metadata
+
+    suite = load_suite(str(path))
+    cases = suite.get("cases") or []
+    files = [path] + ([cases.path] if isinstance(cases, LazyCases) and not cases.has_header else [])
+    signature = tuple(_file_signature(f) for f in files)
+
+    categories: set[str] = set()
+    count = 0
+    for case in cases:
+        count += 1
+        if case.get("category"):
+            categories.add(case["category"])
+
+    metadata = {
+        "id": suite.get("id", path.stem),
+        "title": suite.get("title") or suite.get("id", path.stem),
+        "description": suite.get("description"),
+        "scorer": suite.get("scorer", "rules"),
+        "case_count": count,
+        "categories": sorted(categories),
+        "content_hash": _hash_files(files),
+    }
+    _metadata_cache[path] = (signature, metadata)
+    return metadata
+
+
+def list_suites(suites_dir: Path | None = None) -> list[dict]:
+    """
+    Metadata for every suite in a directory (see ``suite_metadata``).
+
+    Only suites added or changed since the previous call are read again.
+    Files that fail to parse are left out.
+    """
+    suites = []
+    for path in list_suite_paths(suites_dir):
+        try:
+            suites.append(suite_metadata(path))
+        except (OSError, ValueError, yaml.YAMLError):
+            continue
+    return suites
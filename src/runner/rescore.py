@@ -0,0 +1,183 @@
+"""Re-apply current suite scorers to stored runs without generating."""
+
+import multiprocessing
+import uuid
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields, replace
+from datetime import datetime, timezone
+
+from src.runner.runner import (
+    estimate_result_cost,
+    get_case_expected,
+    get_scorer_for_suite,
+)
+from src.scorers.base import Scorer
+from src.scorers.rules import RuleScorer
+from src.store.base import EvalResult, EvalRun
+from src.utils.env import get_run_environment
+
+
+def index_cases(suite: dict) -> dict[str, dict]:
+    """Map a suite's case ids to its cases."""
+    return {case["id"]: case for case in suite.get("cases", [])}
+
+
+def rescore_run(
+    run: EvalRun, suite: dict, scorer: Scorer, cases: dict[str, dict] | None = None
+) -> EvalRun:
+    """
+    Score a stored run's responses against the suite's current rules.
+
+    Results for cases that no longer exist in the suite are dropped. The
+    returned run is new (fresh id and timestamp) and records the original
+    in ``rescored_from``; generation metrics are carried over unchanged.
+
+    Args:
+        run: Stored run to re-score
+        suite: The run's suite
+        scorer: Scorer for the suite
+        cases: The suite's cases by id, from ``index_cases`` (default: built
+            from ``suite``; pass it when re-scoring many runs of one suite)
+    """
+    if cases is None:
+        cases = index_cases(suite)
+    results: list[EvalResult] = []
+
+    for result in run.results:
+        case = cases.get(result.case_id)
+        if case is None:
+            continue
+
+        score_result = scorer.score(
+            result.prompt, result.response, get_case_expected(case, suite)
+        )
+        results.append(
+            replace(
+                result,
+                id=str(uuid.uuid4()),
+                passed=score_result.passed,
+                score=score_result.score,
+                reasons=score_result.reasons,
+                judge_tokens=score_result.usage.get("total_tokens"),
+                cost_usd=estimate_result_cost(
+                    result.model,
+                    result.prompt_tokens,
+                    result.completion_tokens,
+                    score_result,
+                ),
+            )
+        )
+
+    environment = get_run_environment()
+    return EvalRun(
+        id=str(uuid.uuid4()),
+        suite_id=run.suite_id,
+        model=run.model,
+        timestamp=datetime.now(timezone.utc),
+        results=results,
+        system_prompt_name=run.system_prompt_name,
+        git_commit_hash=environment["git_commit"],
+        environment=environment,
+        rescored_from=run.id,
+    )
+
+
+# Per-process state of rescoring worker processes (see _init_process)
+_process_state: dict = {}
+
+
+def _init_process(suites: dict[str, dict], fail_fast: bool) -> None:
+    _process_state["suites"] = suites
+    _process_state["cases"] = {suite_id: index_cases(suite) for suite_id, suite in suites.items()}
+    _process_state["scorers"] = {
+        suite_id: get_scorer_for_suite(suite, fail_fast=fail_fast)
+        for suite_id, suite in suites.items()
+    }
+
+
+def _rescore_in_process(run: EvalRun) -> EvalRun:
+    suite_id = run.suite_id
+    return rescore_run(
+        run,
+        _process_state["suites"][suite_id],
+        _process_state["scorers"][suite_id],
+        _process_state["cases"][suite_id],
+    )
+
+
+def _detach(run: EvalRun) -> EvalRun:
+    """Copy a run into plain EvalRun/EvalResults that can be pickled."""
+    results = [
+        r if type(r) is EvalResult
+        else EvalResult(**{f.name: getattr(r, f.name) for f in fields(EvalResult)})
+        for r in run.results
+    ]
+    attrs = {f.name: getattr(run, f.name) for f in fields(EvalRun) if f.name != "results"}
+    return EvalRun(results=results, **attrs)
+
+
+def rescore_runs(
+    runs: Iterable[EvalRun],
+    suites: dict[str, dict],
+    workers: int = 8,
+    fail_fast: bool = False,
+) -> Iterator[tuple[EvalRun, EvalRun]]:
+    """
+    Re-score runs in parallel, yielding (original, rescored) pairs in order.
+
+    ``runs`` is consumed lazily with at most ``2 * workers`` runs in flight,
+    so a store can be streamed without loading its whole history. Runs whose
+    suite is not in ``suites`` are skipped.
+
+    Rule scoring is CPU-bound, so when every suite uses rules the runs are
+    scored in ``workers`` processes; suites with an LLM judge are scored in
+    threads, which overlap the judge calls.
+
+    Args:
+        runs: Stored runs, e.g. from ``LocalStore.iter_runs``
+        suites: Loaded suites keyed by suite id
+        workers: Number of scoring processes or threads
+        fail_fast: Stop rule scoring at the first failing rule per case
+    """
+    scorers = {
+        suite_id: get_scorer_for_suite(suite, fail_fast=fail_fast)
+        for suite_id, suite in suites.items()
+    }
+    use_processes = workers > 1 and all(isinstance(s, RuleScorer) for s in scorers.values())
+    # Worker processes index the cases themselves (see _init_process)
+    cases = {} if use_processes else {
+        suite_id: index_cases(suite) for suite_id, suite in suites.items()
+    }
+    if use_processes:
+        # Spawned rather than forked: the caller may be running threads
+        # (e.g. BufferedStore's writer)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process,
+            initargs=(suites, fail_fast),
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    def submit(run: EvalRun) -> Future[EvalRun]:
+        if use_processes:
+            return pool.submit(_rescore_in_process, _detach(run))
+        suite_id = run.suite_id
+        return pool.submit(rescore_run, run, suites[suite_id], scorers[suite_id], cases[suite_id])
+
+    pending: deque[tuple[EvalRun, Future[EvalRun]]] = deque()
+    with pool:
+        for run in runs:
+            if run.suite_id not in suites:
+                continue
+            pending.append((run, submit(run)))
+            if len(pending) >= 2 * workers:
+                original, future = pending.popleft()
+                yield original, future.result()
+
+        while pending:
+            original, future = pending.popleft()
+            yield original, future.result()
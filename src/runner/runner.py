@@ -1,35 +1,122 @@
+import time
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timezone
 
-from src.clients.base import ModelClient, ModelRequest
+from src.clients.base import ModelClient, ModelRequest, ModelResponse, consume_stream
 from src.prompts import load_prompt, prompt_exists
-from src.scorers.base import Scorer
-from src.scorers.rules import RuleScorer
+from src.scorers.base import Scorer, ScoreResult
+from src.scorers.rules import RuleScorer, early_stop_check
 from src.scorers.llm import LLMScorer
 from src.store.base import EvalResult, EvalRun
-from src.utils.git import get_current_commit_hash
+from src.utils.env import get_run_environment
+from src.utils.pricing import estimate_cost, get_model_price
 
 
-def get_scorer_for_suite(suite: dict) -> Scorer:
+def get_scorer_for_suite(suite: dict, fail_fast: bool = False) -> Scorer:
     """Get the appropriate scorer based on suite configuration."""
     scorer_type = suite.get("scorer", "rules")
     
     if scorer_type == "llm":
         return LLMScorer()
     else:
-        return RuleScorer()
+        return RuleScorer(fail_fast=fail_fast)
+
+
+def get_case_expected(case: dict, suite: dict) -> dict:
+    """Get a case's expected block, with suite-level llm_criteria injected."""
+    expected = case.get("expected", {})
+    suite_llm_criteria = suite.get("llm_criteria", "")
+
+    # Inject suite-level llm_criteria if not specified at case level
+    if suite_llm_criteria and "llm_criteria" not in expected:
+        expected = {**expected, "llm_criteria": suite_llm_criteria}
+    return expected
+
+
+def estimate_result_cost(
+    model: str,
+    prompt_tokens: int | None,
+    completion_tokens: int | None,
+    score_result: ScoreResult,
+) -> float | None:
+    """
+    Combine the estimated generation cost with any judge cost.
+
+    Returns None when the model has a price but its token counts are
+    unknown (e.g. a stream cancelled before usage was reported), rather
+    than a total that leaves out the generation.
+    """
+    if get_model_price(model) is not None and (prompt_tokens is None or completion_tokens is None):
+        return None
+    costs = [
+        c
+        for c in (
+            estimate_cost(model, prompt_tokens, completion_tokens),
+            score_result.cost_usd,
+        )
+        if c is not None
+    ]
+    return sum(costs) if costs else None
+
+
+class RunAborted(Exception):
+    """Raised when a run is aborted between cases; carries the partial run."""
+
+    def __init__(self, run: EvalRun):
+        super().__init__(f"Run '{run.id}' aborted after {len(run.results)} case(s)")
+        self.run = run
 
 
 class Runner:
-    def __init__(self, client: ModelClient, scorer: Scorer | None = None):
+    def __init__(
+        self,
+        client: ModelClient,
+        scorer: Scorer | None = None,
+        stream: bool = False,
+    ):
         self.client = client
         self._scorer = scorer
+        # Streaming measures TTFT and lets rule-scored cases stop generating
+        # once a length limit is already exceeded. Clients without a
+        # ``stream`` method fall back to plain generation.
+        self.stream = stream and hasattr(client, "stream")
+
+    def _generate(
+        self, request: ModelRequest, expected: dict, scorer: Scorer
+    ) -> ModelResponse:
+        if not self.stream:
+            return self.client.generate(request)
+
+        # Only rule scoring judges length limits; an LLM judge needs the
+        # complete response.
+        stop_when = early_stop_check(expected) if isinstance(scorer, RuleScorer) else None
+        return consume_stream(self.client.stream(request), stop_when=stop_when)
 
     def run(
         self,
         suite: dict,
         system_prompt_name: str | None = None,
+        run_id: str | None = None,
+        on_result: Callable[[EvalResult], None] | None = None,
+        should_abort: Callable[[], bool] | None = None,
     ) -> EvalRun:
+        """
+        Run every case of a suite.
+
+        Args:
+            suite: Loaded suite
+            system_prompt_name: System prompt to send with each case
+            run_id: Id for the run (generated if omitted), so progress can
+                be reported under it before the run completes
+            on_result: Called with each result as soon as it is scored
+            should_abort: Checked before each case; returning True stops
+                the run and raises RunAborted with the results so far
+
+        Returns:
+            The completed run
+        """
+        run_id = run_id or str(uuid.uuid4())
         suite_id = suite["id"]
         cases = suite.get("cases", [])
         results: list[EvalResult] = []
@@ -38,9 +125,6 @@ class Runner:
         # Select scorer: use provided scorer or auto-select from suite config
         scorer = self._scorer if self._scorer else get_scorer_for_suite(suite)
         
-        # Get suite-level llm_criteria for LLM scoring
-        suite_llm_criteria = suite.get("llm_criteria", "")
-        
         # Load system prompt if specified
         system_prompt_content: str | None = None
         
@@ -51,47 +135,69 @@ class Runner:
                 )
             system_prompt_content = load_prompt(system_prompt_name)
 
+        def make_run() -> EvalRun:
+            environment = get_run_environment()  # Cached after the first run
+            return EvalRun(
+                id=run_id,
+                suite_id=suite_id,
+                model=model_name or "unknown",
+                timestamp=datetime.now(timezone.utc),
+                results=results,
+                system_prompt_name=system_prompt_name,
+                git_commit_hash=environment["git_commit"],
+                environment=environment,
+            )
+
         for case in cases:
+            if should_abort is not None and should_abort():
+                raise RunAborted(make_run())
+
             case_id = case["id"]
             prompt = case["prompt"]
-            expected = case.get("expected", {})
-            
-            # Inject suite-level llm_criteria if not specified at case level
-            if suite_llm_criteria and "llm_criteria" not in expected:
-                expected = {**expected, "llm_criteria": suite_llm_criteria}
+            expected = get_case_expected(case, suite)
 
-            response = self.client.generate(
+            started = time.perf_counter()
+            response = self._generate(
                 ModelRequest(
                     prompt=prompt,
                     system_prompt=system_prompt_content,
-                )
+                ),
+                expected,
+                scorer,
             )
+            latency_ms = (time.perf_counter() - started) * 1000
             model_name = response.model
 
             score_result = scorer.score(prompt, response.content, expected)
 
-            results.append(
-                EvalResult(
-                    id=str(uuid.uuid4()),
-                    suite_id=suite_id,
-                    case_id=case_id,
-                    model=response.model,
-                    prompt=prompt,
-                    response=response.content,
-                    passed=score_result.passed,
-                    score=score_result.score,
-                    reasons=score_result.reasons,
-                    timestamp=datetime.now(timezone.utc),
-                    system_prompt_name=system_prompt_name,
-                )
+            prompt_tokens = response.usage.get("prompt_tokens")
+            completion_tokens = response.usage.get("completion_tokens")
+
+            result = EvalResult(
+                id=str(uuid.uuid4()),
+                suite_id=suite_id,
+                case_id=case_id,
+                model=response.model,
+                prompt=prompt,
+                response=response.content,
+                passed=score_result.passed,
+                score=score_result.score,
+                reasons=score_result.reasons,
+                timestamp=datetime.now(timezone.utc),
+                system_prompt_name=system_prompt_name,
+                latency_ms=latency_ms,
+                ttft_ms=response.ttft_ms,
+                tokens_per_second=response.tokens_per_second,
+                finish_reason=response.finish_reason,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                judge_tokens=score_result.usage.get("total_tokens"),
+                cost_usd=estimate_result_cost(
+                    response.model, prompt_tokens, completion_tokens, score_result
+                ),
             )
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
 
-        return EvalRun(
-            id=str(uuid.uuid4()),
-            suite_id=suite_id,
-            model=model_name or "unknown",
-            timestamp=datetime.now(timezone.utc),
-            results=results,
-            system_prompt_name=system_prompt_name,
-            git_commit_hash=get_current_commit_hash(),
-        )
+        return make_run()
@@ -0,0 +1,172 @@
+"""Split a suite's cases into shards executed by queue workers.
+
+The coordinator (``run_sharded``) puts one ``shard`` job per slice of cases
+on a job queue and waits; any worker process or host consuming that queue
+(``python -m src.runner.worker``) runs its slice with a regular ``Runner``
+and returns the results. The coordinator then merges them, in case order,
+into a single EvalRun.
+
+Workers load the suite from ``suite_path`` themselves, so every host must
+see the suite file at the same path (same checkout or shared filesystem).
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+from multiprocessing.synchronize import Event
+from pathlib import Path
+
+from src.clients.tracing import tracing_policy
+from src.queue.base import CANCELLED, DONE, FAILED, Job, JobQueue
+from src.runner.loader import load_suite
+from src.runner.runner import Runner
+from src.store.base import EvalRun
+from src.store.codec import decode_run, encode_run
+from src.utils.env import get_run_environment
+
+# Job kind for running cases[start:stop] of a suite. Payload:
+# {"suite_path": str, "start": int, "stop": int, "model": str,
+#  "system_prompt": str | None, "stream": bool, "run_id": str,
+#  "tracing": str | None}
+SHARD_JOB = "shard"
+
+
+class ShardFailed(Exception):
+    """Raised by the coordinator when a shard job fails or is cancelled."""
+
+
+def split_cases(total: int, shard_size: int) -> list[tuple[int, int]]:
+    """Return ``(start, stop)`` slices covering ``total`` cases."""
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    return [(start, min(start + shard_size, total)) for start in range(0, total, shard_size)]
+
+
+def execute_shard_job(job: Job, queue: JobQueue, stop: Event | None = None) -> dict:
+    """
+    Run one shard's cases (worker side).
+
+    Args:
+        job: The claimed shard job
+        queue: Queue the job came from
+        stop: Set when the worker is shutting down; the shard then stops
+            after its current case
+
+    Returns:
+        The job result: the shard's partial run, encoded in the compact
+        record format
+
+    Raises:
+        RunAborted: If the shard job was cancelled or ``stop`` was set
+    """
+    from src.clients import get_client
+
+    payload = job.payload
+    suite = load_suite(payload["suite_path"])
+    cases = suite.get("cases", [])
+    shard_suite = {**suite, "cases": cases[payload["start"] : payload["stop"]]}
+
+    def should_abort():
+        return (stop is not None and stop.is_set()) or queue.is_cancel_requested(job.id)
+
+    runner = Runner(client=get_client(payload["model"]), stream=payload.get("stream", False))
+    with tracing_policy(payload.get("tracing")):
+        run = runner.run(
+            shard_suite,
+            system_prompt_name=payload.get("system_prompt"),
+            run_id=payload["run_id"],
+            on_result=lambda _: queue.heartbeat(job.id),
+            should_abort=should_abort,
+        )
+    return {"run": encode_run(run, "compact")}
+
+
+def run_sharded(
+    queue: JobQueue,
+    suite_path: str | Path,
+    model: str,
+    shard_size: int,
+    system_prompt_name: str | None = None,
+    stream: bool = False,
+    poll_interval: float = 1.0,
+    tracing: str | None = None,
+) -> EvalRun:
+    """
+    Run a suite through queue workers, in shards of ``shard_size`` cases.
+
+    Args:
+        queue: Job queue consumed by the workers
+        suite_path: Suite file, as seen by the workers
+        model: Model to evaluate
+        shard_size: Maximum cases per shard job
+        system_prompt_name: System prompt to send with each case
+        stream: Ask workers to stream generations
+        poll_interval: Seconds between checks on the shard jobs
+        tracing: Tracing policy for the shards (default: each worker's)
+
+    Returns:
+        One run holding every shard's results, in suite order. Its revision
+        is left unset for the caller to assign.
+
+    Raises:
+        ShardFailed: If any shard fails or is cancelled; the remaining
+            shards are cancelled
+    """
+    suite_path = Path(suite_path).resolve()
+    suite = load_suite(str(suite_path))
+    run_id = str(uuid.uuid4())
+
+    job_ids = [
+        queue.put(
+            SHARD_JOB,
+            {
+                "suite_path": str(suite_path),
+                "start": start,
+                "stop": stop,
+                "model": model,
+                "system_prompt": system_prompt_name,
+                "stream": stream,
+                "run_id": run_id,
+                "tracing": tracing,
+            },
+        )
+        for start, stop in split_cases(len(suite.get("cases", [])), shard_size)
+    ]
+
+    shard_runs: dict[str, EvalRun] = {}
+    try:
+        while len(shard_runs) < len(job_ids):
+            for job_id in job_ids:
+                if job_id in shard_runs:
+                    continue
+                job = queue.get(job_id)
+                if job.status == DONE:
+                    shard_runs[job_id] = decode_run(job.result["run"])
+                    # Collected: don't keep a copy of every response in the queue
+                    queue.clear_result(job_id)
+                elif job.status in (FAILED, CANCELLED):
+                    raise ShardFailed(
+                        f"Shard {job_ids.index(job_id) + 1}/{len(job_ids)} "
+                        f"{job.status}: {job.error or 'cancelled'}"
+                    )
+            if len(shard_runs) < len(job_ids):
+                time.sleep(poll_interval)
+    except BaseException:
+        for job_id in job_ids:
+            if job_id not in shard_runs:
+                queue.cancel(job_id)
+        raise
+
+    ordered = [shard_runs[job_id] for job_id in job_ids]
+    models = [run.model for run in ordered if run.model != "unknown"]
+    environment = get_run_environment()
+    return EvalRun(
+        id=run_id,
+        suite_id=suite["id"],
+        model=models[0] if models else "unknown",
+        timestamp=datetime.now(timezone.utc),
+        results=[result for run in ordered for result in run.results],
+        system_prompt_name=system_prompt_name,
+        git_commit_hash=environment["git_commit"],
+        environment=environment,
+    )
@@ -0,0 +1,252 @@
+"""Worker processes that execute evaluation jobs from the job queue.
+
+Start a pool with ``python -m src.runner.worker --workers 4``. Each worker
+process claims one job at a time:
+
+- ``run`` jobs (from ``POST /api/runs``) run a suite with ``Runner``,
+  publishing live progress like the CLI, and save the runs to the
+  configured store
+- ``shard`` jobs (from ``run_sharded``) run a slice of a suite's cases and
+  hand the results back to the coordinator through the queue
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import uuid
+from multiprocessing.synchronize import Event
+from pathlib import Path
+
+from src.clients.tracing import tracing_policy
+from src.queue import SQLiteQueue, get_job_queue
+from src.queue.base import Job
+from src.runner.live import LiveRun
+from src.runner.loader import find_suite_path, load_suite
+from src.runner.runner import RunAborted, Runner
+from src.runner.shard import SHARD_JOB, execute_shard_job
+from src.store.factory import get_store
+from src.utils.env import get_run_environment
+
+logger = logging.getLogger(__name__)
+
+# Job kind for evaluating one suite against one or more models. Payload:
+# {"suite_id": str, "models": [str], "system_prompt": str | None, "stream": bool,
+#  "tracing": str | None}
+RUN_JOB = "run"
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job when it stopped early, because its cancellation was
+    requested or the worker is shutting down.
+    """
+
+
+def execute_run_job(
+    job: Job,
+    queue: SQLiteQueue,
+    store,
+    suites_dir: Path | None = None,
+    stop: Event | None = None,
+) -> dict:
+    """
+    Run a suite against each requested model and save the runs.
+
+    All runs of a job share one revision. Progress is published with
+    ``queue.heartbeat`` (which also keeps the job's lease alive) and through
+    ``LiveRun``. The result records each finished model's run, so when a job
+    is claimed again (after a shutdown or a lost worker) those models are
+    skipped rather than run and saved twice.
+
+    Args:
+        job: The claimed run job
+        queue: Queue the job came from
+        store: Store the runs are saved to
+        suites_dir: Directory searched for the suite (default: suites/)
+        stop: Set when the worker is shutting down; the job then stops
+            after its current case
+
+    Returns:
+        The job result: the saved run ids and their revision
+
+    Raises:
+        JobCancelled: If the job was cancelled or ``stop`` was set; runs
+            already finished are saved and the partial result is attached
+            to the exception
+    """
+    from src.clients import get_client
+
+    payload = job.payload
+    suite_path = find_suite_path(payload["suite_id"], suites_dir)
+    if suite_path is None:
+        raise ValueError(f"Suite '{payload['suite_id']}' not found")
+    suite = load_suite(str(suite_path))
+
+    # Models run in order, so a previous attempt finished the first len(run_ids)
+    previous = job.result
+    revision = previous["revision"] if "revision" in previous else store.reserve_revision()
+    run_ids: list[str] = list(previous.get("run_ids", []))
+    result = {"run_ids": run_ids, "revision": revision}
+
+    for model in payload["models"][len(run_ids):]:
+        runner = Runner(client=get_client(model), stream=payload.get("stream", False))
+        run_id = str(uuid.uuid4())
+        # The live heartbeat also renews the job's lease during slow cases
+        live = LiveRun(
+            run_id,
+            suite["id"],
+            model,
+            len(suite.get("cases", [])),
+            on_heartbeat=lambda: queue.heartbeat(job.id),
+        )
+
+        def on_result(r, live=live):
+            live.on_result(r)
+            queue.heartbeat(job.id)
+
+        def should_abort(live=live):
+            return (
+                (stop is not None and stop.is_set())
+                or live.should_abort()
+                or queue.is_cancel_requested(job.id)
+            )
+
+        try:
+            queue.heartbeat(job.id, {**result, "current_run_id": run_id})
+            with tracing_policy(payload.get("tracing")):
+                run = runner.run(
+                    suite,
+                    system_prompt_name=payload.get("system_prompt"),
+                    run_id=run_id,
+                    on_result=on_result,
+                    should_abort=should_abort,
+                )
+        except RunAborted:
+            live.finish("aborted")
+            raise JobCancelled(result)
+        except BaseException:
+            live.finish("failed")
+            raise
+        live.finish()
+
+        run.revision = revision
+        store.save_run(run)
+        run_ids.append(run.id)
+        queue.heartbeat(job.id, result)
+
+    return result
+
+
+def process_next_job(
+    queue: SQLiteQueue,
+    store,
+    worker: str,
+    suites_dir: Path | None = None,
+    stop: Event | None = None,
+) -> bool:
+    """
+    Claim and execute one job.
+
+    If ``stop`` is set while the job runs, the job stops after its current
+    case and is put back in the queue for another worker to finish.
+
+    Returns:
+        False if the queue had no job to run
+    """
+    job = queue.claim([RUN_JOB, SHARD_JOB], worker)
+    if job is None:
+        return False
+
+    def stop_early(result: dict | None = None) -> None:
+        if stop is not None and stop.is_set() and not queue.is_cancel_requested(job.id):
+            logger.info("Worker %s shutting down; releasing job %s", worker, job.id)
+            queue.release(job.id, result)
+        else:
+            queue.mark_cancelled(job.id, result)
+
+    logger.info("Worker %s running %s job %s", worker, job.kind, job.id)
+    try:
+        if job.kind == SHARD_JOB:
+            result = execute_shard_job(job, queue, stop)
+        else:
+            result = execute_run_job(job, queue, store, suites_dir, stop)
+    except JobCancelled as e:
+        stop_early(e.args[0])
+    except RunAborted:
+        stop_early()
+    except Exception as e:
+        logger.exception("Job %s failed", job.id)
+        queue.fail(job.id, f"{type(e).__name__}: {e}")
+    else:
+        queue.complete(job.id, result)
+    return True
+
+
+def work(stop: Event, poll_interval: float = 1.0) -> None:
+    """Process jobs until ``stop`` is set, or the process receives SIGTERM."""
+    # The parent handles Ctrl-C and signals shutdown through ``stop``
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def terminate(signum, frame):
+        # systemd signals every process of the service. Set ``stop`` from
+        # another thread: this one may be holding the event's lock.
+        threading.Thread(target=stop.set).start()
+
+    signal.signal(signal.SIGTERM, terminate)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    get_run_environment()  # Captured once, before the first job
+    queue = get_job_queue()
+    store = get_store()
+    while not stop.is_set():
+        if not process_next_job(queue, store, worker, stop=stop):
+            stop.wait(poll_interval)
+
+
+def serve(workers: int, poll_interval: float = 1.0) -> None:
+    """Run a pool of worker processes until interrupted or terminated."""
+    stop = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(target=work, args=(stop, poll_interval), name=f"worker-{i}")
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    def shutdown(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        stop.set()
+        for process in processes:
+            process.join()
+
+
+def main():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Run queued evaluation jobs")
+    parser.add_argument(
+        "-n", "--workers", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--poll", type=float, default=1.0,
+        help="Seconds between queue checks when idle (default: 1.0)"
+    )
+    args = parser.parse_args()
+    serve(args.workers, args.poll)
+
+
+if __name__ == "__main__":
+    main()
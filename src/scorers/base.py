@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 
 
@@ -7,6 +7,8 @@ class ScoreResult:
     passed: bool
     score: float  # 0.0 to 1.0
     reasons: list[str]
+    usage: dict = field(default_factory=dict)  # Judge token usage, if any
+    cost_usd: float | None = None  # Estimated judge cost, if any
 
 
 class Scorer(Protocol):
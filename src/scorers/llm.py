@@ -2,9 +2,10 @@
 
 import json
 
-from src.clients.openai import OpenAIClient
 from src.clients.base import ModelRequest
+from src.clients.factory import get_client
 from src.scorers.base import ScoreResult
+from src.utils.pricing import estimate_cost
 
 
 JUDGE_SYSTEM_PROMPT = """You are an evaluation judge. Your task is to assess whether an AI assistant's response meets the specified criteria.
@@ -37,7 +38,8 @@ class LLMScorer:
     """Scorer that uses an LLM as judge to evaluate responses."""
 
     def __init__(self, model: str = "gpt-4.1"):
-        self.client = OpenAIClient(model=model)
+        # Shared with every other scorer and run using the judge model
+        self.client = get_client(model)
 
     def score(self, prompt: str, response: str, expected: dict) -> ScoreResult:
         """
@@ -72,6 +74,13 @@ class LLMScorer:
             )
         )
 
+        usage = judge_response.usage
+        cost = estimate_cost(
+            judge_response.model,
+            usage.get("prompt_tokens"),
+            usage.get("completion_tokens"),
+        )
+
         # Parse the JSON response
         try:
             result = json.loads(judge_response.content)
@@ -82,6 +91,8 @@ class LLMScorer:
                 passed=passed,
                 score=1.0 if passed else 0.0,
                 reasons=[reasoning],
+                usage=usage,
+                cost_usd=cost,
             )
         except json.JSONDecodeError:
             # If JSON parsing fails, try to extract meaning from response
@@ -92,4 +103,6 @@ class LLMScorer:
                 passed=passed,
                 score=1.0 if passed else 0.0,
                 reasons=[f"Judge response (unparsed): {judge_response.content[:200]}"],
+                usage=usage,
+                cost_usd=cost,
             )
@@ -0,0 +1,80 @@
+"""Multi-pattern substring matching for rule scoring."""
+
+from collections import deque
+from collections.abc import Iterable
+
+# Below this many patterns, per-pattern ``in`` scans (implemented in C) beat a
+# pure-Python automaton walk, so the matcher only builds one for larger sets.
+AUTOMATON_MIN_PATTERNS = 8
+
+
+class PatternMatcher:
+    """
+    Find which of a fixed set of patterns occur in a text.
+
+    Large pattern sets are compiled into an Aho-Corasick automaton, so a
+    single pass over the text finds every pattern and the cost stays linear
+    in text length no matter how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: tuple[str, ...] = tuple(dict.fromkeys(patterns))
+        self._use_automaton = len(self.patterns) >= AUTOMATON_MIN_PATTERNS
+        if self._use_automaton:
+            self._build()
+
+    def _build(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        output: list[set[int]] = [set()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(set())
+                state = next_state
+            output[state].add(index)
+
+        # Breadth-first pass to compute failure links and merge the outputs
+        # of each state's longest proper suffix state.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] |= output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [frozenset(o) for o in output]
+
+    def find(self, text: str) -> set[str]:
+        """Return the set of patterns that occur in ``text``."""
+        if not self._use_automaton:
+            return {p for p in self.patterns if p in text}
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found: set[int] = set(output[0])  # The empty pattern always matches
+        remaining = len(self.patterns) - len(found)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                new = output[state] - found
+                if new:
+                    found |= new
+                    remaining -= len(new)
+                    if not remaining:
+                        break
+        return {self.patterns[i] for i in found}
@@ -1,71 +1,292 @@
 import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from src.scorers.base import ScoreResult
+from src.scorers.matching import PatternMatcher
 
 
-class RuleScorer:
-    def score(self, prompt: str, response: str, expected: dict) -> ScoreResult:
-        reasons: list[str] = []
+class _Response:
+    """Response text with derived views computed at most once per response."""
 
-        if "contains" in expected:
-            if expected["contains"] not in response:
-                reasons.append(f"Contains: expected '{expected['contains']}' not found")
-
-        if "contains_any" in expected:
-            if not any(s in response for s in expected["contains_any"]):
-                reasons.append(
-                    f"Contains_any: none of {expected['contains_any']} found"
-                )
-
-        if "max_length" in expected:
-            if len(response) > expected["max_length"]:
-                reasons.append(
-                    f"Length: {len(response)} exceeds max {expected['max_length']}"
-                )
-
-        if "min_length" in expected:
-            if len(response) < expected["min_length"]:
-                reasons.append(
-                    f"Length: {len(response)} below min {expected['min_length']}"
-                )
-
-        # Word count rules
-        word_count = len(response.split())
-
-        if "max_words" in expected:
-            if word_count > expected["max_words"]:
-                reasons.append(
-                    f"Word count: {word_count} exceeds max {expected['max_words']}"
-                )
-
-        if "min_words" in expected:
-            if word_count < expected["min_words"]:
-                reasons.append(
-                    f"Word count: {word_count} below min {expected['min_words']}"
-                )
-
-        if "exact_words" in expected:
-            if word_count != expected["exact_words"]:
-                reasons.append(
-                    f"Word count: {word_count} != expected {expected['exact_words']}"
-                )
-
-        if "valid_json" in expected and expected["valid_json"]:
-            try:
-                json.loads(response)
-            except json.JSONDecodeError:
-                reasons.append("JSON: invalid JSON")
+    __slots__ = ("text", "_found", "_word_count", "_json_parsed", "_json_data")
 
-        if "json_has_keys" in expected:
+    def __init__(self, text: str):
+        self.text = text
+        self._found: set[str] | None = None
+        self._word_count: int | None = None
+        self._json_parsed: bool | None = None
+        self._json_data: Any = None
+
+    def found(self, matcher: PatternMatcher) -> set[str]:
+        """Return the patterns of the plan's matcher present in the text."""
+        if self._found is None:
+            self._found = matcher.find(self.text)
+        return self._found
+
+    @property
+    def word_count(self) -> int:
+        if self._word_count is None:
+            self._word_count = len(self.text.split())
+        return self._word_count
+
+    def json(self) -> tuple[bool, Any]:
+        """Return (ok, data) for the response parsed as JSON."""
+        if self._json_parsed is None:
             try:
-                data = json.loads(response)
-                missing = [k for k in expected["json_has_keys"] if k not in data]
-                if missing:
-                    reasons.append(f"JSON keys: missing {missing}")
+                self._json_data = json.loads(self.text)
+                self._json_parsed = True
             except json.JSONDecodeError:
-                reasons.append("JSON keys: cannot parse JSON")
+                self._json_parsed = False
+        return self._json_parsed, self._json_data
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    cost: int  # Relative evaluation cost; cheaper rules run first
+    check: Callable[[_Response], str | None]  # Returns a failure reason or None
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """The rules of one ``expected`` block, ordered cheapest-first."""
+
+    rules: tuple[Rule, ...]
+
+    def evaluate(self, response: str, fail_fast: bool = False) -> ScoreResult:
+        """
+        Check a response against every rule in the plan.
+
+        Args:
+            response: The model's response text
+            fail_fast: Stop at the first failing rule instead of collecting
+                every failure reason (useful for bulk re-scoring)
+        """
+        view = _Response(response)
+        reasons: list[str] = []
+        for rule in self.rules:
+            reason = rule.check(view)
+            if reason is not None:
+                reasons.append(reason)
+                if fail_fast:
+                    break
 
         passed = len(reasons) == 0
         score = 1.0 if passed else 0.0
 
         return ScoreResult(passed=passed, score=score, reasons=reasons)
+
+
+# Evaluation cost tiers: O(1) length checks, then substring scans, then
+# tokenizing into words, then JSON parsing.
+_COST_LENGTH = 0
+_COST_SUBSTRING = 1
+_COST_WORDS = 2
+_COST_JSON = 3
+
+
+def _as_list(value: str | list[str]) -> list[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def compile_rules(expected: dict) -> RulePlan:
+    """Compile an ``expected`` block into a RulePlan."""
+    rules: list[Rule] = []
+
+    # Every substring rule shares one matcher, so the response is scanned
+    # once for all of the case's patterns.
+    patterns: list[str] = []
+    for key in ("contains", "not_contains", "contains_any", "contains_all"):
+        if key in expected:
+            patterns.extend(_as_list(expected[key]))
+    matcher = PatternMatcher(patterns)
+
+    if "contains" in expected:
+        needle = expected["contains"]
+
+        def check_contains(r: _Response) -> str | None:
+            if needle not in r.found(matcher):
+                return f"Contains: expected '{needle}' not found"
+            return None
+
+        rules.append(Rule("contains", _COST_SUBSTRING, check_contains))
+
+    if "not_contains" in expected:
+        forbidden = _as_list(expected["not_contains"])
+
+        def check_not_contains(r: _Response) -> str | None:
+            present = [s for s in forbidden if s in r.found(matcher)]
+            if present:
+                return f"Not_contains: found forbidden {present}"
+            return None
+
+        rules.append(Rule("not_contains", _COST_SUBSTRING, check_not_contains))
+
+    if "contains_any" in expected:
+        needles = expected["contains_any"]
+
+        def check_contains_any(r: _Response) -> str | None:
+            if r.found(matcher).isdisjoint(needles):
+                return f"Contains_any: none of {needles} found"
+            return None
+
+        rules.append(Rule("contains_any", _COST_SUBSTRING, check_contains_any))
+
+    if "contains_all" in expected:
+        required = expected["contains_all"]
+
+        def check_contains_all(r: _Response) -> str | None:
+            missing = [s for s in required if s not in r.found(matcher)]
+            if missing:
+                return f"Contains_all: missing {missing}"
+            return None
+
+        rules.append(Rule("contains_all", _COST_SUBSTRING, check_contains_all))
+
+    if "max_length" in expected:
+        max_length = expected["max_length"]
+
+        def check_max_length(r: _Response) -> str | None:
+            if len(r.text) > max_length:
+                return f"Length: {len(r.text)} exceeds max {max_length}"
+            return None
+
+        rules.append(Rule("max_length", _COST_LENGTH, check_max_length))
+
+    if "min_length" in expected:
+        min_length = expected["min_length"]
+
+        def check_min_length(r: _Response) -> str | None:
+            if len(r.text) < min_length:
+                return f"Length: {len(r.text)} below min {min_length}"
+            return None
+
+        rules.append(Rule("min_length", _COST_LENGTH, check_min_length))
+
+    # Word count rules
+    if "max_words" in expected:
+        max_words = expected["max_words"]
+
+        def check_max_words(r: _Response) -> str | None:
+            if r.word_count > max_words:
+                return f"Word count: {r.word_count} exceeds max {max_words}"
+            return None
+
+        rules.append(Rule("max_words", _COST_WORDS, check_max_words))
+
+    if "min_words" in expected:
+        min_words = expected["min_words"]
+
+        def check_min_words(r: _Response) -> str | None:
+            if r.word_count < min_words:
+                return f"Word count: {r.word_count} below min {min_words}"
+            return None
+
+        rules.append(Rule("min_words", _COST_WORDS, check_min_words))
+
+    if "exact_words" in expected:
+        exact_words = expected["exact_words"]
+
+        def check_exact_words(r: _Response) -> str | None:
+            if r.word_count != exact_words:
+                return f"Word count: {r.word_count} != expected {exact_words}"
+            return None
+
+        rules.append(Rule("exact_words", _COST_WORDS, check_exact_words))
+
+    if "valid_json" in expected and expected["valid_json"]:
+
+        def check_valid_json(r: _Response) -> str | None:
+            ok, _ = r.json()
+            if not ok:
+                return "JSON: invalid JSON"
+            return None
+
+        rules.append(Rule("valid_json", _COST_JSON, check_valid_json))
+
+    if "json_has_keys" in expected:
+        keys = expected["json_has_keys"]
+
+        def check_json_has_keys(r: _Response) -> str | None:
+            ok, data = r.json()
+            if not ok:
+                return "JSON keys: cannot parse JSON"
+            try:
+                missing = [k for k in keys if k not in data]
+            except TypeError:
+                # Scalars such as numbers support no membership test
+                missing = list(keys)
+            if missing:
+                return f"JSON keys: missing {missing}"
+            return None
+
+        rules.append(Rule("json_has_keys", _COST_JSON, check_json_has_keys))
+
+    # sorted() is stable, so rules of equal cost keep their declaration order
+    return RulePlan(rules=tuple(sorted(rules, key=lambda rule: rule.cost)))
+
+
+class CompiledExpected(dict):
+    """
+    An ``expected`` block that carries its precompiled RulePlan.
+
+    Suites compile these once at load time so scoring never re-interprets
+    the raw dict. Treat instances as read-only; the plan is not refreshed
+    on mutation.
+    """
+
+    __slots__ = ("plan",)
+
+    def __init__(self, expected: dict):
+        super().__init__(expected)
+        self.plan = compile_rules(expected)
+
+    def __reduce__(self):
+        # Plans hold closures, so pickles (e.g. for worker processes) carry
+        # the raw block and recompile it
+        return (CompiledExpected, (dict(self),))
+
+
+class RuleScorer:
+    def __init__(self, fail_fast: bool = False):
+        self.fail_fast = fail_fast
+
+    def score(self, prompt: str, response: str, expected: dict) -> ScoreResult:
+        if isinstance(expected, CompiledExpected):
+            plan = expected.plan
+        else:
+            plan = compile_rules(expected)
+        return plan.evaluate(response, fail_fast=self.fail_fast)
+
+
+def early_stop_check(expected: dict) -> Callable[[str], bool] | None:
+    """
+    Build a predicate that detects when a partial response has already failed.
+
+    Only rules that can never recover as more text arrives are considered
+    (``max_length``, ``max_words`` and overshooting ``exact_words``), so a
+    streamed generation can be abandoned as soon as the predicate fires.
+
+    Returns:
+        The predicate, or None if the expected block has no such rule
+    """
+    max_length = expected.get("max_length")
+    max_words = min(
+        (expected[k] for k in ("max_words", "exact_words") if k in expected),
+        default=None,
+    )
+    if max_length is None and max_words is None:
+        return None
+
+    def exceeded(partial: str) -> bool:
+        if max_length is not None and len(partial) > max_length:
+            return True
+        # A response of n characters holds at most (n + 1) // 2 words, which
+        # lets us skip re-splitting until the limit is reachable at all.
+        if max_words is not None and (len(partial) + 1) // 2 > max_words:
+            return len(partial.split()) > max_words
+        return False
+
+    return exceeded
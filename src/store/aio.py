@@ -0,0 +1,138 @@
+"""Async access to a run store, for the API server."""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from src.store.base import EvalRun
+
+
+class AsyncStore:
+    """
+    Awaitable wrapper around a synchronous store.
+
+    Store calls run in worker threads (``asyncio.to_thread``) so blocking
+    file or database I/O never stalls the event loop.
+
+    Results of ``get_run`` and ``list_runs`` are cached in memory. When the
+    wrapped store provides ``version()`` (a cheap token that changes on any
+    write, by any process), each lookup first compares it with the version
+    the cache was filled at and drops the cache if it moved, so several
+    server worker processes sharing one store never serve stale runs. Stores
+    without ``version()`` are not cached.
+
+    ``cached`` extends the same cache to values derived from the store,
+    such as serialized response bodies.
+
+    Cached objects are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, store, cache_size: int = 128):
+        """
+        Args:
+            store: The synchronous store to wrap
+            cache_size: Maximum number of runs kept by ``get_run``, and of
+                values kept by ``cached``
+        """
+        self.store = store
+        self.cache_size = cache_size
+        self._runs: OrderedDict[str, EvalRun | None] = OrderedDict()
+        self._lists: dict[str | None, list[EvalRun]] = {}
+        self._derived: OrderedDict[Hashable, Any] = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name == "store":  # Not yet set, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    def _current_version(self):
+        """Check the store version, clearing the caches if it changed."""
+        if not hasattr(self.store, "version"):
+            return None
+        version = self.store.version()
+        with self._lock:
+            if version != self._version:
+                self._runs.clear()
+                self._lists.clear()
+                self._derived.clear()
+                self._version = version
+        return version
+
+    def _get_run(self, run_id: str) -> EvalRun | None:
+        version = self._current_version()
+        if version is not None:
+            with self._lock:
+                if run_id in self._runs:
+                    self._runs.move_to_end(run_id)
+                    return self._runs[run_id]
+
+        run = self.store.get_run(run_id)
+
+        if version is not None:
+            with self._lock:
+                # Only cache if no write happened while we were reading
+                if version == self._version:
+                    self._runs[run_id] = run
+                    while len(self._runs) > self.cache_size:
+                        self._runs.popitem(last=False)
+        return run
+
+    def _list_runs(self, suite_id: str | None) -> list[EvalRun]:
+        version = self._current_version()
+        if version is not None:
+            with self._lock:
+                if suite_id in self._lists:
+                    return self._lists[suite_id]
+
+        runs = self.store.list_runs(suite_id)
+
+        if version is not None:
+            with self._lock:
+                if version == self._version:
+                    self._lists[suite_id] = runs
+        return runs
+
+    def _cached(self, key: Hashable, compute: Callable[[Any], Any]) -> Any:
+        version = self._current_version()
+        if version is not None:
+            with self._lock:
+                if key in self._derived:
+                    self._derived.move_to_end(key)
+                    return self._derived[key]
+
+        value = compute(self.store)
+
+        if version is not None:
+            with self._lock:
+                if version == self._version:
+                    self._derived[key] = value
+                    while len(self._derived) > self.cache_size:
+                        self._derived.popitem(last=False)
+        return value
+
+    async def cached(self, key: Hashable, compute: Callable[[Any], Any]) -> Any:
+        """
+        Compute a value from the wrapped store, or return it from the cache.
+
+        Args:
+            key: Cache key identifying the value
+            compute: Called with the synchronous store, in a worker thread
+
+        Returns:
+            The value computed now or at an earlier call with the same key
+            since the store last changed
+        """
+        return await asyncio.to_thread(self._cached, key, compute)
+
+    async def get_run(self, run_id: str) -> EvalRun | None:
+        return await asyncio.to_thread(self._get_run, run_id)
+
+    async def list_runs(self, suite_id: str | None = None) -> list[EvalRun]:
+        return await asyncio.to_thread(self._list_runs, suite_id)
+
+    async def save_run(self, run: EvalRun) -> None:
+        await asyncio.to_thread(self.store.save_run, run)
@@ -1,9 +1,10 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     id: str
     suite_id: str
@@ -16,9 +17,81 @@ class EvalResult:
     reasons: list[str]
     timestamp: datetime
     system_prompt_name: str | None = None
+    latency_ms: float | None = None  # Wall-clock time of the generation call
+    ttft_ms: float | None = None  # Time to first token, when streamed
+    tokens_per_second: float | None = None  # Output throughput, when streamed
+    finish_reason: str | None = None  # "cancelled" if stopped early
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    judge_tokens: int | None = None  # Tokens spent by an LLM judge, if any
+    cost_usd: float | None = None  # Estimated generation + judge cost
 
 
 @dataclass
+class RunStats:
+    """Run-level rollup of per-result performance and spend."""
+
+    total: int
+    passed: int
+    prompt_tokens: int
+    completion_tokens: int
+    judge_tokens: int
+    cost_usd: float | None
+    mean_latency_ms: float | None
+    p95_latency_ms: float | None
+    mean_ttft_ms: float | None
+    mean_tokens_per_second: float | None
+
+
+def compute_run_stats(results: Iterable[EvalResult]) -> RunStats:
+    """
+    Aggregate token usage, cost and latency over a run's results.
+
+    Results are consumed in a single pass, so a generator works too.
+    """
+    total = passed = prompt_tokens = completion_tokens = judge_tokens = 0
+    latencies: list[float] = []
+    ttfts: list[float] = []
+    throughputs: list[float] = []
+    costs: list[float] = []
+
+    for r in results:
+        total += 1
+        passed += r.passed
+        prompt_tokens += r.prompt_tokens or 0
+        completion_tokens += r.completion_tokens or 0
+        judge_tokens += r.judge_tokens or 0
+        if r.latency_ms is not None:
+            latencies.append(r.latency_ms)
+        if r.ttft_ms is not None:
+            ttfts.append(r.ttft_ms)
+        if r.tokens_per_second is not None:
+            throughputs.append(r.tokens_per_second)
+        if r.cost_usd is not None:
+            costs.append(r.cost_usd)
+
+    latencies.sort()
+    p95_latency = None
+    if latencies:
+        p95_latency = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    return RunStats(
+        total=total,
+        passed=passed,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        judge_tokens=judge_tokens,
+        cost_usd=sum(costs) if costs else None,
+        mean_latency_ms=sum(latencies) / len(latencies) if latencies else None,
+        p95_latency_ms=p95_latency,
+        mean_ttft_ms=sum(ttfts) / len(ttfts) if ttfts else None,
+        mean_tokens_per_second=(
+            sum(throughputs) / len(throughputs) if throughputs else None
+        ),
+    )
+
+
+@dataclass(slots=True)
 class EvalRun:
     id: str
     suite_id: str
@@ -28,6 +101,12 @@ class EvalRun:
     system_prompt_name: str | None = None
     revision: int | None = None  # Global sequential revision number
     git_commit_hash: str | None = None  # Auto-detected git commit
+    rescored_from: str | None = None  # Run whose stored responses were re-scored
+    environment: dict | None = None  # Code and package versions (see src.utils.env)
+
+    @property
+    def stats(self) -> RunStats:
+        return compute_run_stats(self.results)
 
 
 class ResultStore(Protocol):
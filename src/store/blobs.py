@@ -0,0 +1,88 @@
+"""Content-addressed storage for prompt and response bodies."""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from src.store.base import EvalResult
+from src.utils.files import atomic_write_bytes
+
+
+class BlobStore:
+    """
+    Stores text bodies once each, addressed by their SHA-256 digest.
+
+    Blobs live at ``<root>/<first two hex digits>/<digest>`` so no single
+    directory grows with the number of unique bodies. Reads are cached per
+    instance. Blobs are never garbage-collected.
+    """
+
+    def __init__(self, root: Path, cache_size: int = 4096):
+        self.root = root
+        self.get = lru_cache(maxsize=cache_size)(self._read)
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, text: str) -> str:
+        """Store a body if it is not already present and return its digest."""
+        digest = self.digest(text)
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Blobs are immutable, so two writers racing on the same body
+            # both replace it with identical content.
+            atomic_write_bytes(path, text.encode(), fsync=False)
+        return digest
+
+    def _read(self, digest: str) -> str:
+        return self._path(digest).read_bytes().decode()
+
+
+class BlobBackedResult(EvalResult):
+    """
+    An EvalResult whose prompt and response are read from a BlobStore only
+    when first accessed, so metadata-only consumers never load the bodies.
+    """
+
+    __slots__ = ("_blobs", "prompt_ref", "response_ref", "_prompt", "_response")
+
+    def __init__(self, *args, **kwargs):
+        self._blobs: BlobStore | None = None
+        self.prompt_ref: str | None = None
+        self.response_ref: str | None = None
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_refs(
+        cls, blobs: BlobStore, prompt_ref: str, response_ref: str, **fields
+    ) -> "BlobBackedResult":
+        result = cls(prompt=None, response=None, **fields)
+        result._blobs = blobs
+        result.prompt_ref = prompt_ref
+        result.response_ref = response_ref
+        return result
+
+    @property
+    def prompt(self) -> str:
+        if self._prompt is None and self.prompt_ref is not None:
+            self._prompt = self._blobs.get(self.prompt_ref)
+        return self._prompt
+
+    @prompt.setter
+    def prompt(self, value: str | None) -> None:
+        self._prompt = value
+
+    @property
+    def response(self) -> str:
+        if self._response is None and self.response_ref is not None:
+            self._response = self._blobs.get(self.response_ref)
+        return self._response
+
+    @response.setter
+    def response(self, value: str | None) -> None:
+        self._response = value
@@ -0,0 +1,164 @@
+"""Write-behind wrapper that saves runs on a background thread."""
+
+import atexit
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+
+from src.store.base import EvalRun
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling the flush thread to exit
+_STOP = object()
+
+
+class BufferedStore:
+    """
+    Queue runs for saving and write them to the wrapped store in batches.
+
+    ``save_run`` returns as soon as the run is queued; a background thread
+    hands queued runs to the wrapped store's ``save_runs`` (or ``save_run``
+    one at a time) in batches of up to ``batch_size``, so the lock, revision
+    and index updates are amortized over the batch. At most ``max_pending``
+    runs wait in the queue: beyond that ``save_run`` blocks until the writer
+    catches up, which bounds memory when producers outpace the disk.
+
+    Reads see queued runs as if they were already saved. ``flush()`` waits
+    for everything queued so far to be written and re-raises the first
+    error the writer hit; ``close()`` (also called at interpreter exit)
+    flushes and stops the thread. Other attributes, such as
+    ``reserve_revision``, are forwarded to the wrapped store.
+    """
+
+    def __init__(self, store, max_pending: int = 64, batch_size: int = 16):
+        """
+        Args:
+            store: The store to write to
+            max_pending: Queue bound; save_run blocks while it is full
+            batch_size: Maximum runs per write to the wrapped store
+        """
+        self.store = store
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._pending: dict[str, EvalRun] = {}
+        self._pending_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def __getattr__(self, name):
+        if name == "store":  # Not yet set, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._flush_loop, name="store-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: list[EvalRun]) -> None:
+        try:
+            if hasattr(self.store, "save_runs"):
+                self.store.save_runs(batch)
+            else:
+                for run in batch:
+                    self.store.save_run(run)
+        except BaseException as e:
+            logger.exception("Failed to save %d run(s)", len(batch))
+            if self._error is None:
+                self._error = e
+        finally:
+            with self._pending_lock:
+                for run in batch:
+                    # A newer save of the same id may have been queued since
+                    if self._pending.get(run.id) is run:
+                        del self._pending[run.id]
+
+    def save_run(self, run: EvalRun) -> None:
+        if self._closed:
+            raise RuntimeError("BufferedStore is closed")
+        self._start()
+        with self._pending_lock:
+            self._pending[run.id] = run
+        self._queue.put(run)
+
+    def flush(self) -> None:
+        """Wait until every queued run is written, raising any write error."""
+        if self._thread is not None:
+            self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self) -> None:
+        """Flush queued runs and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            atexit.unregister(self.close)
+        self.flush()
+
+    def get_run(self, run_id: str) -> EvalRun | None:
+        with self._pending_lock:
+            run = self._pending.get(run_id)
+        return run if run is not None else self.store.get_run(run_id)
+
+    def iter_runs(
+        self, suite_id: str | None = None, load_results: bool = False
+    ) -> Iterator[EvalRun]:
+        with self._pending_lock:
+            pending = [
+                run
+                for run in self._pending.values()
+                if suite_id is None or run.suite_id == suite_id
+            ]
+        yield from pending
+        seen = {run.id for run in pending}
+        runs = (
+            self.store.iter_runs(suite_id, load_results=True)
+            if load_results
+            else self.store.iter_runs(suite_id)
+        )
+        for run in runs:
+            if run.id not in seen:
+                yield run
+
+    def list_runs(self, suite_id: str | None = None) -> list[EvalRun]:
+        runs = list(self.iter_runs(suite_id))
+        runs.sort(key=lambda r: r.timestamp, reverse=True)
+        return runs
@@ -0,0 +1,273 @@
+"""Encoding of runs to and from their on-disk representations.
+
+Two record layouts are supported:
+
+- legacy: ``dataclasses.asdict`` of the run with ISO timestamps, as written
+  by earlier versions (still the default).
+- compact (``"format": 2``): fields that repeat the run's values
+  (``suite_id``, ``model``, ``system_prompt_name``) are hoisted out of each
+  result, result timestamps are integer microseconds since the epoch and
+  unset metrics are omitted.
+
+Both carry a ``stats`` summary so run metadata can be listed without
+decoding results (older files lack it and are summarized on read).
+
+Compact records may also reference prompt and response bodies by digest
+(``prompt_ref`` / ``response_ref``) in a BlobStore instead of inlining them.
+
+Records are serialized as JSON or msgpack, optionally compressed with gzip
+or zstd; the file suffix identifies the combination so readers can load any
+mix of files transparently.
+"""
+
+import gzip
+import importlib
+import json
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from types import ModuleType
+
+from src.store.base import EvalResult, EvalRun
+from src.store.blobs import BlobBackedResult, BlobStore
+
+FORMATS = ("json", "compact")
+ENCODINGS = ("json", "msgpack")
+COMPRESSIONS = (None, "gzip", "zstd")
+
+COMPACT_FORMAT_VERSION = 2
+
+_ENCODING_SUFFIXES = {"json": ".json", "msgpack": ".msgpack"}
+_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Every suffix a run file may carry, e.g. ".json", ".msgpack.zst"
+RUN_FILE_SUFFIXES = tuple(
+    enc + comp
+    for enc in _ENCODING_SUFFIXES.values()
+    for comp in _COMPRESSION_SUFFIXES.values()
+)
+
+# Result fields hoisted to the run in compact records when they match
+_HOISTED_FIELDS = ("suite_id", "model", "system_prompt_name")
+_OPTIONAL_RESULT_FIELDS = tuple(
+    f.name
+    for f in fields(EvalResult)
+    if f.name not in _HOISTED_FIELDS and f.default is None
+)
+
+
+def _require(module: str) -> ModuleType:
+    """Import an optional dependency of the compact store format."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"The '{module}' package is required for this store format. "
+            "Install it with `uv sync --extra compact`."
+        ) from e
+
+
+def _zstd() -> ModuleType:
+    try:
+        # Standard library from Python 3.14
+        return importlib.import_module("compression.zstd")
+    except ImportError:
+        return _require("zstandard")
+
+
+def run_file_suffix(encoding: str = "json", compression: str | None = None) -> str:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown store encoding: {encoding}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown store compression: {compression}")
+    return _ENCODING_SUFFIXES[encoding] + _COMPRESSION_SUFFIXES[compression]
+
+
+def split_run_filename(name: str) -> tuple[str, str] | None:
+    """Split a file name into (run_id, suffix), or None if not a run file."""
+    # Longest suffixes first so ".json.gz" is not mistaken for ".json"
+    for suffix in sorted(RUN_FILE_SUFFIXES, key=len, reverse=True):
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)], suffix
+    return None
+
+
+def dumps(record: dict, encoding: str = "json", compression: str | None = None) -> bytes:
+    """Serialize a run record to bytes for the given encoding and compression."""
+    if encoding == "msgpack":
+        payload = _require("msgpack").packb(record, use_bin_type=True)
+    elif compression is None and record.get("format") != COMPACT_FORMAT_VERSION:
+        # Legacy layout keeps the human-readable indentation
+        payload = json.dumps(record, indent=2).encode()
+    else:
+        payload = json.dumps(record, separators=(",", ":")).encode()
+
+    if compression == "gzip":
+        return gzip.compress(payload)
+    if compression == "zstd":
+        return _zstd().compress(payload)
+    return payload
+
+
+def loads(data: bytes, suffix: str) -> dict:
+    """Deserialize a run record from bytes, using the file suffix to decode."""
+    if suffix.endswith(".gz"):
+        data = gzip.decompress(data)
+        suffix = suffix[: -len(".gz")]
+    elif suffix.endswith(".zst"):
+        data = _zstd().decompress(data)
+        suffix = suffix[: -len(".zst")]
+
+    if suffix == ".msgpack":
+        return _require("msgpack").unpackb(data, raw=False)
+    return json.loads(data)
+
+
+def _to_micros(ts: datetime) -> int:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    delta = ts - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> datetime:
+    seconds, micros = divmod(micros, 1_000_000)
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=micros)
+
+
+def _body_ref(result: EvalResult, name: str, blobs: BlobStore) -> str:
+    # Results loaded from blobs already know their digest; reuse it rather
+    # than reading and re-hashing the body.
+    ref = getattr(result, f"{name}_ref", None)
+    return ref if ref is not None else blobs.put(getattr(result, name))
+
+
+def encode_run(
+    run: EvalRun, format: str = "json", blobs: BlobStore | None = None
+) -> dict:
+    """
+    Convert a run to a serializable record in the given layout.
+
+    Args:
+        run: The run to encode
+        format: "json" (legacy) or "compact"
+        blobs: With the compact layout, store prompt and response bodies in
+            this BlobStore and reference them by digest
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown store format: {format}")
+    if blobs is not None and format != "compact":
+        raise ValueError("Blob references require the compact store format")
+
+    if format == "json":
+        data = asdict(run)
+        data["timestamp"] = run.timestamp.isoformat()
+        for result in data["results"]:
+            result["timestamp"] = result["timestamp"].isoformat()
+        data["stats"] = asdict(run.stats)
+        return data
+
+    results = []
+    for r in run.results:
+        record = {
+            "id": r.id,
+            "case_id": r.case_id,
+            "passed": r.passed,
+            "score": r.score,
+            "reasons": r.reasons,
+            "ts": _to_micros(r.timestamp),
+        }
+        if blobs is None:
+            record["prompt"] = r.prompt
+            record["response"] = r.response
+        else:
+            record["prompt_ref"] = _body_ref(r, "prompt", blobs)
+            record["response_ref"] = _body_ref(r, "response", blobs)
+        for name in _HOISTED_FIELDS:
+            value = getattr(r, name)
+            if value != getattr(run, name):
+                record[name] = value
+        for name in _OPTIONAL_RESULT_FIELDS:
+            value = getattr(r, name)
+            if value is not None:
+                record[name] = value
+        results.append(record)
+
+    return {
+        "format": COMPACT_FORMAT_VERSION,
+        "id": run.id,
+        "suite_id": run.suite_id,
+        "model": run.model,
+        "timestamp": run.timestamp.isoformat(),
+        "system_prompt_name": run.system_prompt_name,
+        "revision": run.revision,
+        "git_commit_hash": run.git_commit_hash,
+        "rescored_from": run.rescored_from,
+        "environment": run.environment,
+        "stats": asdict(run.stats),
+        "results": results,
+    }
+
+
+def decode_result(
+    r: dict, run_data: dict, blobs: BlobStore | None = None
+) -> EvalResult:
+    """
+    Build an EvalResult from a legacy or compact result record.
+
+    Records with blob references become BlobBackedResults that load their
+    bodies from ``blobs`` on first access.
+    """
+    if "ts" in r:
+        timestamp = _from_micros(r["ts"])
+    else:
+        timestamp = datetime.fromisoformat(r["timestamp"])
+
+    attrs = _decode_result_fields(r, run_data)
+    if "prompt_ref" in r:
+        if blobs is None:
+            raise ValueError("Run references blobs but no BlobStore was given")
+        return BlobBackedResult.from_refs(
+            blobs, r["prompt_ref"], r["response_ref"], timestamp=timestamp, **attrs
+        )
+    return EvalResult(
+        prompt=r["prompt"], response=r["response"], timestamp=timestamp, **attrs
+    )
+
+
+def _decode_result_fields(r: dict, run_data: dict) -> dict:
+    return dict(
+        id=r["id"],
+        suite_id=r.get("suite_id", run_data["suite_id"]),
+        case_id=r["case_id"],
+        model=r.get("model", run_data["model"]),
+        passed=r["passed"],
+        score=r["score"],
+        reasons=r["reasons"],
+        system_prompt_name=r.get(
+            "system_prompt_name", run_data.get("system_prompt_name")
+        ),
+        latency_ms=r.get("latency_ms"),
+        ttft_ms=r.get("ttft_ms"),
+        tokens_per_second=r.get("tokens_per_second"),
+        finish_reason=r.get("finish_reason"),
+        prompt_tokens=r.get("prompt_tokens"),
+        completion_tokens=r.get("completion_tokens"),
+        judge_tokens=r.get("judge_tokens"),
+        cost_usd=r.get("cost_usd"),
+    )
+
+
+def decode_run(data: dict, blobs: BlobStore | None = None) -> EvalRun:
+    """Build an EvalRun from a legacy or compact run record."""
+    return EvalRun(
+        id=data["id"],
+        suite_id=data["suite_id"],
+        model=data["model"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        results=[decode_result(r, data, blobs) for r in data["results"]],
+        system_prompt_name=data.get("system_prompt_name"),
+        revision=data.get("revision"),
+        git_commit_hash=data.get("git_commit_hash"),
+        rescored_from=data.get("rescored_from"),
+        environment=data.get("environment"),
+    )
@@ -0,0 +1,102 @@
+"""Store selection from a URL-style setting."""
+
+import os
+from urllib.parse import parse_qsl, urlsplit
+
+from src.store.local import LocalStore
+from src.store.sqlite import SQLiteStore
+
+DEFAULT_STORE_PATH = ".eval_runs"
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+# Query parameters accepted by each backend, with their value parsers
+_FILE_OPTIONS = {
+    "format": str,
+    "encoding": str,
+    "compression": str,
+    "dedupe": bool,
+    "layout": str,
+}
+_SQLITE_OPTIONS = {
+    "format": str,
+    "encoding": str,
+    "compression": str,
+    "pool_size": int,
+}
+
+
+def get_store_url() -> str:
+    """
+    Get the configured store URL.
+
+    ``EVAL_STORE_URL`` takes precedence; otherwise ``EVAL_RUNS_DIR`` (a
+    plain directory) or ``.eval_runs`` in the working directory is used.
+    """
+    return (
+        os.environ.get("EVAL_STORE_URL")
+        or os.environ.get("EVAL_RUNS_DIR")
+        or DEFAULT_STORE_PATH
+    )
+
+
+def _parse_options(query: str, allowed: dict, url: str) -> dict:
+    options = {}
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key not in allowed:
+            raise ValueError(f"Unknown store option '{key}' in {url}")
+        parser = allowed[key]
+        if parser is bool:
+            if value.lower() not in _TRUE + _FALSE:
+                raise ValueError(f"Store option '{key}' must be true or false in {url}")
+            options[key] = value.lower() in _TRUE
+        elif parser is int:
+            options[key] = int(value)
+        else:
+            # "none" disables compression explicitly
+            options[key] = None if value.lower() in ("", "none") else value
+    return options
+
+
+def get_store(url: str | None = None) -> LocalStore | SQLiteStore:
+    """
+    Create the run store described by a URL.
+
+    Supported forms:
+
+    - ``/var/lib/llm-eval`` or ``file:///var/lib/llm-eval``: a LocalStore
+      directory (``file:relative/dir`` for a relative one)
+    - ``sqlite:///runs.db`` (relative) or ``sqlite:////var/lib/runs.db``
+      (absolute): a SQLiteStore database
+
+    Store options go in the query string, e.g.
+    ``file:///data/runs?format=compact&compression=zstd&dedupe=true`` or
+    ``sqlite:///runs.db?pool_size=8``.
+
+    Args:
+        url: Store URL; defaults to ``get_store_url()``
+
+    Returns:
+        The store instance
+    """
+    url = url or get_store_url()
+    parts = urlsplit(url)
+
+    if parts.scheme in ("", "file"):
+        if not parts.scheme:
+            # A bare path, which may contain '?' or '#' literally
+            return LocalStore(path=url)
+        path = parts.netloc + parts.path
+        if not path:
+            raise ValueError(f"Store URL has no path: {url}")
+        return LocalStore(path=path, **_parse_options(parts.query, _FILE_OPTIONS, url))
+
+    if parts.scheme == "sqlite":
+        # As in SQLAlchemy: three slashes for a relative path, four for absolute
+        path = parts.path[1:] if parts.path.startswith("/") else parts.path
+        if parts.netloc or not path:
+            raise ValueError(f"Invalid SQLite store URL: {url}")
+        return SQLiteStore(path=path, **_parse_options(parts.query, _SQLITE_OPTIONS, url))
+
+    raise ValueError(f"Unsupported store URL scheme '{parts.scheme}' in {url}")
@@ -0,0 +1,80 @@
+"""Append-only index of stored runs."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from src.utils.files import atomic_write_bytes
+
+
+class RunIndex:
+    """
+    Maps run ids to their location and summary header.
+
+    The index is a JSON-lines file with one entry per save::
+
+        {"id": ..., "path": <path relative to the store>, "header": {...}}
+
+    where ``header`` is the run record without its results (metadata and
+    stats), and ``archived`` marks entries whose path is an archive segment.
+    Later lines supersede earlier ones for the same id. Writers append under
+    the store lock; readers in any process pick up new lines incrementally
+    by remembering how far they have read, and reload from scratch when the
+    file is replaced by a rewrite.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._offset = 0
+        self._inode: int | None = None
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._entries, self._offset, self._inode = {}, 0, None
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._entries, self._offset, self._inode = {}, 0, stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # A writer may be mid-append; only consume complete lines
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                self._entries[entry["id"]] = entry
+        self._offset += end
+
+    def get(self, run_id: str) -> dict | None:
+        with self._lock:
+            self._refresh()
+            return self._entries.get(run_id)
+
+    def entries(self) -> list[dict]:
+        with self._lock:
+            self._refresh()
+            return list(self._entries.values())
+
+    def append(self, entries: list[dict]) -> None:
+        """Append entries. Callers must hold the store lock."""
+        if not entries:
+            return
+        payload = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+        with open(self.path, "ab") as f:
+            f.write(payload.encode())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def rewrite(self, entries: list[dict]) -> None:
+        """Replace the index with exactly these entries. Callers must hold the store lock."""
+        payload = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+        atomic_write_bytes(self.path, payload.encode())
@@ -0,0 +1,98 @@
+"""Runs whose results are decoded from their stored record on demand."""
+
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+from datetime import datetime
+
+from src.store.base import EvalResult, EvalRun, RunStats, compute_run_stats
+from src.store.blobs import BlobStore
+from src.store.codec import decode_result
+
+
+def record_header(record: dict, blobs: BlobStore | None = None) -> dict:
+    """
+    Return a run record without its results, with a ``stats`` summary.
+
+    Older files carry no summary, so one is computed from the results.
+    """
+    header = {k: v for k, v in record.items() if k != "results"}
+    if "stats" not in header:
+        header["stats"] = asdict(
+            compute_run_stats(decode_result(r, record, blobs) for r in record["results"])
+        )
+    return header
+
+
+class LazyEvalRun(EvalRun):
+    """
+    An EvalRun built from a raw run record without decoding its results.
+
+    ``results`` materializes every EvalResult on first access;
+    ``iter_results`` decodes them one at a time without keeping them; and
+    ``stats`` is answered from the summary saved with the record when the
+    results have not been materialized.
+
+    Given a ``reload`` callable, the raw result records are not kept at all:
+    only the run header stays in memory (``record`` may be just the header)
+    and the full record is re-read when the results are needed.
+    """
+
+    __slots__ = ("_record", "_blobs", "_reload", "_results")
+
+    def __init__(
+        self,
+        record: dict,
+        blobs: BlobStore | None = None,
+        reload: Callable[[], dict] | None = None,
+    ):
+        if reload is not None and "results" in record:
+            record = record_header(record, blobs)
+        self._record = record
+        self._blobs = blobs
+        self._reload = reload
+        self._results: list[EvalResult] | None = None
+        super().__init__(
+            id=record["id"],
+            suite_id=record["suite_id"],
+            model=record["model"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            results=None,
+            system_prompt_name=record.get("system_prompt_name"),
+            revision=record.get("revision"),
+            git_commit_hash=record.get("git_commit_hash"),
+            rescored_from=record.get("rescored_from"),
+            environment=record.get("environment"),
+        )
+
+    @property
+    def results(self) -> list[EvalResult]:
+        if self._results is None:
+            self._results = list(self.iter_results())
+        return self._results
+
+    @results.setter
+    def results(self, value: list[EvalResult] | None) -> None:
+        # EvalRun.__init__ passes None to leave the results unmaterialized
+        if value is not None:
+            self._results = value
+
+    @property
+    def materialized(self) -> bool:
+        return self._results is not None
+
+    def iter_results(self) -> Iterator[EvalResult]:
+        if self._results is not None:
+            yield from self._results
+            return
+        record = self._record if self._reload is None else self._reload()
+        for r in record["results"]:
+            yield decode_result(r, record, self._blobs)
+
+    @property
+    def stats(self) -> RunStats:
+        if self._results is None and "stats" in self._record:
+            try:
+                return RunStats(**self._record["stats"])
+            except TypeError:
+                pass  # Summary written with a different set of stats fields
+        return compute_run_stats(self.iter_results())
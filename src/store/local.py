@@ -1,91 +1,443 @@
+import gzip
 import json
-from dataclasses import asdict
+import logging
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
-from src.store.base import EvalResult, EvalRun
+from src.store.base import EvalRun
+from src.store.blobs import BlobStore
+from src.store.codec import (
+    RUN_FILE_SUFFIXES,
+    decode_run,
+    dumps,
+    encode_run,
+    loads,
+    run_file_suffix,
+    split_run_filename,
+)
+from src.store.index import RunIndex
+from src.store.lazy import LazyEvalRun, record_header
+from src.utils.files import atomic_write_bytes, file_lock
+
+logger = logging.getLogger(__name__)
+
+LAYOUTS = ("sharded", "flat")
+
+# Delay before retrying a run file that failed to decode, in case it was
+# caught mid-write by a writer that does not replace files atomically.
+_RETRY_DELAY_SECONDS = 0.05
+
+
+def _shard_name(suite_id: str) -> str:
+    """Make a suite id safe to use as a single directory name."""
+    name = suite_id.replace("/", "_").replace("\\", "_")
+    return "_" if name in ("", ".", "..") else name
+
+
+def _parse_timestamp(value: str) -> datetime:
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
 
 
 class LocalStore:
-    def __init__(self, path: str = ".eval_runs"):
+    def __init__(
+        self,
+        path: str = ".eval_runs",
+        format: str = "json",
+        encoding: str = "json",
+        compression: str | None = None,
+        dedupe: bool = False,
+        layout: str = "sharded",
+    ):
+        """
+        Args:
+            path: Directory holding the run files
+            format: Record layout for new runs: "json" (legacy, indented)
+                or "compact" (hoisted fields, no indentation)
+            encoding: "json" or "msgpack" (needs the ``compact`` extra)
+            compression: None, "gzip" or "zstd" (zstd needs the ``compact``
+                extra before Python 3.14)
+            dedupe: Store prompt and response bodies once each in a
+                content-addressed ``blobs/`` area and reference them by
+                digest (requires the compact format). Bodies are then only
+                read when a result's prompt or response is accessed.
+            layout: Where new runs are written: "sharded" places them in
+                ``runs/<suite>/<YYYY-MM>/``; "flat" in the store root
+
+        Runs are always readable regardless of the format or layout they
+        were written in, so these options only affect new writes. Every
+        save is recorded in ``index.jsonl`` with the run's metadata and
+        stats, so listing runs reads the index rather than every run file;
+        unindexed files in the store root (from before the index existed)
+        are still found by scanning the root.
+
+        Several processes may share one store directory: run files are
+        replaced atomically, and revision allocation and index updates are
+        serialized by an advisory lock on ``<path>/.lock``.
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown store layout: {layout}")
         self.path = Path(path)
+        self.format = format
+        self.encoding = encoding
+        self.compression = compression
+        self.layout = layout
+        self._suffix = run_file_suffix(encoding, compression)
+        if dedupe and format != "compact":
+            raise ValueError("dedupe requires format='compact'")
+        self.dedupe = dedupe
+        # Always available for reading, whatever this instance writes
+        self.blobs = BlobStore(self.path / "blobs")
+        self._index = RunIndex(self.path / "index.jsonl")
+
+    @property
+    def _lock_path(self) -> Path:
+        return self.path / ".lock"
+
+    @property
+    def _revision_path(self) -> Path:
+        return self.path / "REVISION"
+
+    def _last_revision(self) -> int:
+        """
+        Get the highest allocated revision.
+
+        Stores written before the REVISION counter existed fall back to
+        scanning their runs.
+        """
+        try:
+            return int(self._revision_path.read_text())
+        except (FileNotFoundError, ValueError):
+            pass
+        return max(
+            (run.revision for run in self.iter_runs() if run.revision is not None),
+            default=0,
+        )
+
+    def version(self) -> tuple:
+        """
+        Return a token that changes whenever any process writes to the store.
+
+        Cheap enough to check on every request: it stats the index (appended
+        on every save, replaced by compaction) and the store root (whose
+        mtime changes when files are added or removed there).
+        """
+        token = []
+        for path in (self._index.path, self.path):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                token.append(None)
+            else:
+                token.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(token)
 
     def get_next_revision(self) -> int:
-        """Get the next global revision number."""
-        runs = self.list_runs()
-        if not runs:
-            return 1
-        # Find the max revision among all runs
-        max_revision = 0
-        for run in runs:
-            if run.revision is not None and run.revision > max_revision:
-                max_revision = run.revision
-        return max_revision + 1
+        """Get the next global revision number, without reserving it."""
+        return self._last_revision() + 1
+
+    def reserve_revision(self) -> int:
+        """
+        Allocate the next global revision number.
+
+        Safe across processes: concurrent callers always receive distinct
+        revisions.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        with file_lock(self._lock_path):
+            revision = self._last_revision() + 1
+            atomic_write_bytes(self._revision_path, str(revision).encode())
+        return revision
+
+    def _run_path(self, run: EvalRun) -> Path:
+        if self.layout == "flat":
+            return self.path / f"{run.id}{self._suffix}"
+        month = run.timestamp.strftime("%Y-%m")
+        return self.path / "runs" / _shard_name(run.suite_id) / month / f"{run.id}{self._suffix}"
+
+    def _index_entry(self, record: dict, path: Path, archived: bool = False) -> dict:
+        entry = {
+            "id": record["id"],
+            "path": path.relative_to(self.path).as_posix(),
+            "header": record_header(record, self.blobs),
+        }
+        if archived:
+            entry["archived"] = True
+        return entry
 
     def save_run(self, run: EvalRun) -> None:
+        self.save_runs([run])
+
+    def save_runs(self, runs: list[EvalRun]) -> None:
+        """
+        Save several runs at once.
+
+        The store lock, the revision counter update and the index append
+        (with its fsync) are shared by the whole batch.
+        """
+        if not runs:
+            return
         self.path.mkdir(parents=True, exist_ok=True)
 
-        # Assign revision number if not already set
-        if run.revision is None:
-            run.revision = self.get_next_revision()
+        written: list[tuple[EvalRun, Path, dict | None]] = []
+        with file_lock(self._lock_path):
+            last_revision = self._last_revision()
+            revision = last_revision
+            for run in runs:
+                # Assign revision number if not already set
+                if run.revision is None:
+                    run.revision = revision + 1
+                revision = max(revision, run.revision)
+            if revision > last_revision:
+                atomic_write_bytes(self._revision_path, str(revision).encode())
 
-        data = asdict(run)
-        data["timestamp"] = run.timestamp.isoformat()
-        for result in data["results"]:
-            result["timestamp"] = result["timestamp"].isoformat()
+            entries = []
+            for run in runs:
+                data = encode_run(run, self.format, self.blobs if self.dedupe else None)
+                file_path = self._run_path(run)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_bytes(file_path, dumps(data, self.encoding, self.compression))
+                entries.append(self._index_entry(data, file_path))
+                written.append((run, file_path, self._index.get(run.id)))
+            self._index.append(entries)
 
-        file_path = self.path / f"{run.id}.json"
-        file_path.write_text(json.dumps(data, indent=2))
+        for run, file_path, previous in written:
+            # Drop copies of this run saved earlier under another format or layout
+            for suffix in RUN_FILE_SUFFIXES:
+                flat_path = self.path / f"{run.id}{suffix}"
+                if flat_path != file_path:
+                    flat_path.unlink(missing_ok=True)
+            if previous is not None and not previous.get("archived"):
+                previous_path = self.path / previous["path"]
+                if previous_path != file_path:
+                    previous_path.unlink(missing_ok=True)
 
-    def get_run(self, run_id: str) -> EvalRun | None:
-        file_path = self.path / f"{run_id}.json"
+    def _load_file(self, file_path: Path, suffix: str) -> dict | None:
+        """
+        Read and decode a run file, tolerating concurrent writers.
 
-        if not file_path.exists():
-            return None
+        Returns None if the file disappeared (replaced or moved by another
+        process) or still fails to read or decode after one retry.
 
-        data = json.loads(file_path.read_text())
-        return self._dict_to_run(data)
+        Raises:
+            ImportError: If decoding needs an optional package that is not
+                installed (e.g. ``msgpack``)
+        """
+        for attempt in range(2):
+            try:
+                return loads(file_path.read_bytes(), suffix)
+            except FileNotFoundError:
+                return None
+            except (OSError, EOFError, json.JSONDecodeError, ValueError):
+                if attempt == 0:
+                    time.sleep(_RETRY_DELAY_SECONDS)
+        logger.warning("Skipping unreadable run file %s", file_path)
+        return None
 
-    def list_runs(self, suite_id: str | None = None) -> list[EvalRun]:
+    def _load_archived(self, segment: Path, run_id: str) -> dict | None:
+        """Find a run's record in an archive segment."""
+        try:
+            with gzip.open(segment, "rt") as f:
+                for line in f:
+                    # Cheap substring test before parsing each line
+                    if run_id in line:
+                        record = json.loads(line)
+                        if record["id"] == run_id:
+                            return record
+        except (FileNotFoundError, EOFError, OSError, ValueError):
+            logger.warning("Could not read archive segment %s", segment)
+        return None
+
+    def _load_entry(self, entry: dict) -> dict | None:
+        path = self.path / entry["path"]
+        if entry.get("archived"):
+            return self._load_archived(path, entry["id"])
+        parsed = split_run_filename(path.name)
+        return self._load_file(path, parsed[1]) if parsed else None
+
+    def _legacy_files(self) -> Iterator[tuple[str, Path, str]]:
+        """Yield (run_id, path, suffix) for run files in the store root."""
         if not self.path.exists():
-            return []
+            return
+        for file_path in self.path.iterdir():
+            parsed = split_run_filename(file_path.name)
+            if parsed is not None:
+                yield parsed[0], file_path, parsed[1]
+
+    def _read_record(self, run_id: str) -> dict | None:
+        entry = self._index.get(run_id)
+        if entry is not None:
+            record = self._load_entry(entry)
+            if record is not None:
+                return record
+
+        for suffix in RUN_FILE_SUFFIXES:
+            file_path = self.path / f"{run_id}{suffix}"
+            if file_path.exists():
+                record = self._load_file(file_path, suffix)
+                if record is not None:
+                    return record
+        return None
+
+    def _reload_record(self, run_id: str) -> dict:
+        record = self._read_record(run_id)
+        if record is None:
+            raise KeyError(f"Run '{run_id}' no longer exists")
+        return record
+
+    def get_run(self, run_id: str) -> EvalRun | None:
+        record = self._read_record(run_id)
+        if record is None:
+            return None
+        return decode_run(record, self.blobs)
 
-        runs = []
-        for file_path in self.path.glob("*.json"):
-            data = json.loads(file_path.read_text())
-            run = self._dict_to_run(data)
+    def iter_runs(
+        self, suite_id: str | None = None, load_results: bool = False
+    ) -> Iterator[EvalRun]:
+        """
+        Yield stored runs one at a time, in no particular order.
+
+        Runs are LazyEvalRuns holding only their header and stats; results
+        are re-read and decoded when accessed. Indexed runs, including
+        archived ones, are listed from the index without opening their files.
+
+        Args:
+            suite_id: Only yield runs of this suite
+            load_results: Keep the results of unindexed runs, whose files
+                are read to list them anyway, so accessing them does not
+                read the file a second time; for callers about to use every
+                run's results. Indexed runs read their file once, on access.
+        """
+        indexed = set()
+        for entry in self._index.entries():
+            indexed.add(entry["id"])
+            header = entry["header"]
+            if suite_id is not None and header["suite_id"] != suite_id:
+                continue
+            yield LazyEvalRun(
+                header, self.blobs, reload=partial(self._reload_record, entry["id"])
+            )
+
+        for run_id, file_path, suffix in self._legacy_files():
+            if run_id in indexed:
+                continue
+            record = self._load_file(file_path, suffix)
+            if record is None:
+                continue
+            run = LazyEvalRun(
+                record,
+                self.blobs,
+                reload=None if load_results else partial(self._reload_record, run_id),
+            )
 
             if suite_id is None or run.suite_id == suite_id:
-                runs.append(run)
+                yield run
 
+    def list_runs(self, suite_id: str | None = None) -> list[EvalRun]:
+        runs = list(self.iter_runs(suite_id))
         runs.sort(key=lambda r: r.timestamp, reverse=True)
         return runs
 
-    def _dict_to_run(self, data: dict) -> EvalRun:
-        results = [
-            EvalResult(
-                id=r["id"],
-                suite_id=r["suite_id"],
-                case_id=r["case_id"],
-                model=r["model"],
-                prompt=r["prompt"],
-                response=r["response"],
-                passed=r["passed"],
-                score=r["score"],
-                reasons=r["reasons"],
-                timestamp=datetime.fromisoformat(r["timestamp"]),
-                system_prompt_name=r.get("system_prompt_name"),
-            )
-            for r in data["results"]
+    def migrate(self) -> int:
+        """
+        Rewrite every stored run, except archived ones, in this store's
+        configured format and layout.
+
+        Returns:
+            The number of runs rewritten
+        """
+        run_ids = [
+            entry["id"] for entry in self._index.entries() if not entry.get("archived")
         ]
+        indexed = set(run_ids)
+        run_ids += [run_id for run_id, _, _ in self._legacy_files() if run_id not in indexed]
 
-        return EvalRun(
-            id=data["id"],
-            suite_id=data["suite_id"],
-            model=data["model"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            results=results,
-            system_prompt_name=data.get("system_prompt_name"),
-            revision=data.get("revision"),
-            git_commit_hash=data.get("git_commit_hash"),
-        )
+        count = 0
+        for run_id in run_ids:
+            run = self.get_run(run_id)
+            if run is None:
+                continue
+            self.save_run(run)
+            count += 1
+        return count
+
+    def compact(self, older_than: datetime) -> int:
+        """
+        Roll runs older than a cutoff into compressed archive segments.
+
+        Each run is appended as one JSON line to
+        ``archive/<suite>/<YYYY-MM>.jsonl.gz`` and its own file removed. The
+        index keeps the run's metadata and stats, so archived runs are still
+        listed (and loadable by id, by scanning their segment). The index is
+        also rewritten without superseded entries.
+
+        Args:
+            older_than: Runs with an earlier timestamp are archived
+
+        Returns:
+            The number of runs archived
+        """
+        if older_than.tzinfo is None:
+            older_than = older_than.replace(tzinfo=timezone.utc)
+        if not self.path.exists():
+            return 0
+
+        with file_lock(self._lock_path):
+            candidates: list[tuple[str, Path]] = []
+            entries = {entry["id"]: entry for entry in self._index.entries()}
+            for entry in entries.values():
+                timestamp = _parse_timestamp(entry["header"]["timestamp"])
+                if not entry.get("archived") and timestamp < older_than:
+                    candidates.append((entry["id"], self.path / entry["path"]))
+            for run_id, file_path, _ in self._legacy_files():
+                if run_id not in entries:
+                    candidates.append((run_id, file_path))
+
+            segments: dict[Path, list[str]] = {}
+            archived: list[Path] = []
+            for run_id, file_path in candidates:
+                parsed = split_run_filename(file_path.name)
+                record = self._load_file(file_path, parsed[1]) if parsed else None
+                if record is None:
+                    continue
+                timestamp = _parse_timestamp(record["timestamp"])
+                if timestamp >= older_than:
+                    continue  # Unindexed root file that is still recent
+
+                segment = (
+                    self.path
+                    / "archive"
+                    / _shard_name(record["suite_id"])
+                    / f"{timestamp.strftime('%Y-%m')}.jsonl.gz"
+                )
+                segments.setdefault(segment, []).append(
+                    json.dumps(record, separators=(",", ":")) + "\n"
+                )
+                entries[run_id] = self._index_entry(record, segment, archived=True)
+                archived.append(file_path)
+
+            if not archived:
+                return 0
+
+            # Segments first, then the index, then removal: a crash at any
+            # point leaves every run readable from at least one place.
+            for segment, lines in segments.items():
+                segment.parent.mkdir(parents=True, exist_ok=True)
+                with gzip.open(segment, "ab") as f:
+                    f.write("".join(lines).encode())
+            self._index.rewrite(list(entries.values()))
+
+            for file_path in archived:
+                file_path.unlink(missing_ok=True)
+                # Remove emptied month and suite shard directories
+                for directory in (file_path.parent, file_path.parent.parent):
+                    if self.path / "runs" in directory.parents:
+                        try:
+                            directory.rmdir()
+                        except OSError:
+                            pass
+
+        return len(archived)
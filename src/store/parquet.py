@@ -0,0 +1,265 @@
+"""Columnar Parquet export of stored results for historical analysis.
+
+Results are written as a hive-partitioned dataset,
+``<root>/suite_id=<suite>/month=<YYYY-MM>/part-<export>.parquet``. Each
+export writes at most one file per suite and month, streaming its rows
+through a single ParquetWriter in row groups of up to ``ROW_GROUP_ROWS``,
+so the dataset stays at a few large files however many runs it holds.
+Exports are incremental: runs whose id is already in the dataset are
+skipped, so re-running the export only appends new runs. Queries go
+through ``pyarrow.dataset`` so filters on the partition columns prune whole
+directories and other filters (such as ``date``) are pushed down to
+row-group statistics.
+
+Requires the ``analytics`` extra (``uv sync --extra analytics``).
+"""
+
+import importlib
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from src.store.base import EvalRun
+
+# (suite_id, case_id) -> category, taken from the suite files
+CategoryMap = dict[tuple[str, str], str]
+
+# Rows buffered per file before they are written out as a row group
+ROW_GROUP_ROWS = 64 * 1024
+
+
+def _pyarrow() -> tuple[ModuleType, ModuleType, ModuleType, ModuleType]:
+    try:
+        pa = importlib.import_module("pyarrow")
+        pc = importlib.import_module("pyarrow.compute")
+        ds = importlib.import_module("pyarrow.dataset")
+        pq = importlib.import_module("pyarrow.parquet")
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet export. "
+            "Install it with `uv sync --extra analytics`."
+        ) from e
+    return pa, pc, ds, pq
+
+
+def _schema(pa: ModuleType):
+    # Partition columns (suite_id, month) live in the directory names
+    return pa.schema([
+        ("run_id", pa.string()),
+        ("date", pa.string()),  # YYYY-MM-DD of the run
+        ("revision", pa.int64()),
+        ("git_commit_hash", pa.string()),
+        ("rescored_from", pa.string()),
+        ("model", pa.string()),
+        ("system_prompt_name", pa.string()),
+        ("case_id", pa.string()),
+        ("category", pa.string()),
+        ("passed", pa.bool_()),
+        ("score", pa.float64()),
+        ("latency_ms", pa.float64()),
+        ("ttft_ms", pa.float64()),
+        ("prompt_tokens", pa.int64()),
+        ("completion_tokens", pa.int64()),
+        ("judge_tokens", pa.int64()),
+        ("cost_usd", pa.float64()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+    ])
+
+
+def _partitioning(pa: ModuleType, ds: ModuleType):
+    return ds.partitioning(
+        pa.schema([("suite_id", pa.string()), ("month", pa.string())]),
+        flavor="hive",
+    )
+
+
+def _exported_run_ids(root: Path) -> set[str]:
+    """Read the ids of the runs already in the dataset (one column only)."""
+    pa, pc, ds, _ = _pyarrow()
+    if not root.exists():
+        return set()
+    dataset = ds.dataset(root, format="parquet", partitioning=_partitioning(pa, ds))
+    if not dataset.files:
+        return set()
+    return set(pc.unique(dataset.to_table(columns=["run_id"])["run_id"]).to_pylist())
+
+
+class _PartitionWriter:
+    """Buffers one partition's rows and writes them to a single file."""
+
+    def __init__(self, path: Path, schema, pa: ModuleType, pq: ModuleType):
+        self.path = path
+        self.schema = schema
+        self._pa = pa
+        self.columns: dict[str, list] = {name: [] for name in schema.names}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Dot-prefixed files are ignored by pyarrow.dataset readers
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._writer = pq.ParquetWriter(self._tmp_path, schema)
+
+    def flush(self) -> None:
+        if self.columns["run_id"]:
+            self._writer.write_table(self._pa.table(self.columns, schema=self.schema))
+            self.columns = {name: [] for name in self.schema.names}
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+        self._tmp_path.replace(self.path)
+
+    def abort(self) -> None:
+        self._writer.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def export_parquet(
+    runs: Iterable[EvalRun],
+    root: str | Path,
+    categories: CategoryMap | None = None,
+) -> int:
+    """
+    Write runs to the partitioned Parquet dataset at ``root``.
+
+    Args:
+        runs: Runs to export, e.g. ``store.iter_runs()``
+        root: Dataset directory
+        categories: Optional case category lookup to denormalize into rows
+
+    Returns:
+        The number of runs written (already exported runs and runs without
+        results are skipped)
+    """
+    pa, _, _, pq = _pyarrow()
+    root = Path(root)
+    schema = _schema(pa)
+    categories = categories or {}
+    exported = _exported_run_ids(root)
+    # Files of this export share a name, unique across exports
+    filename = f"part-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+    writers: dict[tuple[str, str], _PartitionWriter] = {}
+    written = 0
+
+    try:
+        for run in runs:
+            if run.id in exported or not run.results:
+                continue
+
+            date = run.timestamp.date().isoformat()
+            key = (run.suite_id, date[:7])
+            writer = writers.get(key)
+            if writer is None:
+                path = root / f"suite_id={key[0]}" / f"month={key[1]}" / filename
+                writer = writers[key] = _PartitionWriter(path, schema, pa, pq)
+
+            columns = writer.columns
+            for r in run.results:
+                columns["run_id"].append(run.id)
+                columns["date"].append(date)
+                columns["revision"].append(run.revision)
+                columns["git_commit_hash"].append(run.git_commit_hash)
+                columns["rescored_from"].append(run.rescored_from)
+                columns["model"].append(r.model)
+                columns["system_prompt_name"].append(r.system_prompt_name)
+                columns["case_id"].append(r.case_id)
+                columns["category"].append(categories.get((run.suite_id, r.case_id)))
+                columns["passed"].append(r.passed)
+                columns["score"].append(r.score)
+                columns["latency_ms"].append(r.latency_ms)
+                columns["ttft_ms"].append(r.ttft_ms)
+                columns["prompt_tokens"].append(r.prompt_tokens)
+                columns["completion_tokens"].append(r.completion_tokens)
+                columns["judge_tokens"].append(r.judge_tokens)
+                columns["cost_usd"].append(r.cost_usd)
+                columns["timestamp"].append(r.timestamp)
+            if len(columns["run_id"]) >= ROW_GROUP_ROWS:
+                writer.flush()
+            exported.add(run.id)
+            written += 1
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+    for writer in writers.values():
+        writer.close()
+    return written
+
+
+def query_pass_rate(
+    root: str | Path,
+    group_by: list[str],
+    filters: dict[str, Any] | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> list[dict]:
+    """
+    Aggregate pass rate, cost and latency over the exported dataset.
+
+    Args:
+        root: Dataset directory written by ``export_parquet``
+        group_by: Columns to group by, e.g. ``["model", "category"]``
+        filters: Column equality filters; list values match any element
+        since: Inclusive lower bound on the run ``date`` (YYYY-MM-DD)
+        until: Inclusive upper bound on the run ``date`` (YYYY-MM-DD)
+
+    Returns:
+        One dict per group with the group columns plus ``passed``,
+        ``total``, ``pass_rate``, ``cost_usd`` and ``mean_latency_ms``,
+        sorted by the group columns.
+    """
+    pa, pc, ds, _ = _pyarrow()
+    root = Path(root)
+    if not root.exists():
+        return []
+
+    dataset = ds.dataset(root, format="parquet", partitioning=_partitioning(pa, ds))
+
+    expression = None
+    conditions = []
+    for column, value in (filters or {}).items():
+        if isinstance(value, (list, tuple, set)):
+            conditions.append(pc.field(column).isin(list(value)))
+        else:
+            conditions.append(pc.field(column) == value)
+    # The month conditions prune partitions; the date ones filter row groups
+    if since is not None:
+        conditions.append(pc.field("month") >= since[:7])
+        conditions.append(pc.field("date") >= since)
+    if until is not None:
+        conditions.append(pc.field("month") <= until[:7])
+        conditions.append(pc.field("date") <= until)
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    table = dataset.to_table(
+        columns=list(dict.fromkeys([*group_by, "passed", "cost_usd", "latency_ms"])),
+        filter=expression,
+    )
+    if table.num_rows == 0:
+        return []
+
+    table = table.append_column("passed_int", pc.cast(table["passed"], pa.int64()))
+    aggregated = table.group_by(group_by).aggregate([
+        ("passed_int", "sum"),
+        ("passed_int", "count"),
+        ("cost_usd", "sum"),
+        ("latency_ms", "mean"),
+    ])
+
+    rows = []
+    for row in aggregated.to_pylist():
+        passed = row.pop("passed_int_sum")
+        total = row.pop("passed_int_count")
+        rows.append({
+            **{column: row[column] for column in group_by},
+            "passed": passed,
+            "total": total,
+            "pass_rate": passed / total if total else None,
+            "cost_usd": row.pop("cost_usd_sum"),
+            "mean_latency_ms": row.pop("latency_ms_mean"),
+        })
+    rows.sort(key=lambda r: tuple(str(r[c]) for c in group_by))
+    return rows
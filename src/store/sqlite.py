@@ -0,0 +1,259 @@
+"""Run store backed by a SQLite database."""
+
+import json
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+from src.store.base import EvalRun
+from src.store.codec import decode_run, dumps, encode_run, loads, run_file_suffix
+from src.store.lazy import LazyEvalRun, record_header
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    suite_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    header TEXT NOT NULL,
+    suffix TEXT NOT NULL,
+    record BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_suite_id ON runs (suite_id);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class ConnectionPool:
+    """
+    A fixed-size pool of SQLite connections to one database.
+
+    Connections are opened lazily, up to ``size``; callers beyond that wait
+    for one to be returned. The database is put in WAL mode so readers do
+    not block the (single) writer.
+    """
+
+    def __init__(self, path: str, size: int = 4, timeout: float = 30.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened = 0
+        self._opened_lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,  # Transactions are managed explicitly
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._opened_lock:
+            can_open = self._opened < self.size
+            if can_open:
+                self._opened += 1
+        if can_open:
+            return self._open()
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free connection to {self.path}") from None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class SQLiteStore:
+    def __init__(
+        self,
+        path: str = "eval_runs.db",
+        format: str = "compact",
+        encoding: str = "json",
+        compression: str | None = None,
+        pool_size: int = 4,
+    ):
+        """
+        Args:
+            path: Database file (created if missing)
+            format: Record layout for new runs, as for LocalStore
+            encoding: "json" or "msgpack" (needs the ``compact`` extra)
+            compression: None, "gzip" or "zstd"
+            pool_size: Maximum number of open connections
+
+        Each run is one row holding the encoded record, plus its header
+        (metadata and stats) as JSON so listing runs never decodes results.
+        Any number of processes may share the database; SQLite serializes
+        the writes.
+        """
+        self.path = Path(path)
+        self.format = format
+        self.encoding = encoding
+        self.compression = compression
+        self._suffix = run_file_suffix(encoding, compression)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(str(self.path), size=pool_size)
+        with self._pool.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the database write lock up front."""
+        with self._pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _last_revision(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM counters WHERE name = 'revision'").fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _set_revision(conn: sqlite3.Connection, revision: int) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES ('revision', ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+            (revision,),
+        )
+
+    def version(self) -> int:
+        """Return a counter that changes whenever any process saves a run."""
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT value FROM counters WHERE name = 'writes'").fetchone()
+        return row[0] if row else 0
+
+    def get_next_revision(self) -> int:
+        """Get the next global revision number, without reserving it."""
+        with self._pool.connection() as conn:
+            return self._last_revision(conn) + 1
+
+    def reserve_revision(self) -> int:
+        """Allocate the next global revision number."""
+        with self._transaction() as conn:
+            revision = self._last_revision(conn) + 1
+            self._set_revision(conn, revision)
+        return revision
+
+    def save_run(self, run: EvalRun) -> None:
+        self.save_runs([run])
+
+    def save_runs(self, runs: list[EvalRun]) -> None:
+        """Save several runs in a single transaction."""
+        if not runs:
+            return
+        with self._transaction() as conn:
+            last_revision = self._last_revision(conn)
+            revision = last_revision
+            for run in runs:
+                # Assign revision number if not already set
+                if run.revision is None:
+                    run.revision = revision + 1
+                revision = max(revision, run.revision)
+            if revision > last_revision:
+                self._set_revision(conn, revision)
+
+            rows = []
+            for run in runs:
+                data = encode_run(run, self.format)
+                rows.append(
+                    (
+                        run.id,
+                        run.suite_id,
+                        run.timestamp.isoformat(),
+                        json.dumps(record_header(data)),
+                        self._suffix,
+                        dumps(data, self.encoding, self.compression),
+                    )
+                )
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES ('writes', 1) "
+                "ON CONFLICT (name) DO UPDATE SET value = value + 1"
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO runs "
+                "(id, suite_id, timestamp, header, suffix, record) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _read_record(self, run_id: str) -> dict | None:
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT suffix, record FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return loads(row[1], row[0])
+
+    def _reload_record(self, run_id: str) -> dict:
+        record = self._read_record(run_id)
+        if record is None:
+            raise KeyError(f"Run '{run_id}' no longer exists")
+        return record
+
+    def get_run(self, run_id: str) -> EvalRun | None:
+        record = self._read_record(run_id)
+        if record is None:
+            return None
+        return decode_run(record)
+
+    def iter_runs(
+        self, suite_id: str | None = None, load_results: bool = False
+    ) -> Iterator[EvalRun]:
+        """
+        Yield stored runs newest first, as LazyEvalRuns whose results are
+        loaded on access. ``load_results`` is accepted for compatibility with
+        LocalStore; each run's record is read once, on access, either way.
+        """
+        query = "SELECT id, header FROM runs"
+        params: tuple = ()
+        if suite_id is not None:
+            query += " WHERE suite_id = ?"
+            params = (suite_id,)
+        with self._pool.connection() as conn:
+            rows = conn.execute(query + " ORDER BY timestamp DESC", params).fetchall()
+        for run_id, header in rows:
+            yield LazyEvalRun(
+                json.loads(header), reload=partial(self._reload_record, run_id)
+            )
+
+    def list_runs(self, suite_id: str | None = None) -> list[EvalRun]:
+        runs = list(self.iter_runs(suite_id))
+        # Timestamps may carry different UTC offsets, so sort on the values
+        runs.sort(key=lambda r: r.timestamp, reverse=True)
+        return runs
+
+    def close(self) -> None:
+        self._pool.close()
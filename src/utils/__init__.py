@@ -1,5 +1,7 @@
 """Utility functions."""
 
+from src.utils.env import get_run_environment
 from src.utils.git import get_current_commit_hash
+from src.utils.pricing import estimate_cost, get_model_price
 
-__all__ = ["get_current_commit_hash"]
+__all__ = ["get_current_commit_hash", "get_run_environment", "estimate_cost", "get_model_price"]
@@ -0,0 +1,71 @@
+"""Metadata about the environment runs are produced in.
+
+Captured once per process and attached to every run, so finishing a run
+never spawns ``git``. Deployments without a git checkout (e.g. containers
+built from a source archive) can provide the values through environment
+variables:
+
+- ``EVAL_GIT_COMMIT``: commit hash to record
+- ``EVAL_GIT_DIRTY``: "1"/"true" or "0"/"false"
+
+``git`` is not run when both are set.
+"""
+
+import os
+import platform
+from functools import cache
+from importlib import metadata
+
+from src.utils.git import get_git_status
+
+# Distributions whose versions are recorded with each run
+TRACKED_PACKAGES = ("openai", "google-genai", "langsmith", "httpx", "pyyaml")
+
+_TRUE = ("1", "true", "yes")
+_FALSE = ("0", "false", "no")
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _parse_flag(value: str | None) -> bool | None:
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    return None
+
+
+@cache
+def get_run_environment() -> dict:
+    """
+    Describe the code and dependencies this process runs with.
+
+    Computed on first call and cached for the life of the process.
+
+    Returns:
+        ``git_commit`` (short hash or None), ``git_dirty`` (bool or None),
+        ``python`` (version) and ``packages`` (name → version, for the
+        installed TRACKED_PACKAGES)
+    """
+    commit = os.environ.get("EVAL_GIT_COMMIT") or None
+    dirty = _parse_flag(os.environ.get("EVAL_GIT_DIRTY"))
+    if commit is None or dirty is None:
+        git_commit, git_dirty = get_git_status()
+        commit = commit or git_commit
+        dirty = git_dirty if dirty is None else dirty
+
+    packages = {name: _package_version(name) for name in TRACKED_PACKAGES}
+    return {
+        "git_commit": commit,
+        "git_dirty": dirty,
+        "python": platform.python_version(),
+        "packages": {name: version for name, version in packages.items() if version},
+    }
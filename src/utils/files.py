@@ -0,0 +1,54 @@
+"""Filesystem helpers for safe concurrent access to the run store."""
+
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single writer assumed
+    fcntl = None
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = True) -> None:
+    """
+    Write a file so readers see either the old content or the new, never a
+    partial write.
+
+    The data goes to a uniquely named temporary file in the same directory,
+    which is then renamed over ``path`` (an atomic replace on POSIX and on
+    Windows). Temporary names start with a dot and end in ``.tmp`` so store
+    listings skip them.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on ``path`` for the duration of the block.
+
+    Locks are taken with ``flock`` and so coordinate separate processes
+    (and separate opens within one process) on the same host.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -23,3 +23,36 @@ def get_current_commit_hash() -> str | None:
         return None
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return None
+
+
+def get_git_status() -> tuple[str | None, bool | None]:
+    """
+    Get the current commit and whether the working tree has changes.
+
+    Uses a single ``git status`` call.
+
+    Returns:
+        The short commit hash (7 characters) and the dirty flag; each is
+        None when not in a git repository or git is not available.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None, None
+    if result.returncode != 0:
+        return None, None
+
+    commit = None
+    dirty = False
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line.split()[2]
+            commit = oid[:7] if oid != "(initial)" else None
+        elif not line.startswith("#"):
+            dirty = True
+    return commit, dirty
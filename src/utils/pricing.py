@@ -0,0 +1,53 @@
+"""Per-model token pricing used to estimate the cost of evaluation runs."""
+
+# USD per 1M tokens as (input, output). Keys are matched as model-name
+# prefixes so dated snapshots (e.g. "gpt-4o-mini-2024-07-18") resolve to
+# their family; the longest matching prefix wins.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "o1": (15.00, 60.00),
+    "o1-mini": (1.10, 4.40),
+    "o3-mini": (1.10, 4.40),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+
+def get_model_price(model: str) -> tuple[float, float] | None:
+    """
+    Look up the (input, output) price per 1M tokens for a model.
+
+    Args:
+        model: Model name as reported by the provider
+
+    Returns:
+        The price pair, or None if the model is not in the price table
+    """
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+
+def estimate_cost(
+    model: str, prompt_tokens: int | None, completion_tokens: int | None
+) -> float | None:
+    """
+    Estimate the USD cost of a single call.
+
+    Returns:
+        The estimated cost, or None if the model price or the token
+        counts are unknown.
+    """
+    price = get_model_price(model)
+    if price is None or prompt_tokens is None or completion_tokens is None:
+        return None
+    input_price, output_price = price
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
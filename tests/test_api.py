@@ -44,13 +44,14 @@ def make_run(
 @pytest.fixture
 def client(tmp_path, monkeypatch):
     """Create test client with isolated store."""
+    from src.store.aio import AsyncStore
     from src.store.local import LocalStore
 
     test_store = LocalStore(path=str(tmp_path))
 
     import src.api.server as server_module
 
-    monkeypatch.setattr(server_module, "store", test_store)
+    monkeypatch.setattr(server_module, "store", AsyncStore(test_store))
 
     from src.api.server import app
 
@@ -82,6 +83,17 @@ class TestListRuns:
         assert data[0]["passed"] == 1
         assert data[0]["total"] == 2
 
+    def test_reflects_runs_saved_after_cached_listing(self, client, tmp_path):
+        from src.store.local import LocalStore
+
+        test_client, _ = client
+        assert test_client.get("/api/runs").json() == []
+
+        # Another process writing to the same store
+        LocalStore(path=str(tmp_path)).save_run(make_run(id="run-1"))
+
+        assert [r["id"] for r in test_client.get("/api/runs").json()] == ["run-1"]
+
     def test_serializes_timestamp_as_iso(self, client):
         test_client, store = client
         store.save_run(
@@ -112,6 +124,18 @@ class TestGetRun:
         assert data["results"][0]["case_id"] == "c1"
         assert data["results"][0]["passed"] is True
 
+    def test_serves_updated_run_after_resave(self, client):
+        test_client, store = client
+        store.save_run(make_run(id="run-1", results=[make_result(passed=True)]))
+        first = test_client.get("/api/runs/run-1")
+
+        store.save_run(make_run(id="run-1", results=[make_result(passed=False)]))
+        second = test_client.get("/api/runs/run-1")
+
+        assert first.json()["results"][0]["passed"] is True
+        assert second.json()["results"][0]["passed"] is False
+        assert second.headers["content-type"] == "application/json"
+
     def test_returns_404_for_nonexistent_run(self, client):
         test_client, _ = client
 
@@ -199,3 +223,184 @@ class TestGetSuite:
 
         # FastAPI may return 404 for invalid path; 400 if our check runs
         assert response.status_code in (400, 404)
+
+
+class TestListSuites:
+    def test_lists_bundled_suites_with_metadata(self, client):
+        test_client, _ = client
+        response = test_client.get("/api/suites")
+
+        assert response.status_code == 200
+        suites = {s["id"]: s for s in response.json()}
+        basic = suites["basic"]
+        assert basic["title"] == "Basic"
+        assert basic["case_count"] > 0
+        assert basic["categories"] == sorted(basic["categories"])
+        assert len(basic["content_hash"]) == 64
+        assert "cases" not in basic
+
+    def test_reflects_suite_changes(self, client, tmp_path, monkeypatch):
+        import os
+
+        import src.api.server as server
+
+        suites_dir = tmp_path / "suites"
+        suites_dir.mkdir()
+        path = suites_dir / "s.yaml"
+        path.write_text("id: s\ncases:\n  - id: a\n    category: x\n    prompt: p\n")
+        monkeypatch.setattr(server, "_get_suites_dir", lambda: suites_dir)
+        test_client, _ = client
+
+        first = test_client.get("/api/suites").json()
+        path.write_text("id: s\ncases:\n  - id: a\n    prompt: p\n  - id: b\n    prompt: q\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (suites_dir / "t.jsonl").write_text('{"id": "t"}\n{"id": "a", "prompt": "p"}\n')
+        second = test_client.get("/api/suites").json()
+
+        assert [(s["id"], s["case_count"], s["categories"]) for s in first] == [("s", 1, ["x"])]
+        assert [(s["id"], s["case_count"]) for s in second] == [("s", 2), ("t", 1)]
+        assert second[0]["content_hash"] != first[0]["content_hash"]
+
+
+class TestFastJSONResponse:
+    def test_renders_compact_json(self):
+        import json
+
+        from src.api.responses import render_json
+
+        body = render_json({"a": [1, 2.5, None], "b": "é"})
+
+        assert b" " not in body
+        assert json.loads(body) == {"a": [1, 2.5, None], "b": "é"}
+
+    def test_passes_bytes_through(self):
+        from src.api.responses import FastJSONResponse
+
+        response = FastJSONResponse(b'{"cached":true}')
+
+        assert response.body == b'{"cached":true}'
+
+
+class TestLiveRuns:
+    @pytest.fixture
+    def live_dir(self, tmp_path, monkeypatch):
+        live_dir = tmp_path / "live"
+        monkeypatch.setenv("EVAL_LIVE_DIR", str(live_dir))
+        return live_dir
+
+    def test_lists_in_flight_runs(self, client, live_dir):
+        from src.runner.live import LiveRun
+
+        test_client, _ = client
+        live = LiveRun("run-1", "suite-1", "test-model", total=2, root=live_dir)
+        live.on_result(make_result())
+
+        data = test_client.get("/api/live").json()
+
+        assert data[0]["run_id"] == "run-1"
+        assert data[0]["progress"]["done"] == 1
+
+    def test_streams_events_until_end(self, client, live_dir):
+        import json
+
+        from src.runner.live import LiveRun
+
+        test_client, _ = client
+        live = LiveRun("run-1", "suite-1", "test-model", total=1, root=live_dir)
+        live.on_result(make_result(passed=False))
+        live.finish()
+
+        response = test_client.get("/api/live/run-1/events")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        blocks = [b for b in response.text.split("\n\n") if b]
+        assert [b.split("\n")[0] for b in blocks] == [
+            "event: start",
+            "event: result",
+            "event: end",
+        ]
+        result = json.loads(blocks[1].split("\n")[1].removeprefix("data: "))
+        assert result["passed"] is False
+        assert result["progress"]["failed"] == 1
+
+    def test_abort_creates_marker(self, client, live_dir):
+        from src.runner.live import LiveRun
+
+        test_client, _ = client
+        live = LiveRun("run-1", "suite-1", "test-model", total=5, root=live_dir)
+
+        response = test_client.post("/api/live/run-1/abort")
+
+        assert response.status_code == 202
+        assert live.should_abort() is True
+
+    def test_unknown_live_run_returns_404(self, client, live_dir):
+        test_client, _ = client
+
+        assert test_client.get("/api/live/missing/events").status_code == 404
+        assert test_client.post("/api/live/missing/abort").status_code == 404
+
+
+class TestJobs:
+    @pytest.fixture
+    def jobs(self, tmp_path, monkeypatch):
+        import src.api.server as server_module
+        from src.queue import SQLiteQueue
+
+        queue = SQLiteQueue(str(tmp_path / "queue.db"))
+        monkeypatch.setattr(server_module, "_job_queue", lambda: queue)
+        return queue
+
+    def test_create_run_queues_job(self, client, jobs):
+        test_client, _ = client
+
+        response = test_client.post(
+            "/api/runs", json={"suite_id": "basic", "models": ["gpt-4o-mini", "gpt-4o"]}
+        )
+
+        assert response.status_code == 202
+        job = jobs.get(response.json()["job_id"])
+        assert job.kind == "run"
+        assert job.payload["suite_id"] == "basic"
+        assert job.payload["models"] == ["gpt-4o-mini", "gpt-4o"]
+
+    def test_create_run_rejects_unknown_suite(self, client, jobs):
+        test_client, _ = client
+
+        response = test_client.post("/api/runs", json={"suite_id": "nope"})
+
+        assert response.status_code == 404
+
+    def test_create_run_rejects_unknown_system_prompt(self, client, jobs):
+        test_client, _ = client
+
+        response = test_client.post(
+            "/api/runs", json={"suite_id": "basic", "system_prompt": "no-such-prompt"}
+        )
+
+        assert response.status_code == 400
+
+    def test_create_run_passes_tracing_policy(self, client, jobs):
+        test_client, _ = client
+
+        accepted = test_client.post("/api/runs", json={"suite_id": "basic", "tracing": "sample:0.1"})
+        rejected = test_client.post("/api/runs", json={"suite_id": "basic", "tracing": "sometimes"})
+
+        assert accepted.status_code == 202
+        assert jobs.get(accepted.json()["job_id"]).payload["tracing"] == "sample:0.1"
+        assert rejected.status_code == 400
+
+    def test_get_and_cancel_job(self, client, jobs):
+        test_client, _ = client
+        job_id = test_client.post("/api/runs", json={"suite_id": "basic"}).json()["job_id"]
+
+        assert test_client.get(f"/api/jobs/{job_id}").json()["status"] == "queued"
+        assert test_client.post(f"/api/jobs/{job_id}/cancel").json()["status"] == "cancelled"
+        assert test_client.post(f"/api/jobs/{job_id}/cancel").status_code == 404
+        assert [j["id"] for j in test_client.get("/api/jobs").json()] == [job_id]
+
+    def test_missing_job_returns_404(self, client, jobs):
+        test_client, _ = client
+
+        assert test_client.get("/api/jobs/missing").status_code == 404
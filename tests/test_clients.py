@@ -54,3 +54,327 @@ class TestClientFactory:
             client = get_client("gpt-4o")
 
             assert client.default_model == "gpt-4o"
+
+
+class TestConsumeStream:
+    def test_concatenates_chunks_and_keeps_final_usage(self):
+        from src.clients.base import StreamChunk, consume_stream
+
+        chunks = iter([
+            StreamChunk(content="Hello", model="m"),
+            StreamChunk(content=" world", model="m", finish_reason="stop"),
+            StreamChunk(content="", model="m", usage={"completion_tokens": 2}),
+        ])
+
+        response = consume_stream(chunks)
+
+        assert response.content == "Hello world"
+        assert response.model == "m"
+        assert response.usage == {"completion_tokens": 2}
+        assert response.finish_reason == "stop"
+        assert response.ttft_ms is not None and response.ttft_ms >= 0
+
+    def test_stops_and_closes_stream_when_predicate_fires(self):
+        from src.clients.base import StreamChunk, consume_stream
+
+        consumed = []
+        closed = []
+
+        def chunks():
+            try:
+                for word in ["one ", "two ", "three ", "four "]:
+                    consumed.append(word)
+                    yield StreamChunk(content=word, model="m")
+            finally:
+                closed.append(True)
+
+        response = consume_stream(chunks(), stop_when=lambda text: len(text) > 6)
+
+        assert response.content == "one two "
+        assert response.finish_reason == "cancelled"
+        assert consumed == ["one ", "two "]
+        assert closed == [True]
+        assert response.usage["completion_tokens"] is None
+
+    def test_empty_stream_has_no_ttft(self):
+        from src.clients.base import consume_stream
+
+        response = consume_stream(iter([]))
+
+        assert response.content == ""
+        assert response.ttft_ms is None
+        assert response.tokens_per_second is None
+
+
+class TestLazyImports:
+    # Modules the CLI and API must not import until a client is constructed
+    HEAVY_MODULES = ("openai", "google.genai", "langsmith")
+
+    # Generous ceiling for `import llm_eval` (cumulative, as reported by
+    # -X importtime); it is well under 100 ms without the provider SDKs
+    IMPORT_BUDGET_US = 500_000
+
+    def run_python(self, code: str, *flags: str):
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        return subprocess.run(
+            [sys.executable, *flags, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_entry_points_do_not_import_sdks(self):
+        result = self.run_python(
+            "import sys, llm_eval, src.api.server, src.runner.worker\n"
+            f"print([m for m in {self.HEAVY_MODULES!r} if m in sys.modules])"
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_cli_import_time_budget(self):
+        result = self.run_python("import llm_eval", "-X", "importtime")
+
+        line = next(
+            line for line in result.stderr.splitlines() if line.rstrip().endswith("| llm_eval")
+        )
+        cumulative_us = int(line.split("|")[1])
+        assert cumulative_us < self.IMPORT_BUDGET_US
+
+    def test_traceable_imports_langsmith_on_first_call(self):
+        result = self.run_python(
+            "import sys\n"
+            "from src.clients.tracing import traceable\n"
+            "@traceable\n"
+            "def double(x):\n"
+            "    return 2 * x\n"
+            "before = 'langsmith' in sys.modules\n"
+            "print(before, double(21), 'langsmith' in sys.modules)"
+        )
+
+        assert result.stdout.split() == ["False", "42", "True"]
+
+
+class TestClientRegistry:
+    def test_reuses_clients_per_model(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            from src.clients.factory import ClientRegistry
+
+            registry = ClientRegistry(pool_size=4)
+            first = registry.get("gpt-4o")
+            again = registry.get("gpt-4o")
+            other = registry.get("gpt-4o-mini")
+
+            assert again is first
+            assert other is not first
+            assert other.default_model == "gpt-4o-mini"
+            assert other._client is first._client
+            registry.clear()
+
+    def test_sizes_connection_pool(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key", "EVAL_HTTP_POOL_SIZE": "3"}):
+            from src.clients.factory import ClientRegistry
+
+            registry = ClientRegistry()
+            registry.get("gpt-4o")
+
+            limits = registry._http_limits()
+            assert registry.pool_size == 3
+            assert limits.max_connections == 3
+            assert limits.max_keepalive_connections == 3
+            registry.clear()
+
+    def test_reads_pool_size_when_first_client_is_built(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            from src.clients.factory import ClientRegistry
+
+            registry = ClientRegistry()
+            # As if loaded from .env after the registry was created
+            with patch.dict("os.environ", {"EVAL_HTTP_POOL_SIZE": "2"}):
+                registry.get("gpt-4o")
+                assert registry._http_limits().max_connections == 2
+            registry.clear()
+
+    def test_clear_drops_clients(self):
+        with patch.dict("os.environ", {"GOOGLE_API_KEY": "test-key"}):
+            from src.clients.factory import ClientRegistry
+
+            registry = ClientRegistry(pool_size=2)
+            first = registry.get("gemini-2.0-flash")
+            registry.clear()
+
+            assert registry.get("gemini-2.0-flash") is not first
+            registry.clear()
+
+    def test_llm_scorer_shares_judge_client(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            from src.scorers.llm import LLMScorer
+
+            assert LLMScorer().client is LLMScorer().client
+
+
+class TestTracingPolicy:
+    @pytest.fixture
+    def traced_calls(self, monkeypatch):
+        """Replace langsmith.traceable with a decorator that records calls."""
+        import langsmith
+
+        calls = []
+
+        def fake_traceable(func):
+            def traced(*args, **kwargs):
+                calls.append(func.__name__)
+                return func(*args, **kwargs)
+
+            return traced
+
+        monkeypatch.setattr(langsmith, "traceable", fake_traceable)
+        return calls
+
+    def test_parses_policies(self):
+        from src.clients.tracing import TracingPolicy, parse_tracing_policy
+
+        assert parse_tracing_policy("off") == TracingPolicy("off")
+        assert parse_tracing_policy("Errors") == TracingPolicy("errors")
+        assert parse_tracing_policy("sample:0.25") == TracingPolicy("sample", 0.25)
+        assert str(parse_tracing_policy("sample:0.25")) == "sample:0.25"
+        for spec in ("sometimes", "sample", "sample:2", "full:1"):
+            with pytest.raises(ValueError):
+                parse_tracing_policy(spec)
+
+    def test_applies_policy_per_call(self, traced_calls):
+        from src.clients.tracing import traceable, tracing_policy
+
+        @traceable
+        def generate():
+            return "ok"
+
+        for policy in ("full", "off", "sample:1", "sample:0"):
+            with tracing_policy(policy):
+                assert generate() == "ok"
+
+        assert traced_calls == ["generate", "generate"]
+
+    def test_context_overrides_default(self):
+        import src.clients.tracing as tracing
+        from src.clients.tracing import (
+            TracingPolicy,
+            get_tracing_policy,
+            set_default_tracing_policy,
+            tracing_policy,
+        )
+
+        previous = tracing._default_policy
+        try:
+            set_default_tracing_policy("off")
+            with tracing_policy("errors"):
+                assert get_tracing_policy() == TracingPolicy("errors")
+                with tracing_policy(None):
+                    assert get_tracing_policy() == TracingPolicy("errors")
+            assert get_tracing_policy() == TracingPolicy("off")
+        finally:
+            set_default_tracing_policy(previous)
+
+    def test_default_reads_environment_on_use(self, monkeypatch):
+        import src.clients.tracing as tracing
+        from src.clients.tracing import TracingPolicy, get_tracing_policy
+
+        monkeypatch.setattr(tracing, "_default_policy", None)
+        # As if loaded from .env after the module was imported
+        monkeypatch.setenv("EVAL_TRACING", "off")
+        assert get_tracing_policy() == TracingPolicy("off")
+
+        monkeypatch.setenv("EVAL_TRACING", "sometimes")
+        with pytest.raises(ValueError, match="EVAL_TRACING"):
+            get_tracing_policy()
+
+    def test_full_policy_keeps_sdk_llm_run(self):
+        from unittest.mock import MagicMock
+
+        import httpx
+        import langsmith
+        import openai
+        from langsmith.run_helpers import tracing_context
+
+        from src.clients.base import ModelRequest
+        from src.clients.openai import OpenAIClient
+        from src.clients.tracing import tracing_policy, wrap_openai
+
+        def completion(request):
+            return httpx.Response(200, json={
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "hi"},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            })
+
+        sdk_client = wrap_openai(openai.OpenAI(
+            api_key="test-key", http_client=httpx.Client(transport=httpx.MockTransport(completion))
+        ))
+        client = OpenAIClient("gpt-4o", sdk_client=sdk_client)
+        langsmith_client = MagicMock(spec=langsmith.Client)
+
+        def traced_runs(policy):
+            langsmith_client.reset_mock()
+            with tracing_context(enabled=True, client=langsmith_client), tracing_policy(policy):
+                client.generate(ModelRequest(prompt="hello"))
+            return [
+                call.kwargs["run_type"]
+                for call in langsmith_client.create_run.call_args_list
+            ]
+
+        assert traced_runs("full") == ["chain", "llm"]
+        assert traced_runs("off") == []
+        assert traced_runs("errors") == []
+
+    def test_recording_an_error_never_raises(self, monkeypatch):
+        import sys
+        from datetime import datetime, timezone
+
+        from src.clients.tracing import _record_error
+
+        def call(prompt):
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(sys.modules, "langsmith", None)  # Import fails
+        _record_error(call, (), {}, datetime.now(timezone.utc), RuntimeError("boom"))
+
+    def test_errors_mode_records_only_failures(self, traced_calls, monkeypatch):
+        import src.clients.tracing as tracing
+
+        recorded = []
+        monkeypatch.setattr(
+            tracing, "_record_error", lambda func, args, kwargs, start, error: recorded.append(str(error))
+        )
+
+        @tracing.traceable
+        def generate(fail):
+            if fail:
+                raise RuntimeError("generate failed")
+            return "ok"
+
+        @tracing.traceable
+        def stream():
+            yield "one"
+            raise RuntimeError("stream failed")
+
+        with tracing.tracing_policy("errors"):
+            assert generate(False) == "ok"
+            with pytest.raises(RuntimeError):
+                generate(True)
+            chunks = stream()
+            assert next(chunks) == "one"
+            with pytest.raises(RuntimeError):
+                next(chunks)
+
+        assert recorded == ["generate failed", "stream failed"]
+        assert traced_calls == []
@@ -0,0 +1,92 @@
+import pytest
+
+
+@pytest.fixture
+def fresh_environment():
+    from src.utils.env import get_run_environment
+
+    get_run_environment.cache_clear()
+    yield get_run_environment
+    get_run_environment.cache_clear()
+
+
+class TestGetRunEnvironment:
+    def test_captures_git_status_once(self, fresh_environment, monkeypatch):
+        import src.utils.env as env
+
+        calls = []
+
+        def fake_git_status():
+            calls.append(True)
+            return "abc1234", False
+
+        monkeypatch.delenv("EVAL_GIT_COMMIT", raising=False)
+        monkeypatch.delenv("EVAL_GIT_DIRTY", raising=False)
+        monkeypatch.setattr(env, "get_git_status", fake_git_status)
+
+        first = fresh_environment()
+        second = fresh_environment()
+
+        assert second is first
+        assert calls == [True]
+        assert first["git_commit"] == "abc1234"
+        assert first["git_dirty"] is False
+        assert first["python"]
+        assert "pyyaml" in first["packages"]
+
+    def test_env_overrides_skip_git(self, fresh_environment, monkeypatch):
+        import src.utils.env as env
+
+        def fail():
+            raise AssertionError("git should not run")
+
+        monkeypatch.setenv("EVAL_GIT_COMMIT", "deadbee")
+        monkeypatch.setenv("EVAL_GIT_DIRTY", "true")
+        monkeypatch.setattr(env, "get_git_status", fail)
+
+        environment = fresh_environment()
+
+        assert environment["git_commit"] == "deadbee"
+        assert environment["git_dirty"] is True
+
+    def test_partial_override_fills_in_from_git(self, fresh_environment, monkeypatch):
+        import src.utils.env as env
+
+        monkeypatch.setenv("EVAL_GIT_COMMIT", "deadbee")
+        monkeypatch.delenv("EVAL_GIT_DIRTY", raising=False)
+        monkeypatch.setattr(env, "get_git_status", lambda: ("abc1234", True))
+
+        environment = fresh_environment()
+
+        assert environment["git_commit"] == "deadbee"
+        assert environment["git_dirty"] is True
+
+
+class TestGetGitStatus:
+    def test_reads_commit_and_dirty_flag(self, monkeypatch):
+        import subprocess
+
+        import src.utils.git as git
+
+        output = (
+            "# branch.oid 0123456789abcdef0123456789abcdef01234567\n"
+            "# branch.head main\n"
+            "1 .M N... 100644 100644 100644 aaa bbb src/x.py\n"
+        )
+        monkeypatch.setattr(
+            git.subprocess,
+            "run",
+            lambda *a, **k: subprocess.CompletedProcess(a, 0, stdout=output, stderr=""),
+        )
+
+        assert git.get_git_status() == ("0123456", True)
+
+    def test_returns_none_without_git(self, monkeypatch):
+        import src.utils.git as git
+
+        def missing(*args, **kwargs):
+            raise FileNotFoundError("git")
+
+        monkeypatch.setattr(git.subprocess, "run", missing)
+
+        assert git.get_git_status() == (None, None)
@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.store.base import EvalResult, EvalRun
+
+pytest.importorskip("pyarrow")
+
+
+def make_result(case_id: str, passed: bool, model: str = "model-a") -> EvalResult:
+    return EvalResult(
+        id=f"result-{case_id}",
+        suite_id="suite-1",
+        case_id=case_id,
+        model=model,
+        prompt="test prompt",
+        response="test response",
+        passed=passed,
+        score=1.0 if passed else 0.0,
+        reasons=[] if passed else ["failed"],
+        timestamp=datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        latency_ms=100.0,
+        cost_usd=0.01,
+    )
+
+
+def make_run(
+    id: str,
+    results: list[EvalResult],
+    suite_id: str = "suite-1",
+    model: str = "model-a",
+    day: int = 15,
+) -> EvalRun:
+    return EvalRun(
+        id=id,
+        suite_id=suite_id,
+        model=model,
+        timestamp=datetime(2024, 1, day, 12, 0, 0, tzinfo=timezone.utc),
+        results=results,
+        revision=1,
+    )
+
+
+class TestExportParquet:
+    def test_writes_one_file_per_suite_and_month(self, tmp_path):
+        import pyarrow.parquet as pq
+
+        from src.store.parquet import export_parquet
+
+        runs = [
+            make_run("run-1", [make_result("c1", True)], day=10),
+            make_run("run-2", [make_result("c1", False)], day=20),
+            make_run("run-3", [make_result("c1", True)], suite_id="suite-2"),
+        ]
+
+        written = export_parquet(runs, tmp_path)
+
+        assert written == 3
+        files = sorted(tmp_path.rglob("*.parquet"))
+        assert [f.parent.relative_to(tmp_path).as_posix() for f in files] == [
+            "suite_id=suite-1/month=2024-01",
+            "suite_id=suite-2/month=2024-01",
+        ]
+        assert pq.read_table(files[0])["run_id"].to_pylist() == ["run-1", "run-2"]
+
+    def test_flushes_row_groups_into_one_file(self, tmp_path, monkeypatch):
+        import pyarrow.parquet as pq
+
+        import src.store.parquet as parquet
+
+        monkeypatch.setattr(parquet, "ROW_GROUP_ROWS", 2)
+        runs = [
+            make_run(f"run-{i}", [make_result("c1", True), make_result("c2", True)])
+            for i in range(3)
+        ]
+
+        parquet.export_parquet(runs, tmp_path)
+
+        (path,) = tmp_path.rglob("*.parquet")
+        assert pq.ParquetFile(path).num_row_groups == 3
+
+    def test_skips_runs_already_exported(self, tmp_path):
+        from src.store.parquet import export_parquet
+
+        runs = [make_run("run-1", [make_result("c1", True)])]
+        export_parquet(runs, tmp_path)
+
+        assert export_parquet(runs, tmp_path) == 0
+        runs.append(make_run("run-2", [make_result("c1", False)]))
+        assert export_parquet(runs, tmp_path) == 1
+        assert len(list(tmp_path.rglob("*.parquet"))) == 2
+
+
+class TestQueryPassRate:
+    def test_groups_by_model_and_category(self, tmp_path):
+        from src.store.parquet import export_parquet, query_pass_rate
+
+        runs = [
+            make_run("run-a", [make_result("c1", True), make_result("c2", False)]),
+            make_run(
+                "run-b",
+                [make_result("c1", True, model="model-b"), make_result("c2", True, model="model-b")],
+                model="model-b",
+            ),
+        ]
+        categories = {("suite-1", "c1"): "math", ("suite-1", "c2"): "safety"}
+        export_parquet(runs, tmp_path, categories)
+
+        rows = query_pass_rate(tmp_path, group_by=["model"])
+
+        assert [(r["model"], r["passed"], r["total"]) for r in rows] == [
+            ("model-a", 1, 2),
+            ("model-b", 2, 2),
+        ]
+        by_category = query_pass_rate(tmp_path, group_by=["category"])
+        assert {r["category"]: r["pass_rate"] for r in by_category} == {
+            "math": 1.0,
+            "safety": 0.5,
+        }
+
+    def test_filters_on_partition_columns(self, tmp_path):
+        from src.store.parquet import export_parquet, query_pass_rate
+
+        runs = [
+            make_run("run-1", [make_result("c1", True)], day=10),
+            make_run("run-2", [make_result("c1", False)], day=20),
+            make_run("run-3", [make_result("c1", False)], suite_id="suite-2"),
+        ]
+        export_parquet(runs, tmp_path)
+
+        rows = query_pass_rate(
+            tmp_path, group_by=["suite_id"], filters={"suite_id": "suite-1"}, since="2024-01-15"
+        )
+
+        assert rows == [
+            {
+                "suite_id": "suite-1",
+                "passed": 0,
+                "total": 1,
+                "pass_rate": 0.0,
+                "cost_usd": pytest.approx(0.01),
+                "mean_latency_ms": 100.0,
+            }
+        ]
+
+    def test_returns_empty_for_missing_dataset(self, tmp_path):
+        from src.store.parquet import query_pass_rate
+
+        assert query_pass_rate(tmp_path / "missing", group_by=["model"]) == []
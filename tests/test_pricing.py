@@ -0,0 +1,37 @@
+import pytest
+
+
+class TestGetModelPrice:
+    def test_returns_price_for_exact_model(self):
+        from src.utils.pricing import get_model_price
+
+        assert get_model_price("gpt-4o") == (2.50, 10.00)
+
+    def test_prefers_longest_matching_prefix(self):
+        from src.utils.pricing import get_model_price
+
+        assert get_model_price("gpt-4o-mini-2024-07-18") == (0.15, 0.60)
+
+    def test_returns_none_for_unknown_model(self):
+        from src.utils.pricing import get_model_price
+
+        assert get_model_price("mock-model") is None
+
+
+class TestEstimateCost:
+    def test_combines_input_and_output_prices(self):
+        from src.utils.pricing import estimate_cost
+
+        cost = estimate_cost("gpt-4.1", 500_000, 250_000)
+
+        assert cost == pytest.approx(1.0 + 2.0)
+
+    def test_returns_none_without_token_counts(self):
+        from src.utils.pricing import estimate_cost
+
+        assert estimate_cost("gpt-4o", None, 10) is None
+
+    def test_returns_none_for_unknown_model(self):
+        from src.utils.pricing import estimate_cost
+
+        assert estimate_cost("mock-model", 10, 10) is None
@@ -0,0 +1,407 @@
+import pytest
+
+
+@pytest.fixture
+def queue(tmp_path):
+    from src.queue import SQLiteQueue
+
+    return SQLiteQueue(str(tmp_path / "queue.db"))
+
+
+class TestSQLiteQueue:
+    def test_claims_jobs_in_order(self, queue):
+        first = queue.put("run", {"n": 1})
+        second = queue.put("run", {"n": 2})
+
+        job = queue.claim(["run"], "worker-1")
+
+        assert job.id == first
+        assert job.payload == {"n": 1}
+        assert job.status == "running"
+        assert job.worker == "worker-1"
+        assert job.attempts == 1
+        assert queue.claim(["run"], "worker-2").id == second
+        assert queue.claim(["run"], "worker-3") is None
+
+    def test_claims_only_requested_kinds(self, queue):
+        queue.put("shard", {})
+
+        assert queue.claim(["run"], "worker-1") is None
+        assert queue.claim(["shard"], "worker-1").kind == "shard"
+
+    def test_complete_records_result(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        queue.complete(job_id, {"run_ids": ["a"]})
+
+        job = queue.get(job_id)
+        assert job.status == "done"
+        assert job.result == {"run_ids": ["a"]}
+        assert job.finished_at is not None
+
+    def test_fail_records_error(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        queue.fail(job_id, "boom")
+
+        assert queue.get(job_id).status == "failed"
+        assert queue.get(job_id).error == "boom"
+
+    def test_heartbeat_publishes_progress(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        queue.heartbeat(job_id, {"run_ids": []})
+
+        assert queue.get(job_id).result == {"run_ids": []}
+
+    def test_cancel_queued_job_removes_it_from_queue(self, queue):
+        job_id = queue.put("run", {})
+
+        assert queue.cancel(job_id) is True
+        assert queue.get(job_id).status == "cancelled"
+        assert queue.claim(["run"], "worker-1") is None
+
+    def test_cancel_running_job_sets_flag(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        assert queue.is_cancel_requested(job_id) is False
+        assert queue.cancel(job_id) is True
+        assert queue.is_cancel_requested(job_id) is True
+        assert queue.get(job_id).status == "running"
+
+    def test_cannot_cancel_finished_or_missing_job(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+        queue.complete(job_id, {})
+
+        assert queue.cancel(job_id) is False
+        assert queue.cancel("missing") is False
+
+    def test_reclaims_job_after_lease_expires(self, tmp_path):
+        from src.queue import SQLiteQueue
+
+        queue = SQLiteQueue(str(tmp_path / "queue.db"), lease_seconds=-1, max_attempts=2)
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        job = queue.claim(["run"], "worker-2")
+
+        assert job.id == job_id
+        assert job.attempts == 2
+        assert queue.claim(["run"], "worker-3") is None
+        assert queue.get(job_id).status == "failed"
+
+    def test_released_job_is_queued_again(self, queue):
+        job_id = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+
+        queue.release(job_id, {"run_ids": ["r1"]})
+
+        job = queue.claim(["run"], "worker-2")
+        assert job.id == job_id
+        assert job.attempts == 1
+        assert job.result == {"run_ids": ["r1"]}
+
+    def test_clears_result_of_finished_jobs_only(self, queue):
+        running = queue.put("run", {})
+        done = queue.put("run", {})
+        queue.claim(["run"], "worker-1")
+        queue.claim(["run"], "worker-1")
+        queue.heartbeat(running, {"done": 1})
+        queue.complete(done, {"run": "big"})
+
+        queue.clear_result(running)
+        queue.clear_result(done)
+
+        assert queue.get(running).result == {"done": 1}
+        assert queue.get(done).result == {}
+        assert queue.get(done).status == "done"
+
+    def test_jobs_are_claimed_once_across_threads(self, queue):
+        from concurrent.futures import ThreadPoolExecutor
+
+        for i in range(20):
+            queue.put("run", {"n": i})
+
+        def drain(worker):
+            claimed = []
+            while (job := queue.claim(["run"], worker)) is not None:
+                claimed.append(job.id)
+            return claimed
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            claimed = sum(pool.map(drain, ["a", "b", "c", "d"]), [])
+
+        assert len(claimed) == 20
+        assert len(set(claimed)) == 20
+
+
+class TestWorker:
+    @pytest.fixture
+    def suites_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("EVAL_LIVE_DIR", str(tmp_path / "live"))
+        suites_dir = tmp_path / "suites"
+        suites_dir.mkdir()
+        (suites_dir / "mini.yaml").write_text(
+            "id: mini\n"
+            "cases:\n"
+            "  - id: a\n"
+            "    prompt: say hello\n"
+            "    expected: {contains: hello}\n"
+            "  - id: b\n"
+            "    prompt: say bye\n"
+            "    expected: {contains: bye}\n"
+        )
+        return suites_dir
+
+    @pytest.fixture
+    def mock_clients(self, monkeypatch):
+        import src.clients
+
+        from src.clients.base import ModelResponse
+
+        class EchoClient:
+            def __init__(self, model):
+                self.model = model
+
+            def generate(self, request):
+                return ModelResponse(
+                    content=request.prompt, model=self.model, usage={}, finish_reason="stop"
+                )
+
+        monkeypatch.setattr(src.clients, "get_client", EchoClient)
+
+    def test_runs_job_and_saves_runs(self, tmp_path, queue, suites_dir, mock_clients):
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path / "runs"))
+        job_id = queue.put(RUN_JOB, {"suite_id": "mini", "models": ["m1", "m2"]})
+
+        assert process_next_job(queue, store, "worker-1", suites_dir) is True
+
+        job = queue.get(job_id)
+        assert job.status == "done"
+        runs = [store.get_run(run_id) for run_id in job.result["run_ids"]]
+        assert [r.model for r in runs] == ["m1", "m2"]
+        assert {r.revision for r in runs} == {job.result["revision"]}
+        assert all(r.stats.passed == 2 for r in runs)
+        assert process_next_job(queue, store, "worker-1", suites_dir) is False
+
+    def test_cancelled_job_stops_between_cases(self, tmp_path, queue, suites_dir, mock_clients):
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path / "runs"))
+        job_id = queue.put(RUN_JOB, {"suite_id": "mini", "models": ["m1"]})
+        queue.is_cancel_requested = lambda _: True
+
+        process_next_job(queue, store, "worker-1", suites_dir)
+
+        assert queue.get(job_id).status == "cancelled"
+        assert store.list_runs() == []
+
+    def test_stopped_job_resumes_after_finished_models(
+        self, tmp_path, queue, suites_dir, monkeypatch
+    ):
+        import threading
+
+        import src.clients
+        from src.clients.base import ModelResponse
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        stop = threading.Event()
+        stops = [True]  # Only the first attempt at m2 is interrupted
+
+        class StoppingClient:
+            def __init__(self, model):
+                self.model = model
+
+            def generate(self, request):
+                if self.model == "m2" and stops:
+                    stops.pop()
+                    stop.set()  # The worker is told to shut down mid-run
+                return ModelResponse(
+                    content=request.prompt, model=self.model, usage={}, finish_reason="stop"
+                )
+
+        monkeypatch.setattr(src.clients, "get_client", StoppingClient)
+        store = LocalStore(path=str(tmp_path / "runs"))
+        job_id = queue.put(RUN_JOB, {"suite_id": "mini", "models": ["m1", "m2"]})
+
+        process_next_job(queue, store, "worker-1", suites_dir, stop=stop)
+
+        job = queue.get(job_id)
+        assert job.status == "queued"
+        assert len(job.result["run_ids"]) == 1
+
+        stop.clear()
+        process_next_job(queue, store, "worker-2", suites_dir, stop=stop)
+
+        job = queue.get(job_id)
+        assert job.status == "done"
+        runs = [store.get_run(run_id) for run_id in job.result["run_ids"]]
+        assert [r.model for r in runs] == ["m1", "m2"]
+        assert {r.revision for r in runs} == {job.result["revision"]}
+        assert len(store.list_runs()) == 2
+
+    def test_failed_client_leaves_no_live_run(self, tmp_path, queue, suites_dir, monkeypatch):
+        import threading
+
+        import src.clients
+        from src.runner.live import list_live_runs
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        def missing_key(model):
+            raise ValueError("GOOGLE_API_KEY is not set")
+
+        monkeypatch.setattr(src.clients, "get_client", missing_key)
+        job_id = queue.put(RUN_JOB, {"suite_id": "mini", "models": ["gemini-x"]})
+
+        before = set(threading.enumerate())
+        process_next_job(queue, LocalStore(path=str(tmp_path / "runs")), "w", suites_dir)
+
+        assert queue.get(job_id).status == "failed"
+        assert list_live_runs(tmp_path / "live") == []
+        heartbeats = [
+            t for t in threading.enumerate()
+            if t not in before and t.name.startswith("live-heartbeat-")
+        ]
+        for thread in heartbeats:
+            thread.join(5)
+        assert not any(thread.is_alive() for thread in heartbeats)
+
+    def test_failed_heartbeat_finishes_live_run(
+        self, tmp_path, queue, suites_dir, mock_clients, monkeypatch
+    ):
+        import sqlite3
+        import threading
+
+        from src.runner.live import list_live_runs
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        job_id = queue.put(RUN_JOB, {"suite_id": "mini", "models": ["m1"]})
+
+        def locked(job_id, result=None):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(queue, "heartbeat", locked)
+        before = set(threading.enumerate())
+        process_next_job(queue, LocalStore(path=str(tmp_path / "runs")), "w", suites_dir)
+
+        assert queue.get(job_id).status == "failed"
+        assert list_live_runs(tmp_path / "live") == []
+        heartbeats = [
+            t for t in threading.enumerate()
+            if t not in before and t.name.startswith("live-heartbeat-")
+        ]
+        for thread in heartbeats:
+            thread.join(5)
+        assert not any(thread.is_alive() for thread in heartbeats)
+
+    def test_unknown_suite_fails_job(self, tmp_path, queue, suites_dir):
+        from src.runner.worker import RUN_JOB, process_next_job
+        from src.store.local import LocalStore
+
+        job_id = queue.put(RUN_JOB, {"suite_id": "missing", "models": ["m1"]})
+
+        process_next_job(queue, LocalStore(path=str(tmp_path / "runs")), "w", suites_dir)
+
+        assert queue.get(job_id).status == "failed"
+        assert "missing" in queue.get(job_id).error
+
+
+class TestSharding:
+    def test_split_cases_covers_all_cases(self):
+        from src.runner.shard import split_cases
+
+        assert split_cases(5, 2) == [(0, 2), (2, 4), (4, 5)]
+        assert split_cases(0, 2) == []
+        with pytest.raises(ValueError):
+            split_cases(5, 0)
+
+    @pytest.fixture
+    def suite_path(self, tmp_path):
+        lines = ["id: big", "cases:"]
+        for i in range(7):
+            lines += [f"  - id: c{i}", f"    prompt: answer {i}", f"    expected: {{contains: '{i}'}}"]
+        path = tmp_path / "big.yaml"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    @pytest.fixture
+    def workers(self, tmp_path, queue, monkeypatch):
+        import threading
+
+        import src.clients
+        from src.clients.base import ModelResponse
+        from src.runner.worker import process_next_job
+        from src.store.local import LocalStore
+
+        class EchoClient:
+            def __init__(self, model):
+                self.model = model
+
+            def generate(self, request):
+                return ModelResponse(
+                    content=request.prompt, model=self.model, usage={}, finish_reason="stop"
+                )
+
+        monkeypatch.setattr(src.clients, "get_client", EchoClient)
+        stop = threading.Event()
+        store = LocalStore(path=str(tmp_path / "runs"))
+
+        def work(name):
+            while not stop.is_set():
+                if not process_next_job(queue, store, name):
+                    stop.wait(0.01)
+
+        threads = [threading.Thread(target=work, args=(f"w{i}",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        yield
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    def test_merges_shards_into_one_run(self, queue, suite_path, workers):
+        from src.runner.shard import run_sharded
+
+        run = run_sharded(queue, suite_path, "m1", shard_size=3, poll_interval=0.01)
+
+        assert run.suite_id == "big"
+        assert run.model == "m1"
+        assert [r.case_id for r in run.results] == [f"c{i}" for i in range(7)]
+        assert run.stats.passed == 7
+        assert run.revision is None
+        shard_jobs = queue.list(kind="shard")
+        assert len(shard_jobs) == 3
+        assert all(job.status == "done" and job.result == {} for job in shard_jobs)
+
+    def test_failed_shard_cancels_the_rest(self, tmp_path, queue, suite_path):
+        from src.runner.shard import ShardFailed, run_sharded
+
+        original_get = queue.get
+
+        def get(job_id):
+            job = original_get(job_id)
+            if job.payload["start"] == 0 and job.status == "queued":
+                queue.claim(["shard"], "w")
+                queue.fail(job_id, "boom")
+                job = original_get(job_id)
+            return job
+
+        queue.get = get
+
+        with pytest.raises(ShardFailed, match="boom"):
+            run_sharded(queue, suite_path, "m1", shard_size=3, poll_interval=0.01)
+
+        statuses = sorted(job.status for job in queue.list(kind="shard"))
+        assert statuses == ["cancelled", "cancelled", "failed"]
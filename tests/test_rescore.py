@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.store.base import EvalResult, EvalRun
+
+
+def make_result(case_id: str, response: str, passed: bool = True) -> EvalResult:
+    return EvalResult(
+        id=f"result-{case_id}",
+        suite_id="test-suite",
+        case_id=case_id,
+        model="gpt-4o-mini",
+        prompt="test prompt",
+        response=response,
+        passed=passed,
+        score=1.0 if passed else 0.0,
+        reasons=[] if passed else ["failed"],
+        timestamp=datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        latency_ms=250.0,
+        prompt_tokens=1_000_000,
+        completion_tokens=0,
+    )
+
+
+def make_run(run_id: str, results: list[EvalResult], suite_id: str = "test-suite") -> EvalRun:
+    return EvalRun(
+        id=run_id,
+        suite_id=suite_id,
+        model="gpt-4o-mini",
+        timestamp=datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        results=results,
+        revision=1,
+    )
+
+
+def make_suite(cases: list[dict]) -> dict:
+    from src.runner.loader import compile_suite
+
+    return compile_suite({"id": "test-suite", "cases": cases})
+
+
+class TestRescoreRun:
+    def test_applies_current_rules_to_stored_responses(self):
+        from src.runner.rescore import rescore_run
+        from src.scorers.rules import RuleScorer
+
+        run = make_run("run-1", [make_result("c1", "The answer is 5", passed=True)])
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {"contains": "4"}}])
+
+        rescored = rescore_run(run, suite, RuleScorer())
+
+        assert rescored.id != run.id
+        assert rescored.rescored_from == "run-1"
+        assert rescored.results[0].passed is False
+        assert rescored.results[0].response == "The answer is 5"
+
+    def test_keeps_generation_metrics_and_recomputes_cost(self):
+        from src.runner.rescore import rescore_run
+        from src.scorers.rules import RuleScorer
+
+        run = make_run("run-1", [make_result("c1", "4")])
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {}}])
+
+        result = rescore_run(run, suite, RuleScorer()).results[0]
+
+        assert result.latency_ms == 250.0
+        assert result.cost_usd == pytest.approx(0.15)
+
+    def test_drops_cases_removed_from_suite(self):
+        from src.runner.rescore import rescore_run
+        from src.scorers.rules import RuleScorer
+
+        run = make_run("run-1", [make_result("c1", "4"), make_result("gone", "4")])
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {}}])
+
+        rescored = rescore_run(run, suite, RuleScorer())
+
+        assert [r.case_id for r in rescored.results] == ["c1"]
+
+
+class TestRescoreRuns:
+    def test_yields_pairs_in_input_order(self):
+        from src.runner.rescore import rescore_runs
+
+        runs = [make_run(f"run-{i}", [make_result("c1", str(i))]) for i in range(10)]
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {"contains": "3"}}])
+
+        pairs = list(rescore_runs(iter(runs), {"test-suite": suite}, workers=2))
+
+        assert [original.id for original, _ in pairs] == [r.id for r in runs]
+        assert [rescored.results[0].passed for _, rescored in pairs] == [
+            i == 3 for i in range(10)
+        ]
+
+    def test_skips_runs_of_unknown_suites(self):
+        from src.runner.rescore import rescore_runs
+
+        runs = [make_run("run-1", [make_result("c1", "4")], suite_id="other")]
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {}}])
+
+        assert list(rescore_runs(runs, {"test-suite": suite})) == []
+
+    def test_scores_rule_suites_in_worker_processes(self, monkeypatch):
+        import os
+
+        from src.runner.rescore import rescore_runs
+        from src.scorers.base import ScoreResult
+
+        seen_pids = []
+
+        class JudgeScorer:
+            def score(self, prompt, response, expected):
+                seen_pids.append(os.getpid())
+                return ScoreResult(passed=True, score=1.0, reasons=[])
+
+        runs = [make_run(f"run-{i}", [make_result("c1", "4")]) for i in range(4)]
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {"contains": "4"}}])
+
+        rescored = [r for _, r in rescore_runs(runs, {"test-suite": suite}, workers=2)]
+        assert all(r.results[0].passed for r in rescored)
+
+        monkeypatch.setattr("src.runner.rescore.get_scorer_for_suite", lambda s, fail_fast: JudgeScorer())
+        list(rescore_runs(runs, {"test-suite": suite}, workers=2))
+
+        # Scorers that are not RuleScorers (LLM judges) run in threads
+        assert seen_pids == [os.getpid()] * 4
+
+    def test_reads_unindexed_run_files_once(self, tmp_path, monkeypatch):
+        from src.runner.rescore import rescore_runs
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), layout="flat")
+        store.save_run(make_run("run-1", [make_result("c1", "4")]))
+        (tmp_path / "index.jsonl").unlink()
+        loads = []
+        original_load_file = LocalStore._load_file
+        monkeypatch.setattr(
+            LocalStore,
+            "_load_file",
+            lambda self, *args: loads.append(args) or original_load_file(self, *args),
+        )
+        suite = make_suite([{"id": "c1", "prompt": "p", "expected": {"contains": "4"}}])
+
+        pairs = list(
+            rescore_runs(store.iter_runs(load_results=True), {"test-suite": suite}, workers=1)
+        )
+
+        assert pairs[0][1].results[0].passed
+        assert len(loads) == 1
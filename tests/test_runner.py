@@ -151,3 +151,482 @@ class TestRunner:
 
         assert run.model == "mock-model"
         assert run.results[0].model == "mock-model"
+
+    def test_records_latency_and_token_usage(self):
+        from src.runner.runner import Runner
+
+        client = MockClient(responses={"test": "response"})
+        runner = Runner(client=client, scorer=MockScorer())
+
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {}}],
+        }
+
+        result = runner.run(suite).results[0]
+
+        assert result.latency_ms is not None and result.latency_ms >= 0
+        assert result.ttft_ms is None
+        assert result.prompt_tokens == 10
+        assert result.completion_tokens == 5
+        assert result.judge_tokens is None
+
+    def test_estimates_cost_for_known_models(self):
+        from src.runner.runner import Runner
+
+        class PricedClient(MockClient):
+            def generate(self, request: ModelRequest) -> ModelResponse:
+                return ModelResponse(
+                    content="ok",
+                    model="gpt-4o-mini-2024-07-18",
+                    usage={"prompt_tokens": 1_000_000, "completion_tokens": 1_000_000},
+                    finish_reason="stop",
+                )
+
+        runner = Runner(client=PricedClient(responses={}), scorer=MockScorer())
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {}}],
+        }
+
+        run = runner.run(suite)
+
+        assert run.results[0].cost_usd == pytest.approx(0.75)
+        assert run.stats.cost_usd == pytest.approx(0.75)
+
+    def test_adds_judge_usage_and_cost(self):
+        from src.runner.runner import Runner
+
+        class JudgeScorer:
+            def score(self, prompt, response, expected):
+                return ScoreResult(
+                    passed=True,
+                    score=1.0,
+                    reasons=[],
+                    usage={"total_tokens": 42},
+                    cost_usd=0.01,
+                )
+
+        runner = Runner(client=MockClient(responses={}), scorer=JudgeScorer())
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {}}],
+        }
+
+        result = runner.run(suite).results[0]
+
+        assert result.judge_tokens == 42
+        assert result.cost_usd == pytest.approx(0.01)  # mock-model has no price
+
+    def test_cost_is_unknown_when_priced_model_reports_no_usage(self):
+        from src.runner.runner import estimate_result_cost
+
+        judged = ScoreResult(passed=True, score=1.0, reasons=[], cost_usd=0.01)
+
+        assert estimate_result_cost("gpt-4o-mini", None, None, judged) is None
+        assert estimate_result_cost("mock-model", None, None, judged) == pytest.approx(0.01)
+
+
+@dataclass
+class StreamingMockClient:
+    """Mock client that streams a fixed response one word at a time."""
+
+    content: str
+
+    def generate(self, request: ModelRequest) -> ModelResponse:
+        raise AssertionError("streaming runner should not call generate")
+
+    def stream(self, request: ModelRequest):
+        from src.clients.base import StreamChunk
+
+        for word in self.content.split(" "):
+            yield StreamChunk(content=word + " ", model="mock-model")
+
+
+class TestRunnerStreaming:
+    def test_records_ttft_when_streaming(self):
+        from src.runner.runner import Runner
+
+        runner = Runner(
+            client=StreamingMockClient(content="hello there"),
+            scorer=MockScorer(),
+            stream=True,
+        )
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {}}],
+        }
+
+        result = runner.run(suite).results[0]
+
+        assert result.response == "hello there "
+        assert result.ttft_ms is not None
+        assert result.finish_reason == "stop"
+
+    def test_stops_generation_once_max_words_exceeded(self):
+        from src.runner.runner import Runner
+        from src.scorers.rules import RuleScorer
+
+        runner = Runner(
+            client=StreamingMockClient(content="a b c d e f g h"),
+            scorer=RuleScorer(),
+            stream=True,
+        )
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {"max_words": 2}}],
+        }
+
+        result = runner.run(suite).results[0]
+
+        assert result.response == "a b c "
+        assert result.finish_reason == "cancelled"
+        assert result.passed is False
+
+    def test_falls_back_to_generate_without_stream_support(self):
+        from src.runner.runner import Runner
+
+        runner = Runner(
+            client=MockClient(responses={"test": "response"}),
+            scorer=MockScorer(),
+            stream=True,
+        )
+        suite = {
+            "id": "test-suite",
+            "cases": [{"id": "case1", "prompt": "test", "expected": {}}],
+        }
+
+        result = runner.run(suite).results[0]
+
+        assert result.response == "response"
+        assert result.ttft_ms is None
+
+
+class TestLoadSuite:
+    def test_precompiles_expected_blocks(self, tmp_path):
+        from src.runner.loader import load_suite
+        from src.scorers.rules import CompiledExpected
+
+        path = tmp_path / "suite.yaml"
+        path.write_text(
+            "id: s\n"
+            "cases:\n"
+            "  - id: a\n"
+            "    prompt: p\n"
+            "    expected:\n"
+            "      contains: '4'\n"
+            "  - id: b\n"
+            "    prompt: p\n"
+        )
+
+        suite = load_suite(str(path))
+
+        assert all(isinstance(c["expected"], CompiledExpected) for c in suite["cases"])
+        assert suite["cases"][0]["expected"] == {"contains": "4"}
+        assert suite["cases"][1]["expected"] == {}
+
+    def test_caches_until_file_changes(self, tmp_path):
+        import os
+
+        from src.runner.loader import load_suite
+
+        path = tmp_path / "suite.yaml"
+        path.write_text("id: s\ncases:\n  - id: a\n    prompt: p\n")
+
+        first = load_suite(str(path))
+        second = load_suite(str(path))
+        second["id"] = "changed"
+
+        assert second["cases"] is first["cases"]
+        assert load_suite(str(path))["id"] == "s"
+
+        path.write_text("id: s2\ncases: []\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_suite(str(path))["id"] == "s2"
+
+    def test_writes_and_uses_json_sidecar_for_large_suites(self, tmp_path, monkeypatch):
+        import json
+
+        import src.runner.loader as loader
+
+        monkeypatch.setattr(loader, "SIDECAR_MIN_BYTES", 0)
+        path = tmp_path / "suite.yaml"
+        path.write_text("id: s\ncases:\n  - id: a\n    prompt: p\n")
+        stat = path.stat()
+
+        loader.parse_suite(path, (stat.st_mtime_ns, stat.st_size))
+        sidecar = tmp_path / ".suite.yaml.json"
+        data = json.loads(sidecar.read_text())
+        data["suite"]["id"] = "from-sidecar"
+        sidecar.write_text(json.dumps(data))
+
+        assert loader.parse_suite(path, (stat.st_mtime_ns, stat.st_size))["id"] == "from-sidecar"
+        # A sidecar for another version of the file is ignored
+        assert loader.parse_suite(path, (stat.st_mtime_ns + 1, stat.st_size))["id"] == "s"
+
+    def test_skips_sidecar_for_non_json_values(self, tmp_path, monkeypatch):
+        import src.runner.loader as loader
+
+        monkeypatch.setattr(loader, "SIDECAR_MIN_BYTES", 0)
+        path = tmp_path / "suite.yaml"
+        path.write_text("id: s\ncreated: 2024-01-01\ncases: []\n")
+
+        loader.load_suite(str(path))
+
+        assert not (tmp_path / ".suite.yaml.json").exists()
+
+    def test_jsonl_suite_reads_cases_lazily(self, tmp_path):
+        import json
+
+        from src.runner.loader import LazyCases, load_suite
+        from src.scorers.rules import CompiledExpected
+
+        path = tmp_path / "big.jsonl"
+        lines = [{"id": "big", "title": "Big"}] + [
+            {"id": f"c{i}", "prompt": "p", "expected": {"contains": str(i)}} for i in range(5)
+        ]
+        path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
+
+        suite = load_suite(str(path))
+
+        assert suite["id"] == "big"
+        assert isinstance(suite["cases"], LazyCases)
+        assert len(suite["cases"]) == 5
+        assert [c["id"] for c in suite["cases"]] == [f"c{i}" for i in range(5)]
+        assert all(isinstance(c["expected"], CompiledExpected) for c in suite["cases"])
+        assert [c["id"] for c in suite["cases"][1:3]] == ["c1", "c2"]
+
+    def test_jsonl_suite_slice_parses_only_sliced_lines(self, tmp_path):
+        import json
+
+        from src.runner.loader import LazyCases
+
+        path = tmp_path / "cases.jsonl"
+        path.write_text(
+            "not json\n" + json.dumps({"id": "c1", "prompt": "p"}) + "\nnot json either\n"
+        )
+
+        assert [c["id"] for c in LazyCases(path)[1:2]] == ["c1"]
+
+    def test_jsonl_suite_requires_header(self, tmp_path):
+        from src.runner.loader import load_suite
+
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"id": "c1", "prompt": "p"}\n')
+
+        with pytest.raises(ValueError, match="header"):
+            load_suite(str(path))
+
+    def test_yaml_suite_with_cases_file(self, tmp_path):
+        from src.runner.loader import list_suite_paths, load_suite
+
+        (tmp_path / "s.cases.jsonl").write_text(
+            '{"id": "a", "prompt": "p"}\n{"id": "b", "prompt": "q"}\n'
+        )
+        path = tmp_path / "s.yaml"
+        path.write_text("id: s\ncases_file: s.cases.jsonl\n")
+
+        suite = load_suite(str(path))
+
+        assert [c["id"] for c in suite["cases"]] == ["a", "b"]
+        assert list_suite_paths(tmp_path) == [path]
+
+    def test_runner_runs_jsonl_suite(self, tmp_path):
+        import json
+
+        from src.runner.loader import load_suite
+        from src.runner.runner import Runner
+
+        path = tmp_path / "s.jsonl"
+        path.write_text(
+            json.dumps({"id": "s"}) + "\n"
+            + json.dumps({"id": "a", "prompt": "2+2", "expected": {"contains": "4"}}) + "\n"
+        )
+        runner = Runner(client=MockClient(responses={"2+2": "4"}), scorer=MockScorer())
+
+        run = runner.run(load_suite(str(path)))
+
+        assert [r.case_id for r in run.results] == ["a"]
+        assert run.results[0].passed
+
+
+    def test_suite_metadata_is_cached_until_case_file_changes(self, tmp_path):
+        import os
+
+        from src.runner.loader import list_suites
+
+        cases = tmp_path / "s.cases.jsonl"
+        cases.write_text('{"id": "a", "category": "x", "prompt": "p"}\n')
+        (tmp_path / "s.yaml").write_text("id: s\ntitle: S\ncases_file: s.cases.jsonl\n")
+        (tmp_path / "broken.jsonl").write_text("not json\n")
+
+        first = list_suites(tmp_path)
+        assert list_suites(tmp_path)[0] is first[0]
+
+        cases.write_text('{"id": "a", "prompt": "p"}\n{"id": "b", "category": "y", "prompt": "q"}\n')
+        stat = cases.stat()
+        os.utime(cases, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = list_suites(tmp_path)
+
+        assert [(s["id"], s["title"], s["case_count"]) for s in first] == [("s", "S", 1)]
+        assert second[0]["case_count"] == 2
+        assert second[0]["categories"] == ["y"]
+        assert second[0]["content_hash"] != first[0]["content_hash"]
+
+
+def make_suite(n: int) -> dict:
+    return {
+        "id": "test-suite",
+        "cases": [{"id": f"case-{i}", "prompt": f"prompt {i}"} for i in range(n)],
+    }
+
+
+class TestRunEnvironment:
+    def test_runs_record_environment_without_running_git(self, monkeypatch):
+        import src.utils.env as env
+        from src.runner.runner import Runner
+
+        env.get_run_environment.cache_clear()
+        monkeypatch.setenv("EVAL_GIT_COMMIT", "abc1234")
+        monkeypatch.setenv("EVAL_GIT_DIRTY", "0")
+        try:
+            runner = Runner(client=MockClient(responses={}), scorer=MockScorer())
+            first = runner.run(make_suite(1))
+            second = runner.run(make_suite(1))
+        finally:
+            env.get_run_environment.cache_clear()
+
+        assert first.git_commit_hash == "abc1234"
+        assert first.environment["git_dirty"] is False
+        assert second.environment is first.environment
+
+
+class TestRunnerProgress:
+    def test_uses_given_run_id(self):
+        from src.runner.runner import Runner
+
+        run = Runner(client=MockClient(responses={}), scorer=MockScorer()).run(
+            make_suite(1), run_id="run-42"
+        )
+
+        assert run.id == "run-42"
+
+    def test_reports_each_result(self):
+        from src.runner.runner import Runner
+
+        seen = []
+        runner = Runner(client=MockClient(responses={}), scorer=MockScorer())
+
+        runner.run(make_suite(3), on_result=lambda r: seen.append(r.case_id))
+
+        assert seen == ["case-0", "case-1", "case-2"]
+
+    def test_abort_raises_with_partial_run(self):
+        from src.runner.runner import RunAborted, Runner
+
+        seen = []
+        runner = Runner(client=MockClient(responses={}), scorer=MockScorer())
+
+        with pytest.raises(RunAborted) as exc_info:
+            runner.run(
+                make_suite(5),
+                run_id="run-1",
+                on_result=seen.append,
+                should_abort=lambda: len(seen) >= 2,
+            )
+
+        assert exc_info.value.run.id == "run-1"
+        assert [r.case_id for r in exc_info.value.run.results] == ["case-0", "case-1"]
+
+
+class TestLiveRun:
+    def test_publishes_start_results_and_end(self, tmp_path):
+        from src.runner.live import LiveRun, read_events
+        from src.runner.runner import Runner
+
+        live = LiveRun("run-1", "test-suite", "mock-model", total=2, root=tmp_path)
+        Runner(client=MockClient(responses={}), scorer=MockScorer()).run(
+            make_suite(2), run_id="run-1", on_result=live.on_result
+        )
+        live.finish()
+
+        events, offset = read_events(tmp_path / "run-1.jsonl")
+
+        assert [e["type"] for e in events] == ["start", "result", "result", "end"]
+        assert events[2]["progress"]["done"] == 2
+        assert events[2]["progress"]["passed"] == 2
+        assert events[-1]["status"] == "completed"
+        assert read_events(tmp_path / "run-1.jsonl", offset) == ([], offset)
+
+    def test_ignores_partial_trailing_line(self, tmp_path):
+        from src.runner.live import read_events
+
+        path = tmp_path / "run-1.jsonl"
+        path.write_text('{"type": "start"}\n{"type": "res')
+
+        events, offset = read_events(path)
+
+        assert events == [{"type": "start"}]
+        assert offset == len('{"type": "start"}\n')
+
+    def test_lists_only_runs_in_flight(self, tmp_path):
+        from src.runner.live import LiveRun, list_live_runs
+
+        LiveRun("running", "suite", "model", total=3, root=tmp_path)
+        LiveRun("done", "suite", "model", total=3, root=tmp_path).finish()
+
+        runs = list_live_runs(tmp_path)
+
+        assert [r["run_id"] for r in runs] == ["running"]
+        assert runs[0]["total"] == 3
+
+    def test_heartbeat_keeps_slow_run_fresh(self, tmp_path, monkeypatch):
+        import os
+        import threading
+        import time
+
+        import src.runner.live as live_module
+
+        monkeypatch.setattr(live_module, "HEARTBEAT_SECONDS", 0.01)
+        beats = threading.Event()
+        live = live_module.LiveRun(
+            "run-1", "suite", "model", total=3, root=tmp_path, on_heartbeat=beats.set
+        )
+        # As if the last event was written long ago, during a slow case
+        old = time.time() - 2 * live_module.STALE_AFTER_SECONDS
+        os.utime(live.path, (old, old))
+        assert live_module.is_stale(live.path)
+
+        deadline = time.monotonic() + 5
+        while live_module.is_stale(live.path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        live.finish()
+
+        assert not live_module.is_stale(live.path)
+        assert beats.is_set()
+
+    def test_run_without_heartbeat_is_stale(self, tmp_path):
+        import os
+        import time
+
+        from src.runner.live import STALE_AFTER_SECONDS, list_live_runs
+
+        path = tmp_path / "dead.jsonl"
+        path.write_text('{"type": "start", "run_id": "dead", "started_at": 0}\n')
+        old = time.time() - STALE_AFTER_SECONDS - 1
+        os.utime(path, (old, old))
+
+        assert list_live_runs(tmp_path) == []
+
+    def test_abort_request_reaches_runner(self, tmp_path):
+        from src.runner.live import LiveRun, request_abort
+
+        live = LiveRun("run-1", "suite", "model", total=3, root=tmp_path)
+
+        assert live.should_abort() is False
+        assert request_abort("run-1", tmp_path) is True
+        assert live.should_abort() is True
+        assert request_abort("missing", tmp_path) is False
+        assert request_abort("../run-1", tmp_path) is False
@@ -259,3 +259,170 @@ class TestRuleScorerMultipleRules:
 
         assert result.passed is True
         assert result.score == 1.0
+
+
+class TestEarlyStopCheck:
+    def test_returns_none_without_length_rules(self):
+        from src.scorers.rules import early_stop_check
+
+        assert early_stop_check({"contains": "4"}) is None
+
+    def test_fires_when_max_length_exceeded(self):
+        from src.scorers.rules import early_stop_check
+
+        exceeded = early_stop_check({"max_length": 5})
+
+        assert exceeded("12345") is False
+        assert exceeded("123456") is True
+
+    def test_fires_when_max_words_exceeded(self):
+        from src.scorers.rules import early_stop_check
+
+        exceeded = early_stop_check({"max_words": 2})
+
+        assert exceeded("one two") is False
+        assert exceeded("one two three") is True
+
+    def test_fires_when_exact_words_overshot(self):
+        from src.scorers.rules import early_stop_check
+
+        exceeded = early_stop_check({"exact_words": 3})
+
+        assert exceeded("one two") is False
+        assert exceeded("one two three four") is True
+
+
+class TestRulePlan:
+    def test_orders_rules_cheapest_first(self):
+        from src.scorers.rules import compile_rules
+
+        plan = compile_rules(
+            {"json_has_keys": ["a"], "max_words": 3, "contains": "x", "max_length": 9}
+        )
+
+        assert [r.name for r in plan.rules] == [
+            "max_length",
+            "contains",
+            "max_words",
+            "json_has_keys",
+        ]
+
+    def test_parses_json_once_for_both_json_rules(self, monkeypatch):
+        import src.scorers.rules as rules
+
+        calls = []
+        real_loads = rules.json.loads
+
+        def counting_loads(text):
+            calls.append(text)
+            return real_loads(text)
+
+        monkeypatch.setattr(rules.json, "loads", counting_loads)
+        plan = rules.compile_rules({"valid_json": True, "json_has_keys": ["name"]})
+
+        result = plan.evaluate('{"name": "Alice"}')
+
+        assert result.passed is True
+        assert len(calls) == 1
+
+    def test_fail_fast_stops_at_first_failure(self):
+        from src.scorers.rules import RuleScorer
+
+        scorer = RuleScorer(fail_fast=True)
+        result = scorer.score("", "wrong", {"contains": "4", "max_length": 2})
+
+        assert result.passed is False
+        assert result.reasons == ["Length: 5 exceeds max 2"]
+
+    def test_json_has_keys_on_scalar_reports_missing(self):
+        from src.scorers.rules import RuleScorer
+
+        result = RuleScorer().score("", "42", {"json_has_keys": ["name"]})
+
+        assert result.passed is False
+        assert "name" in result.reasons[0]
+
+
+class TestRuleScorerNotContains:
+    def test_passes_when_forbidden_string_absent(self):
+        from src.scorers.rules import RuleScorer
+
+        result = RuleScorer().score("", "Sure, here you go", {"not_contains": "sorry"})
+
+        assert result.passed is True
+
+    def test_fails_when_any_forbidden_string_present(self):
+        from src.scorers.rules import RuleScorer
+
+        result = RuleScorer().score(
+            "", "I'm sorry, I can't", {"not_contains": ["as an AI", "sorry"]}
+        )
+
+        assert result.passed is False
+        assert "sorry" in result.reasons[0]
+
+
+class TestRuleScorerContainsAll:
+    def test_passes_when_all_found(self):
+        from src.scorers.rules import RuleScorer
+
+        result = RuleScorer().score("", "red green blue", {"contains_all": ["red", "blue"]})
+
+        assert result.passed is True
+
+    def test_fails_listing_missing_strings(self):
+        from src.scorers.rules import RuleScorer
+
+        result = RuleScorer().score("", "red green", {"contains_all": ["red", "blue"]})
+
+        assert result.passed is False
+        assert "blue" in result.reasons[0]
+
+
+class TestPatternMatcher:
+    def test_small_sets_find_present_patterns(self):
+        from src.scorers.matching import PatternMatcher
+
+        matcher = PatternMatcher(["cat", "dog", "bird"])
+
+        assert matcher.find("the cat and the dog") == {"cat", "dog"}
+
+    def test_automaton_finds_overlapping_and_nested_patterns(self):
+        from src.scorers.matching import AUTOMATON_MIN_PATTERNS, PatternMatcher
+
+        patterns = ["he", "she", "his", "hers", "usher"] + [
+            f"filler{i}" for i in range(AUTOMATON_MIN_PATTERNS)
+        ]
+        matcher = PatternMatcher(patterns)
+
+        assert matcher.find("ushers") == {"he", "she", "hers", "usher"}
+
+    def test_automaton_agrees_with_substring_scan(self):
+        from src.scorers.matching import PatternMatcher
+
+        patterns = ["a", "ab", "bab", "bc", "bca", "c", "caa", "xyz", "abcab", ""]
+        text = "abccab bcaab xy"
+        matcher = PatternMatcher(patterns)
+
+        assert matcher.find(text) == {p for p in patterns if p in text}
+
+
+class TestCompiledExpected:
+    def test_scores_like_plain_dict(self):
+        from src.scorers.rules import CompiledExpected, RuleScorer
+
+        expected = {"contains_any": ["yes", "no"], "max_length": 5}
+        scorer = RuleScorer()
+
+        compiled = scorer.score("", "maybe not", CompiledExpected(expected))
+        plain = scorer.score("", "maybe not", expected)
+
+        assert compiled == plain
+
+    def test_remains_a_dict(self):
+        from src.scorers.rules import CompiledExpected
+
+        compiled = CompiledExpected({"contains": "4"})
+
+        assert compiled == {"contains": "4"}
+        assert compiled.plan.rules[0].name == "contains"
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 import pytest
@@ -30,6 +31,7 @@ def make_run(
     suite_id: str = "suite-1",
     results: list[EvalResult] | None = None,
     timestamp: datetime | None = None,
+    environment: dict | None = None,
 ) -> EvalRun:
     return EvalRun(
         id=id,
@@ -37,6 +39,7 @@ def make_run(
         model="test-model",
         timestamp=timestamp or datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
         results=results if results is not None else [make_result()],
+        environment=environment,
     )
 
 
@@ -172,3 +175,722 @@ class TestLocalStoreEdgeCases:
 
         assert new_path.exists()
         assert store.get_run("run-1") is not None
+
+
+class TestRunStats:
+    def test_rolls_up_usage_cost_and_latency(self):
+        results = [make_result(id=f"r{i}", case_id=f"c{i}") for i in range(3)]
+        for i, result in enumerate(results):
+            result.latency_ms = 100.0 * (i + 1)
+            result.prompt_tokens = 10
+            result.completion_tokens = 5
+            result.cost_usd = 0.5
+        results[2].passed = False
+
+        stats = make_run(results=results).stats
+
+        assert stats.total == 3
+        assert stats.passed == 2
+        assert stats.prompt_tokens == 30
+        assert stats.completion_tokens == 15
+        assert stats.cost_usd == pytest.approx(1.5)
+        assert stats.mean_latency_ms == pytest.approx(200.0)
+        assert stats.p95_latency_ms == pytest.approx(300.0)
+        assert stats.mean_ttft_ms is None
+
+    def test_missing_metrics_yield_none(self):
+        stats = make_run().stats
+
+        assert stats.cost_usd is None
+        assert stats.mean_latency_ms is None
+        assert stats.p95_latency_ms is None
+
+    def test_persists_metrics(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        result = make_result()
+        result.latency_ms = 123.4
+        result.prompt_tokens = 7
+        result.completion_tokens = 3
+        result.judge_tokens = 50
+        result.cost_usd = 0.002
+        store.save_run(make_run(id="run-metrics", results=[result]))
+
+        retrieved = store.get_run("run-metrics").results[0]
+
+        assert retrieved.latency_ms == 123.4
+        assert retrieved.prompt_tokens == 7
+        assert retrieved.completion_tokens == 3
+        assert retrieved.judge_tokens == 50
+        assert retrieved.cost_usd == 0.002
+
+
+class TestLocalStoreCompactFormat:
+    def test_round_trips_compact_gzip_run(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact", compression="gzip")
+        result = make_result()
+        result.latency_ms = 12.5
+        run = make_run(id="run-compact", results=[result])
+
+        store.save_run(run)
+        retrieved = store.get_run("run-compact")
+
+        assert (tmp_path / "runs/suite-1/2024-01/run-compact.json.gz").exists()
+        assert retrieved == run
+
+    def test_round_trips_environment(self, tmp_path):
+        from src.store.local import LocalStore
+
+        environment = {"git_commit": "abc1234", "git_dirty": False, "packages": {"openai": "1.0"}}
+        for format in ("json", "compact"):
+            store = LocalStore(path=str(tmp_path / format), format=format)
+            store.save_run(make_run(id="run-env", environment=environment))
+
+            assert store.get_run("run-env").environment == environment
+            assert next(store.iter_runs()).environment == environment
+
+    def test_hoists_repeated_fields_out_of_results(self, tmp_path):
+        import json
+
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact")
+        store.save_run(make_run(id="run-compact"))
+
+        data = json.loads((tmp_path / "runs/suite-1/2024-01/run-compact.json").read_text())
+        record = data["results"][0]
+
+        assert data["format"] == 2
+        assert "suite_id" not in record
+        assert "model" not in record
+        assert "latency_ms" not in record
+        assert isinstance(record["ts"], int)
+
+    def test_keeps_result_fields_that_differ_from_run(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact")
+        result = make_result()
+        result.model = "other-model"
+        store.save_run(make_run(id="run-compact", results=[result]))
+
+        assert store.get_run("run-compact").results[0].model == "other-model"
+
+    def test_round_trips_msgpack_zstd_run(self, tmp_path):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+        from src.store.local import LocalStore
+
+        store = LocalStore(
+            path=str(tmp_path), format="compact", encoding="msgpack", compression="zstd"
+        )
+        run = make_run(id="run-mp")
+
+        store.save_run(run)
+
+        assert (tmp_path / "runs/suite-1/2024-01/run-mp.msgpack.zst").exists()
+        assert store.get_run("run-mp") == run
+
+    def test_lists_legacy_and_compact_runs_together(self, tmp_path):
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path)).save_run(make_run(id="legacy"))
+        compact = LocalStore(path=str(tmp_path), format="compact", compression="gzip")
+        compact.save_run(make_run(id="compact"))
+
+        assert {r.id for r in compact.list_runs()} == {"legacy", "compact"}
+
+    def test_migrate_rewrites_legacy_files(self, tmp_path):
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path), layout="flat").save_run(make_run(id="legacy"))
+        compact = LocalStore(path=str(tmp_path), format="compact", compression="gzip")
+
+        assert compact.migrate() == 1
+        assert not (tmp_path / "legacy.json").exists()
+        assert (tmp_path / "runs/suite-1/2024-01/legacy.json.gz").exists()
+        assert compact.get_run("legacy").id == "legacy"
+
+    def test_rejects_unknown_compression(self, tmp_path):
+        from src.store.local import LocalStore
+
+        with pytest.raises(ValueError):
+            LocalStore(path=str(tmp_path), compression="lz4")
+
+
+class TestLocalStoreDedupe:
+    def test_round_trips_bodies_through_blobs(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact", dedupe=True)
+        run = make_run(id="run-blobs")
+
+        store.save_run(run)
+        retrieved = store.get_run("run-blobs")
+
+        assert retrieved.results[0].prompt == "test prompt"
+        assert retrieved.results[0].response == "test response"
+        assert asdict(retrieved) == asdict(run)
+
+    def test_stores_identical_bodies_once(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact", dedupe=True)
+        for i in range(3):
+            store.save_run(make_run(id=f"run-{i}"))
+
+        blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+
+        # One prompt body and one response body shared by all three runs
+        assert len(blobs) == 2
+
+    def test_loads_bodies_only_on_access(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact", dedupe=True)
+        store.save_run(make_run(id="run-blobs"))
+
+        reader = LocalStore(path=str(tmp_path))
+        result = reader.get_run("run-blobs").results[0]
+
+        assert reader.blobs.get.cache_info().misses == 0
+        assert result.response == "test response"
+        assert reader.blobs.get.cache_info().misses == 1
+
+    def test_migrate_inlines_blob_bodies(self, tmp_path):
+        import json
+
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path), format="compact", dedupe=True).save_run(
+            make_run(id="run-blobs")
+        )
+        plain = LocalStore(path=str(tmp_path), format="compact")
+
+        plain.migrate()
+
+        data = json.loads((tmp_path / "runs/suite-1/2024-01/run-blobs.json").read_text())
+        assert data["results"][0]["prompt"] == "test prompt"
+
+    def test_requires_compact_format(self, tmp_path):
+        from src.store.local import LocalStore
+
+        with pytest.raises(ValueError):
+            LocalStore(path=str(tmp_path), dedupe=True)
+
+
+class TestLazyRuns:
+    def test_list_runs_does_not_materialize_results(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1", results=[make_result(), make_result(passed=False)]))
+
+        run = store.list_runs()[0]
+
+        assert run.materialized is False
+        assert run.stats.passed == 1
+        assert run.stats.total == 2
+        assert run.materialized is False
+
+    def test_results_materialize_on_access(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), format="compact")
+        store.save_run(make_run(id="run-1"))
+
+        run = store.list_runs()[0]
+
+        assert run.results[0].case_id == "case-1"
+        assert run.materialized is True
+
+    def test_iter_results_does_not_keep_results(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1"))
+
+        run = store.list_runs()[0]
+
+        assert [r.id for r in run.iter_results()] == ["result-1"]
+        assert run.materialized is False
+
+    def test_summarizes_legacy_files_without_stats(self, tmp_path):
+        import json
+
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path), layout="flat")
+        store.save_run(make_run(id="run-1", results=[make_result(passed=False)]))
+        (tmp_path / "index.jsonl").unlink()
+        path = tmp_path / "run-1.json"
+        data = json.loads(path.read_text())
+        del data["stats"]
+        path.write_text(json.dumps(data))
+
+        run = store.list_runs()[0]
+
+        assert run.stats.passed == 0
+        assert run.stats.total == 1
+
+    def test_results_use_slots(self):
+        result = make_result()
+
+        assert not hasattr(result, "__dict__")
+
+
+class TestLocalStoreConcurrency:
+    def test_save_leaves_no_temporary_files(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1"))
+
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_reserve_revision_is_unique_across_writers(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.store.local import LocalStore
+
+        def reserve(_):
+            return LocalStore(path=str(tmp_path)).reserve_revision()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            revisions = list(pool.map(reserve, range(40)))
+
+        assert sorted(revisions) == list(range(1, 41))
+
+    def test_reserved_revision_is_not_reused_by_save(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        reserved = store.reserve_revision()
+        run = make_run(id="run-1")
+
+        store.save_run(run)
+
+        assert run.revision == reserved + 1
+
+    def test_revision_counter_starts_from_existing_runs(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        run = make_run(id="run-1")
+        run.revision = 7
+        store.save_run(run)
+        (tmp_path / "REVISION").unlink()
+
+        assert store.reserve_revision() == 8
+
+    def test_list_runs_skips_unreadable_files(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1"))
+        (tmp_path / "partial.json").write_text('{"id": "partial", "suite')
+
+        runs = store.list_runs()
+
+        assert [r.id for r in runs] == ["run-1"]
+        assert store.get_run("partial") is None
+
+
+    def test_missing_codec_package_is_not_skipped(self, tmp_path, monkeypatch):
+        import sys
+
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        (tmp_path / "run-1.msgpack").write_bytes(b"\x80")
+        monkeypatch.setitem(sys.modules, "msgpack", None)  # Import fails
+
+        with pytest.raises(ImportError, match="uv sync --extra compact"):
+            store.get_run("run-1")
+
+
+class TestLocalStoreLayout:
+    def test_saves_runs_into_suite_and_month_shards(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1", suite_id="safety"))
+
+        assert (tmp_path / "runs/safety/2024-01/run-1.json").exists()
+        assert not (tmp_path / "run-1.json").exists()
+
+    def test_reads_legacy_flat_runs(self, tmp_path):
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path), layout="flat").save_run(make_run(id="old"))
+        (tmp_path / "index.jsonl").unlink()
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="new"))
+
+        assert {r.id for r in store.list_runs()} == {"old", "new"}
+        assert store.get_run("old").id == "old"
+
+    def test_resave_in_other_layout_removes_old_file(self, tmp_path):
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path), layout="flat").save_run(make_run(id="run-1"))
+        store = LocalStore(path=str(tmp_path))
+
+        assert store.migrate() == 1
+        assert not (tmp_path / "run-1.json").exists()
+        assert [r.id for r in store.list_runs()] == ["run-1"]
+
+    def test_list_runs_reads_index_not_run_files(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="run-1", results=[make_result(passed=False)]))
+        (tmp_path / "runs/suite-1/2024-01/run-1.json").write_text("not json")
+
+        runs = store.list_runs()
+
+        assert [r.id for r in runs] == ["run-1"]
+        assert runs[0].stats.total == 1
+
+    def test_sees_runs_saved_by_another_instance(self, tmp_path):
+        from src.store.local import LocalStore
+
+        reader = LocalStore(path=str(tmp_path))
+        assert reader.list_runs() == []
+
+        LocalStore(path=str(tmp_path)).save_run(make_run(id="run-1"))
+
+        assert [r.id for r in reader.list_runs()] == ["run-1"]
+
+
+class TestLocalStoreCompaction:
+    def test_archives_old_runs(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        store.save_run(make_run(id="old", results=[make_result(passed=False)]))
+        store.save_run(make_run(id="new", timestamp=datetime(2025, 6, 1, tzinfo=timezone.utc)))
+
+        archived = store.compact(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        assert archived == 1
+        assert (tmp_path / "archive/suite-1/2024-01.jsonl.gz").exists()
+        assert not (tmp_path / "runs/suite-1/2024-01").exists()
+        assert (tmp_path / "runs/suite-1/2025-06/new.json").exists()
+
+    def test_archived_runs_stay_listed_and_loadable(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        run = make_run(id="old", results=[make_result(passed=False)])
+        store.save_run(run)
+        store.compact(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        listed = store.list_runs()
+
+        assert [r.id for r in listed] == ["old"]
+        assert listed[0].stats.passed == 0
+        assert store.get_run("old") == run
+        assert listed[0].results == run.results
+
+    def test_appends_to_existing_segment(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        store.save_run(make_run(id="a"))
+        store.compact(cutoff)
+        store.save_run(make_run(id="b"))
+
+        assert store.compact(cutoff) == 1
+        assert store.get_run("a").id == "a"
+        assert store.get_run("b").id == "b"
+
+    def test_archives_legacy_flat_runs(self, tmp_path):
+        from src.store.local import LocalStore
+
+        LocalStore(path=str(tmp_path), layout="flat").save_run(make_run(id="old"))
+        (tmp_path / "index.jsonl").unlink()
+        store = LocalStore(path=str(tmp_path))
+
+        assert store.compact(datetime(2025, 1, 1, tzinfo=timezone.utc)) == 1
+        assert not (tmp_path / "old.json").exists()
+        assert [r.id for r in store.list_runs()] == ["old"]
+
+
+class TestGetStore:
+    def test_defaults_to_local_store_in_working_directory(self, monkeypatch):
+        from src.store.factory import get_store
+        from src.store.local import LocalStore
+
+        monkeypatch.delenv("EVAL_STORE_URL", raising=False)
+        monkeypatch.delenv("EVAL_RUNS_DIR", raising=False)
+
+        store = get_store()
+
+        assert isinstance(store, LocalStore)
+        assert str(store.path) == ".eval_runs"
+
+    def test_uses_eval_runs_dir(self, tmp_path, monkeypatch):
+        from src.store.factory import get_store
+
+        monkeypatch.delenv("EVAL_STORE_URL", raising=False)
+        monkeypatch.setenv("EVAL_RUNS_DIR", str(tmp_path))
+
+        assert get_store().path == tmp_path
+
+    def test_store_url_takes_precedence(self, tmp_path, monkeypatch):
+        from src.store.factory import get_store
+        from src.store.sqlite import SQLiteStore
+
+        monkeypatch.setenv("EVAL_RUNS_DIR", str(tmp_path / "dir"))
+        monkeypatch.setenv("EVAL_STORE_URL", f"sqlite:///{tmp_path}/runs.db")
+
+        store = get_store()
+
+        assert isinstance(store, SQLiteStore)
+        assert store.path == tmp_path / "runs.db"
+
+    def test_parses_file_url_options(self, tmp_path):
+        from src.store.factory import get_store
+
+        store = get_store(f"file://{tmp_path}?format=compact&compression=gzip&dedupe=true")
+
+        assert store.path == tmp_path
+        assert store.format == "compact"
+        assert store.compression == "gzip"
+        assert store.dedupe is True
+
+    def test_rejects_unknown_option(self, tmp_path):
+        from src.store.factory import get_store
+
+        with pytest.raises(ValueError):
+            get_store(f"file://{tmp_path}?colour=blue")
+
+    def test_rejects_unknown_scheme(self):
+        from src.store.factory import get_store
+
+        with pytest.raises(ValueError):
+            get_store("postgres://localhost/runs")
+
+
+class TestSQLiteStore:
+    def test_saves_and_retrieves_run(self, tmp_path):
+        from src.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(path=str(tmp_path / "runs.db"))
+        run = make_run(id="run-1")
+        store.save_run(run)
+
+        assert store.get_run("run-1") == run
+        assert store.get_run("missing") is None
+
+    def test_lists_runs_without_loading_results(self, tmp_path):
+        from src.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(path=str(tmp_path / "runs.db"))
+        store.save_run(make_run(id="old", results=[make_result(passed=False)]))
+        store.save_run(
+            make_run(id="new", suite_id="other", timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        )
+
+        runs = store.list_runs()
+
+        assert [r.id for r in runs] == ["new", "old"]
+        assert runs[1].stats.passed == 0
+        assert runs[1].materialized is False
+        assert [r.id for r in store.list_runs(suite_id="other")] == ["new"]
+        assert runs[1].results[0].passed is False
+
+    def test_resave_replaces_run(self, tmp_path):
+        from src.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(path=str(tmp_path / "runs.db"))
+        store.save_run(make_run(id="run-1"))
+        store.save_run(make_run(id="run-1", results=[make_result(passed=False)]))
+
+        assert len(store.list_runs()) == 1
+        assert store.get_run("run-1").results[0].passed is False
+
+    def test_revisions_are_unique_across_threads(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(path=str(tmp_path / "runs.db"), pool_size=2)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            revisions = list(pool.map(lambda _: store.reserve_revision(), range(40)))
+
+        assert sorted(revisions) == list(range(1, 41))
+        assert store.get_next_revision() == 41
+
+
+class TestBufferedStore:
+    def test_flush_writes_queued_runs(self, tmp_path):
+        from src.store.buffered import BufferedStore
+        from src.store.local import LocalStore
+
+        inner = LocalStore(path=str(tmp_path))
+        store = BufferedStore(inner)
+        for i in range(5):
+            store.save_run(make_run(id=f"run-{i}"))
+
+        store.flush()
+
+        assert {r.id for r in inner.list_runs()} == {f"run-{i}" for i in range(5)}
+        store.close()
+
+    def test_reads_include_queued_runs(self):
+        import threading
+
+        from src.store.buffered import BufferedStore
+
+        release = threading.Event()
+
+        class SlowStore:
+            def __init__(self):
+                self.runs = {}
+
+            def save_run(self, run):
+                release.wait()
+                self.runs[run.id] = run
+
+            def get_run(self, run_id):
+                return self.runs.get(run_id)
+
+            def iter_runs(self, suite_id=None):
+                return iter(self.runs.values())
+
+        store = BufferedStore(SlowStore())
+        store.save_run(make_run(id="run-1"))
+
+        assert store.get_run("run-1").id == "run-1"
+        assert [r.id for r in store.list_runs()] == ["run-1"]
+
+        release.set()
+        store.close()
+        assert store.store.get_run("run-1").id == "run-1"
+
+    def test_batches_writes(self):
+        import threading
+
+        from src.store.buffered import BufferedStore
+
+        release = threading.Event()
+        batches = []
+
+        class BatchStore:
+            def save_runs(self, runs):
+                release.wait()
+                batches.append([r.id for r in runs])
+
+        store = BufferedStore(BatchStore(), batch_size=10)
+        for i in range(4):
+            store.save_run(make_run(id=f"run-{i}"))
+        release.set()
+        store.close()
+
+        assert sum(batches, []) == [f"run-{i}" for i in range(4)]
+        assert len(batches) <= 2
+
+    def test_flush_raises_write_errors(self):
+        from src.store.buffered import BufferedStore
+
+        class BrokenStore:
+            def save_run(self, run):
+                raise OSError("disk full")
+
+        store = BufferedStore(BrokenStore())
+        store.save_run(make_run())
+
+        with pytest.raises(OSError):
+            store.flush()
+        store.close()
+
+    def test_save_after_close_fails(self, tmp_path):
+        from src.store.buffered import BufferedStore
+        from src.store.local import LocalStore
+
+        store = BufferedStore(LocalStore(path=str(tmp_path)))
+        store.close()
+
+        with pytest.raises(RuntimeError):
+            store.save_run(make_run())
+
+    def test_forwards_other_methods(self, tmp_path):
+        from src.store.buffered import BufferedStore
+        from src.store.local import LocalStore
+
+        store = BufferedStore(LocalStore(path=str(tmp_path)))
+
+        assert store.reserve_revision() == 1
+
+
+class TestLocalStoreSaveRuns:
+    def test_assigns_distinct_revisions_in_batch(self, tmp_path):
+        from src.store.local import LocalStore
+
+        store = LocalStore(path=str(tmp_path))
+        runs = [make_run(id="run-1"), make_run(id="run-2")]
+
+        store.save_runs(runs)
+
+        assert [r.revision for r in runs] == [1, 2]
+        assert store.get_next_revision() == 3
+        assert {r.id for r in store.list_runs()} == {"run-1", "run-2"}
+
+
+class TestAsyncStore:
+    def test_caches_reads_until_store_changes(self, tmp_path):
+        import asyncio
+
+        from src.store.aio import AsyncStore
+        from src.store.local import LocalStore
+
+        inner = LocalStore(path=str(tmp_path))
+        inner.save_run(make_run(id="run-1"))
+        store = AsyncStore(inner)
+
+        first = asyncio.run(store.get_run("run-1"))
+        assert asyncio.run(store.get_run("run-1")) is first
+
+        LocalStore(path=str(tmp_path)).save_run(make_run(id="run-1", results=[]))
+
+        assert asyncio.run(store.get_run("run-1")).results == []
+
+    def test_list_runs_invalidated_by_sqlite_writes(self, tmp_path):
+        import asyncio
+
+        from src.store.aio import AsyncStore
+        from src.store.sqlite import SQLiteStore
+
+        store = AsyncStore(SQLiteStore(path=str(tmp_path / "runs.db")))
+        assert asyncio.run(store.list_runs()) == []
+
+        SQLiteStore(path=str(tmp_path / "runs.db")).save_run(make_run(id="run-1"))
+
+        assert [r.id for r in asyncio.run(store.list_runs())] == ["run-1"]
+
+    def test_does_not_cache_stores_without_version(self):
+        import asyncio
+
+        from src.store.aio import AsyncStore
+
+        class DictStore:
+            def __init__(self):
+                self.runs = {}
+
+            def get_run(self, run_id):
+                return self.runs.get(run_id)
+
+        inner = DictStore()
+        store = AsyncStore(inner)
+        assert asyncio.run(store.get_run("run-1")) is None
+
+        inner.runs["run-1"] = make_run(id="run-1")
+
+        assert asyncio.run(store.get_run("run-1")).id == "run-1"
@@ -76,41 +76,35 @@ function App() {
     };
   }, [runs]);
 
-  // Fetch suite metadata (title, description, scorer) for each suite
+  // Fetch metadata (title, description, scorer) for all suites in one request
   const [suiteMetadata, setSuiteMetadata] = useState<
     Record<string, { id: string; title?: string; description?: string | null; scorer?: string }>
   >({});
 
   useEffect(() => {
-    const suiteIds = [...new Set(runs.map((r) => r.suite_id))];
-    if (suiteIds.length === 0) {
-      setSuiteMetadata({});
-      return;
-    }
     let cancelled = false;
-    Promise.all(
-      suiteIds.map((id) =>
-        fetch(`${API_BASE_URL}/api/suites/${id}`)
-          .then((res) =>
-            res.ok ? res.json() : { id, title: id, description: null }
-          )
-          .catch(() => ({ id, title: id, description: null }))
-      )
-    ).then((results) => {
-      if (cancelled) return;
-      const meta: Record<
-        string,
-        { id: string; title?: string; description?: string | null; scorer?: string }
-      > = {};
-      results.forEach((s) => {
-        meta[s.id] = s;
-      });
-      setSuiteMetadata(meta);
-    });
+    fetch(`${API_BASE_URL}/api/suites`)
+      .then((res) => (res.ok ? res.json() : []))
+      .catch(() => [])
+      .then(
+        (
+          results: { id: string; title?: string; description?: string | null; scorer?: string }[]
+        ) => {
+          if (cancelled) return;
+          const meta: Record<
+            string,
+            { id: string; title?: string; description?: string | null; scorer?: string }
+          > = {};
+          results.forEach((s) => {
+            meta[s.id] = s;
+          });
+          setSuiteMetadata(meta);
+        }
+      );
     return () => {
       cancelled = true;
     };
-  }, [runs]);
+  }, []);
 
   if (selectedRunId) {
     return (